@@ -4,11 +4,77 @@ About Tabs Module for DDSM115 Motor Control GUI
 Modular about tab implementation that loads documentation from external files
 """
 
+import os
+import sys
+import mmap
+import hashlib
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
+from tkinter import font as tkfont
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import doc_loader
 from doc_loader import DocumentationLoader
 
 
+# About sub-tabs: (title, doc_name, monospace, dark_theme)
+ABOUT_TAB_SPECS = (
+    ("🎨 Motor Art", "motor_art", True, False),
+    ("ℹ️ System Info", "system_info", False, False),
+    ("📖 Operation Guide", "operation_guide", False, False),
+    ("🔧 API Reference", "api_reference", False, True),
+    ("🔍 Troubleshooting", "troubleshooting", False, False),
+)
+
+# Font descriptions for the tabs; each becomes one named Tk font shared by all tabs
+_FONT_MONO = ("Courier", 8)
+_FONT_TEXT = ("Arial", 10)
+
+# Text widget style per (monospace, dark_theme); dark theme colors take precedence
+TabStyle = namedtuple("TabStyle", "bg fg font")
+_TAB_STYLES = {
+    (False, False): TabStyle('#2b2b2b', '#e0e0e0', _FONT_TEXT),
+    (True, False): TabStyle('#1a1a1a', '#00ff00', _FONT_MONO),
+    (False, True): TabStyle('#1e1e1e', '#d4d4d4', _FONT_TEXT),
+    (True, True): TabStyle('#1e1e1e', '#d4d4d4', _FONT_MONO),
+}
+
+# Shared ttk style for the wide About tab scrollbars
+WIDE_SCROLLBAR_STYLE = "Wide.Vertical.TScrollbar"
+
+# Coalescing window for reload_documentation calls
+RELOAD_DEBOUNCE_MS = 100
+
+# Documents larger than this are inserted in idle-time chunks of this size
+LARGE_DOC_CHUNK_SIZE = 64 * 1024
+
+# Pre-rendered documents are kept here between runs
+DOC_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "ddsm115" / "about"
+
+
+def _content_hash(content: str) -> bytes:
+    """Short digest used to detect changed document content"""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest()
+
+
+def _loader_digest() -> str:
+    """Digest of the doc_loader source, so changed markdown rules invalidate the cache"""
+    try:
+        return hashlib.blake2b(Path(doc_loader.__file__).read_bytes(), digest_size=8).hexdigest()
+    except OSError:
+        return "unknown"
+
+
+_LOADER_DIGEST = _loader_digest()
+
+# Identifies one version of a source document: (resolved path, size, mtime in ns)
+DocStamp = Tuple[str, int, int]
+
+
 class AboutTabs:
     """Manages the About tab and its sub-tabs using external documentation"""
     
@@ -23,27 +89,94 @@ class AboutTabs:
         self.gui = gui_instance
         self.doc_loader = DocumentationLoader()
         
-        # Create main about frame
+        # Loaded documents keyed by doc_name -> (source stamp, content)
+        self._doc_cache: Dict[str, Tuple[DocStamp, str]] = {}
+        # Built text widgets and a hash of the content they display, keyed by doc_name
+        self._tab_widgets: Dict[str, tk.Text] = {}
+        self._tab_hashes: Dict[str, bytes] = {}
+        # Pending chunked-insert callbacks keyed by text widget path
+        self._pending_inserts: Dict[str, str] = {}
+        # Memory-mapped pre-rendered documents: doc_name -> (source stamp, mmap)
+        self._doc_mmaps: Dict[str, Tuple[DocStamp, mmap.mmap]] = {}
+        # Per-document locks so prefetch workers and the UI thread never load the same doc at once
+        self._doc_locks: Dict[str, threading.Lock] = {}
+        
+        # Background reads of documents for tabs that are not visible yet
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        self._prefetch_futures = {}  # doc_name -> Future
+        
+        # Pending debounced reload callback
+        self._reload_after_id = None
+        
+        # Sub-tab contents are built lazily on first selection
+        self._builders = {}  # tab_id -> (doc_name, monospace, dark_theme)
+        self._built = set()
+        
+        # Create main about frame; everything inside it is built the first
+        # time the About tab is shown (see _build_about)
         self.about_frame = ttk.Frame(self.parent_notebook)
         self.parent_notebook.add(self.about_frame, text="📋 About")
+        self.about_notebook = None
+        self.parent_notebook.bind("<Destroy>", self._on_destroy, add="+")
+        self.parent_notebook.bind("<<NotebookTabChanged>>", self._on_parent_tab_changed, add="+")
+        self._on_parent_tab_changed()
+    
+    def _on_parent_tab_changed(self, event=None):
+        """Build the About tab the first time it is selected in the main notebook"""
+        if self.about_notebook is None and self.parent_notebook.select() == str(self.about_frame):
+            self._build_about()
+    
+    def _build_about(self):
+        """Map the documentation cache and create the sub-notebook"""
+        self._prebuild_cache()
+        
+        # Configure the shared wide scrollbar style once for all tabs
+        self._configure_scrollbar_style()
+        
+        # One named font per description, so Tk parses and measures each only once
+        self._fonts = {description: tkfont.Font(self.about_frame, font=description)
+                       for description in (_FONT_MONO, _FONT_TEXT)}
         
         # Create sub-notebook for about sections
         self.about_notebook = ttk.Notebook(self.about_frame)
         self.about_notebook.pack(fill="both", expand=True, padx=10, pady=10)
+        self.about_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
-        # Create all sub-tabs
+        # Register all sub-tabs, then build the one that is initially visible
         self.create_all_tabs()
+        self._build_selected_tab()
+        self._prefetch_hidden_docs()
     
     def create_all_tabs(self):
-        """Create all about sub-tabs"""
-        self.create_tab("🎨 Motor Art", "motor_art", monospace=True)
-        self.create_tab("ℹ️ System Info", "system_info")
-        self.create_tab("📖 Operation Guide", "operation_guide")
-        self.create_tab("🔧 API Reference", "api_reference", dark_theme=True)
-        self.create_tab("🔍 Troubleshooting", "troubleshooting")
+        """Register all about sub-tabs as empty placeholder frames"""
+        for tab_title, doc_name, monospace, dark_theme in ABOUT_TAB_SPECS:
+            self._register_tab(tab_title, doc_name, monospace=monospace, dark_theme=dark_theme)
     
-    def create_tab(self, tab_title: str, doc_name: str, monospace: bool = False, dark_theme: bool = False):
-        """Create a documentation tab
+    def _configure_scrollbar_style(self):
+        """Configure the wide, touch-friendly scrollbar style used by every tab"""
+        # Match the GUI's wide scrollbars: 7% of window width, minimum 50px
+        window_width = self.parent_notebook.winfo_toplevel().winfo_width()
+        if window_width <= 1:
+            window_width = 1071
+        scrollbar_width = max(50, int(window_width * 0.07))
+        
+        style = ttk.Style(self.parent_notebook)
+        style.configure(
+            WIDE_SCROLLBAR_STYLE,
+            width=scrollbar_width,
+            arrowsize=scrollbar_width,
+            borderwidth=2,
+            relief='raised',
+            background='#4a4a4a',
+            troughcolor='#2b2b2b',
+            bordercolor='#4a4a4a',
+            arrowcolor='#e0e0e0'
+        )
+        style.map(WIDE_SCROLLBAR_STYLE,
+                  background=[('pressed', '#5a5a5a'), ('active', '#6a6a6a')])
+    
+    def _register_tab(self, tab_title: str, doc_name: str, monospace: bool = False, dark_theme: bool = False):
+        """Add a placeholder frame for a tab without building its contents
         
         Args:
             tab_title: Display title for the tab
@@ -51,73 +184,301 @@ class AboutTabs:
             monospace: Whether to use monospace font
             dark_theme: Whether to use dark theme colors
         """
-        # Create tab frame
         tab_frame = ttk.Frame(self.about_notebook)
-        self.about_notebook.add(tab_frame, text=tab_title)
+        self.about_notebook.add(tab_frame, text=sys.intern(tab_title))
+        self._builders[str(tab_frame)] = (doc_name, monospace, dark_theme)
+    
+    def _on_tab_changed(self, event=None):
+        """Build the newly selected tab on first visit"""
+        self._build_selected_tab()
+    
+    def _build_selected_tab(self):
+        """Build the contents of the currently selected tab if not yet built"""
+        tab_id = self.about_notebook.select()
+        if not tab_id or tab_id in self._built or tab_id not in self._builders:
+            return
+        
+        doc_name, monospace, dark_theme = self._builders[tab_id]
+        
+        # Wait for a prefetch of this doc (no-op if already done); create_tab reports errors
+        future = self._prefetch_futures.pop(doc_name, None)
+        if future is not None:
+            try:
+                future.result()
+            except Exception:
+                pass
+        
+        self.create_tab(self.about_notebook.nametowidget(tab_id), doc_name,
+                        monospace=monospace, dark_theme=dark_theme)
+        self._built.add(tab_id)
+        self._release_doc(doc_name)
+    
+    def _prefetch_hidden_docs(self):
+        """Load documents of all not-yet-built tabs on the prefetch pool"""
+        built_docs = {self._builders[tab_id][0] for tab_id in self._built}
+        for doc_name, _, _ in self._builders.values():
+            if doc_name not in built_docs and doc_name not in self._prefetch_futures:
+                self._prefetch_futures[doc_name] = self._prefetch_pool.submit(self._get_doc, doc_name)
+    
+    def _doc_stamp(self, doc_name: str) -> Optional[DocStamp]:
+        """Get the resolved path, size and mtime of a document's source (None if unavailable)"""
+        path = self.doc_loader.path_for(doc_name)
+        if path is None:
+            return None
+        try:
+            path = path.resolve()
+            st = path.stat()
+        except OSError:
+            return None
+        return (str(path), st.st_size, st.st_mtime_ns)
+    
+    def _prebuild_cache(self):
+        """Map the pre-rendered cache file of every About document
+        
+        Cache files are regenerated when their source markdown changes. Any
+        failure just leaves the document to be read from source on demand.
+        """
+        for _, doc_name, _, _ in ABOUT_TAB_SPECS:
+            self._map_cached_doc(doc_name)
+    
+    def _map_cached_doc(self, doc_name: str):
+        """Refresh a document's cache file if stale and memory-map it
+        
+        Args:
+            doc_name: Document name to load from doc_loader
+        """
+        previous = self._doc_mmaps.pop(doc_name, None)
+        if previous is not None:
+            previous[1].close()
+        
+        stamp = self._doc_stamp(doc_name)
+        if stamp is None:
+            return  # Missing source - never cache the error text
+        
+        # One file per source path; its name also encodes the exact source
+        # version and loader rules it was rendered from, so a match is fresh
+        source_path, size, mtime_ns = stamp
+        path_key = hashlib.blake2b(source_path.encode("utf-8"), digest_size=8).hexdigest()
+        version_key = hashlib.blake2b(
+            f"{size}:{mtime_ns}:{_LOADER_DIGEST}".encode("utf-8"), digest_size=8).hexdigest()
+        cache_path = DOC_CACHE_DIR / f"{doc_name}-{path_key}-{version_key}.txt"
+        try:
+            if not cache_path.exists():
+                content = self.doc_loader.load_document(doc_name, use_cache=False)
+                DOC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_bytes(content.encode("utf-8"))
+                os.replace(tmp_path, cache_path)
+                # Drop renders of older versions of this source
+                for old_path in DOC_CACHE_DIR.glob(f"{doc_name}-{path_key}-*.txt"):
+                    if old_path != cache_path:
+                        old_path.unlink(missing_ok=True)
+            
+            with open(cache_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size:
+                    self._doc_mmaps[doc_name] = (
+                        stamp, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError) as e:
+            warnings.warn(f"Could not cache documentation '{doc_name}': {e}", RuntimeWarning)
+    
+    def _get_doc(self, doc_name: str) -> str:
+        """Get document content, re-reading from disk only if the file changed
+        
+        Safe to call from prefetch worker threads.
         
+        Args:
+            doc_name: Document name to load from doc_loader
+            
+        Returns:
+            Processed document content
+        """
+        with self._doc_locks.setdefault(doc_name, threading.Lock()):
+            return self._get_doc_locked(doc_name)
+    
+    def _get_doc_locked(self, doc_name: str) -> str:
+        """Body of _get_doc; caller must hold the document's lock"""
+        stamp = self._doc_stamp(doc_name)
+        cached = self._doc_cache.get(doc_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        mapped = self._doc_mmaps.get(doc_name)
+        if mapped is None or mapped[0] != stamp:
+            self._map_cached_doc(doc_name)
+            mapped = self._doc_mmaps.get(doc_name)
+        
+        if mapped is not None and mapped[0] == stamp:
+            content = mapped[1][:].decode("utf-8")
+        else:
+            content = self.doc_loader.load_document(doc_name, use_cache=False)
+        self._doc_cache[doc_name] = (stamp, content)
+        return content
+    
+    def _release_doc(self, doc_name: str):
+        """Drop the in-memory copy of a document once a text widget holds it
+        
+        The widget keeps its own copy and _tab_hashes detects changes, so a
+        later reload only needs to decode the memory-mapped cache again.
+        """
+        with self._doc_locks.setdefault(doc_name, threading.Lock()):
+            self._doc_cache.pop(doc_name, None)
+    
+    def _safe_load(self, doc_name: str) -> str:
+        """Get document content, or a displayable error message if loading fails"""
+        try:
+            return self._get_doc(doc_name)
+        except Exception as e:
+            return f"❌ Error loading documentation: {e}\n\nDocument: {doc_name}"
+    
+    def create_tab(self, tab_frame, doc_name: str, monospace: bool = False, dark_theme: bool = False):
+        """Build the contents of a documentation tab
+        
+        Args:
+            tab_frame: Placeholder frame registered for the tab
+            doc_name: Document name to load from doc_loader
+            monospace: Whether to use monospace font
+            dark_theme: Whether to use dark theme colors
+        """
         # Create scrollable frame
         scroll_frame = ttk.Frame(tab_frame)
         scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
-        # Create scrollbar
-        scrollbar = tk.Scrollbar(scroll_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Configure scrollbar style (reuse GUI instance method if available)
-        if hasattr(self.gui, 'configure_wide_scrollbar_direct'):
-            self.gui.configure_wide_scrollbar_direct(scrollbar)
-        
-        # Determine colors and font
-        if dark_theme:
-            bg_color = '#1e1e1e'
-            fg_color = '#d4d4d4'
-        elif monospace:
-            bg_color = '#1a1a1a'
-            fg_color = '#00ff00'
-        else:
-            bg_color = '#2b2b2b'
-            fg_color = '#e0e0e0'
+        # Text in column 0 takes all spare space; the scrollbar keeps its width
+        scroll_frame.grid_rowconfigure(0, weight=1)
+        scroll_frame.grid_columnconfigure(0, weight=1)
         
-        font_family = "Courier" if monospace else "Arial"
-        font_size = 8 if monospace else 10
+        # Create scrollbar (style configured once, shared by all tabs)
+        scrollbar = ttk.Scrollbar(scroll_frame, orient="vertical", style=WIDE_SCROLLBAR_STYLE)
+        scrollbar.grid(row=0, column=1, sticky="ns")
         
         # Create text widget
-        text_widget = scrolledtext.ScrolledText(
+        style = _TAB_STYLES[(monospace, dark_theme)]
+        text_widget = tk.Text(
             scroll_frame,
-            font=(font_family, font_size),
-            bg=bg_color,
-            fg=fg_color,
-            insertbackground=fg_color,
+            font=self._fonts[style.font],
+            bg=style.bg,
+            fg=style.fg,
+            insertbackground=style.fg,
             selectbackground='#2a2a2a',
             wrap=tk.WORD,
             padx=10,
-            pady=10
+            pady=10,
+            borderwidth=0,
+            highlightthickness=0,
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
-        text_widget.pack(side="left", fill="both", expand=True)
+        text_widget.grid(row=0, column=0, sticky="nsew")
+        
+        # Read-only: keep Text class bindings (wheel scrolling, selection) but
+        # skip the toplevel and "all" binding tables on every event
+        text_widget.bindtags((str(text_widget), "Text"))
         
         # Load and insert content
-        try:
-            content = self.doc_loader.load_document(doc_name)
-            text_widget.insert(tk.END, content)
-            text_widget.config(state=tk.DISABLED)  # Make read-only
-        except Exception as e:
-            error_msg = f"❌ Error loading documentation: {e}\n\nDocument: {doc_name}"
-            text_widget.insert(tk.END, error_msg)
-            text_widget.config(state=tk.DISABLED)
+        content = self._safe_load(doc_name)
+        self._set_content(text_widget, content)
+        
+        self._tab_widgets[doc_name] = text_widget
+        self._tab_hashes[doc_name] = _content_hash(content)
         
         # Connect scrollbar
         scrollbar.config(command=text_widget.yview)
         text_widget.config(yscrollcommand=scrollbar.set)
     
+    def _set_content(self, text_widget, content: str):
+        """Replace a read-only text widget's content with a single insert
+        
+        Large documents are split into chunks inserted from idle callbacks so
+        the mainloop stays responsive while they load.
+        
+        Args:
+            text_widget: Text widget to fill
+            content: Document content to display
+        """
+        pending = self._pending_inserts.pop(str(text_widget), None)
+        if pending is not None:
+            text_widget.after_cancel(pending)
+        
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete('1.0', tk.END)
+        if len(content) <= LARGE_DOC_CHUNK_SIZE:
+            text_widget.insert('1.0', content)
+            text_widget.config(state=tk.DISABLED)  # Make read-only
+            return
+        
+        text_widget.config(state=tk.DISABLED)
+        self._insert_chunk(text_widget, content, 0)
+    
+    def _insert_chunk(self, text_widget, content: str, offset: int):
+        """Append one chunk of a large document and schedule the next"""
+        self._pending_inserts.pop(str(text_widget), None)
+        if not text_widget.winfo_exists():
+            return
+        
+        end = offset + LARGE_DOC_CHUNK_SIZE
+        text_widget.config(state=tk.NORMAL)
+        text_widget.insert(tk.END, content[offset:end])
+        text_widget.config(state=tk.DISABLED)
+        
+        if end < len(content):
+            self._pending_inserts[str(text_widget)] = text_widget.after_idle(
+                self._insert_chunk, text_widget, content, end)
+    
     def reload_documentation(self):
-        """Reload all documentation from files (useful for development)"""
-        self.doc_loader.reload_cache()
+        """Reload changed documentation from files (useful for development)
         
-        # Recreate all tabs
-        for tab in self.about_notebook.tabs():
-            self.about_notebook.forget(tab)
+        Calls arriving within RELOAD_DEBOUNCE_MS of each other (e.g. bursts of
+        file-watcher events) are coalesced into a single reload.
+        """
+        if self._reload_after_id is not None:
+            self.about_frame.after_cancel(self._reload_after_id)
+        self._reload_after_id = self.about_frame.after(RELOAD_DEBOUNCE_MS, self._do_reload_and_clear)
+    
+    def _do_reload_and_clear(self):
+        """Run the pending debounced reload"""
+        self._reload_after_id = None
+        self._do_reload()
+    
+    def _do_reload(self):
+        """Reload changed documentation immediately
         
-        self.create_all_tabs()
+        Built tabs are updated in place, and only if their content changed;
+        unbuilt tabs pick up the new content when they are first selected.
+        """
+        for doc_name, text_widget in self._tab_widgets.items():
+            if not text_widget.winfo_exists():
+                continue
+            
+            content = self._safe_load(doc_name)
+            self._release_doc(doc_name)
+            content_hash = _content_hash(content)
+            if content_hash != self._tab_hashes.get(doc_name):
+                self._set_content(text_widget, content)
+                self._tab_hashes[doc_name] = content_hash
+    
+    def close(self):
+        """Stop pending work and release memory-mapped documentation cache files"""
+        if self._reload_after_id is not None:
+            try:
+                self.about_frame.after_cancel(self._reload_after_id)
+            except tk.TclError:
+                pass  # Frame already destroyed
+            self._reload_after_id = None
+        
+        for future in self._prefetch_futures.values():
+            future.cancel()
+        self._prefetch_futures.clear()
+        self._prefetch_pool.shutdown(wait=True)
+        
+        for _, doc_mmap in self._doc_mmaps.values():
+            doc_mmap.close()
+        self._doc_mmaps.clear()
+    
+    def _on_destroy(self, event):
+        """Close cache mappings when the parent notebook is destroyed"""
+        if event.widget is self.parent_notebook:
+            self.close()
 
 
 def create_about_tab(parent_notebook, gui_instance):
@@ -146,10 +507,9 @@ if __name__ == "__main__":
     notebook = ttk.Notebook(root)
     notebook.pack(fill="both", expand=True)
     
-    # Mock GUI instance with minimal required methods
+    # Scrollbars use the shared ttk style, so no GUI styling methods are needed
     class MockGUI:
-        def configure_wide_scrollbar_direct(self, scrollbar):
-            scrollbar.config(width=20)
+        pass
     
     mock_gui = MockGUI()
     
@@ -6,6 +6,9 @@ Direct Drive Servo Motor control via RS485
 This library provides low-level control of DDSM115 motors without any UI dependencies.
 """
 
+import os
+import re
+import sys
 import serial
 import struct
 import time
@@ -14,10 +17,41 @@ import signal
 import atexit
 import weakref
 from typing import Optional, Dict, Tuple, List, Callable
-from dataclasses import dataclass
 from enum import IntEnum
 from collections import deque
 
+# Optional numpy for the columnar feedback history, with deque fallback
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _build_crc8_table() -> bytes:
+    """Build the CRC-8/MAXIM-DOW lookup table (poly 0x8C, reflected)"""
+    table = bytearray(256)
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            if crc & 0x01:
+                crc = (crc >> 1) ^ 0x8C
+            else:
+                crc >>= 1
+        table[i] = crc
+    return bytes(table)
+
+
+# CRC-8/MAXIM-DOW result for every single-byte input, indexed by (crc ^ byte)
+_CRC8_MAXIM_TABLE = _build_crc8_table()
+
+
+# Common non-critical serial errors, skipped when suppress_comm_errors is set
+_NON_CRITICAL_COMM_ERRORS = re.compile(
+    r"device reports readiness|returned no data|device disconnected|access on port|timeout|resource busy",
+    re.IGNORECASE
+)
+
 
 # Global registry for emergency shutdown
 _active_motors = weakref.WeakSet()
@@ -58,22 +92,153 @@ class CommandType(IntEnum):
     POSITION_CALIBRATION = 0x94
 
 
-@dataclass
+# Motor IDs covered by the precomputed packet tables
+STATIC_PACKET_IDS = range(1, 11)
+
+
+def _build_packet(motor_id: int, command: int, data: bytes = b'') -> bytes:
+    """Build a 10-byte [ID, CMD, DATA[7], CRC] packet"""
+    packet = bytearray(10)
+    packet[0] = motor_id
+    packet[1] = command
+    data = bytes(data[:7])
+    packet[2:2 + len(data)] = data
+    crc = 0x00
+    for byte in packet[:9]:
+        crc = _CRC8_MAXIM_TABLE[crc ^ byte]
+    packet[9] = crc
+    return bytes(packet)
+
+
+def _build_mode_packet(motor_id: int, mode: int) -> bytes:
+    """Build a 10-byte mode switch packet: ID A0 00 00 00 00 00 00 00 MODE (no CRC)"""
+    return bytes((motor_id, CommandType.MODE_SWITCH, 0, 0, 0, 0, 0, 0, 0, mode))
+
+
+# Drive frame without CRC: ID, 0x64, 16-bit value in bytes 2-3, five zero bytes
+_DRIVE_STRUCT = struct.Struct('>BBh5x')            # velocity / current (signed)
+_POSITION_DRIVE_STRUCT = struct.Struct('>BBH5x')   # position (unsigned)
+
+# Single-byte bytes objects for appending a CRC without allocating
+_BYTE_VALUES = tuple(bytes((value,)) for value in range(256))
+
+
+def _finish_packet(body: bytes) -> bytes:
+    """Append the CRC to a 9-byte [ID, CMD, DATA[7]] packet body"""
+    crc = 0x00
+    for byte in body:
+        crc = _CRC8_MAXIM_TABLE[crc ^ byte]
+    return body + _BYTE_VALUES[crc]
+
+
+# Feedback frame: ID, mode, torque, velocity, byte 6, byte 7, error code, CRC
+_FEEDBACK_STRUCT = struct.Struct('>BBhhBBBB')
+
+# Position scale factors for the two feedback layouts
+_U8_POSITION_TO_DEGREES = 360.0 / 255.0
+_U15_POSITION_TO_DEGREES = 360.0 / 32767.0
+
+# Serial read timeout for feedback replies (seconds)
+FEEDBACK_TIMEOUT = 0.1
+
+# Pause between consecutive command frames to one motor (seconds). The bus
+# is half-duplex and the motor answers each command, so frames are not sent
+# back to back.
+INTER_FRAME_GAP = 0.01
+
+# Zero padding for send_packet data shorter than 7 bytes, indexed by data length
+_ZERO_PAD = tuple(bytes(7 - length) for length in range(8))
+
+# Commands whose packets carry no data, precomputed per motor ID
+_STATIC_COMMANDS = (
+    CommandType.EMERGENCY_STOP,
+    CommandType.FEEDBACK_REQUEST,
+    CommandType.BRAKE,
+    CommandType.RELEASE_BRAKE,
+    CommandType.ENABLE,
+    CommandType.DISABLE,
+    CommandType.POSITION_CALIBRATION,
+    CommandType.DRIVE_MOTOR,  # Zero drive value (stop in velocity mode)
+)
+
+# (motor_id, command) -> packet with zero data and CRC
+_STATIC_PACKETS: Dict[Tuple[int, int], bytes] = {
+    (motor_id, command): _build_packet(motor_id, command)
+    for motor_id in STATIC_PACKET_IDS for command in _STATIC_COMMANDS
+}
+
+# (motor_id, mode) -> 10-byte mode switch packet
+_MODE_PACKETS: Dict[Tuple[int, int], bytes] = {
+    (motor_id, mode): _build_mode_packet(motor_id, mode)
+    for motor_id in STATIC_PACKET_IDS for mode in MotorMode
+}
+
+# motor_id -> packets sent by the emergency stop sequence:
+# emergency stop, switch to velocity mode (CRC framed), zero velocity
+_EMERGENCY_STOP_PACKETS: Dict[int, Tuple[bytes, bytes, bytes]] = {
+    motor_id: (
+        _STATIC_PACKETS[(motor_id, CommandType.EMERGENCY_STOP)],
+        _build_packet(motor_id, CommandType.MODE_SWITCH, bytes(6) + bytes((MotorMode.VELOCITY,))),
+        _STATIC_PACKETS[(motor_id, CommandType.DRIVE_MOTOR)],
+    )
+    for motor_id in STATIC_PACKET_IDS
+}
+
+def _feedback_request_packet(motor_id: int) -> bytes:
+    """Get the feedback request packet for a motor, precomputed when available"""
+    packet = _STATIC_PACKETS.get((motor_id, CommandType.FEEDBACK_REQUEST))
+    if packet is None:
+        packet = _build_packet(motor_id, CommandType.FEEDBACK_REQUEST)
+    return packet
+
+
+if NUMPY_AVAILABLE:
+    # One row per feedback packet in the per-motor history ring
+    FEEDBACK_DTYPE = np.dtype([
+        ('position', 'f4'),
+        ('velocity', 'f4'),
+        ('torque', 'f4'),
+        ('temperature', 'u1'),
+        ('timestamp', 'i8'),
+    ])
+
+
 class MotorFeedback:
-    """Motor feedback data structure"""
-    position: float = 0.0  # degrees
-    velocity: float = 0.0  # RPM
-    torque: float = 0.0    # current in Amps
-    temperature: int = 0   # Celsius
-    raw_data: bytes = b''
-    timestamp: float = 0.0
+    """Motor feedback data structure
+    
+    A plain __slots__ class rather than a dataclass: one instance is created
+    per feedback packet, so it skips the per-instance __dict__.
+    """
+    __slots__ = ('position', 'velocity', 'torque', 'temperature', 'raw_data', 'timestamp')
+    
+    def __init__(self, position: float = 0.0, velocity: float = 0.0, torque: float = 0.0,
+                 temperature: int = 0, raw_data: bytes = b'', timestamp: int = 0):
+        self.position = position        # degrees
+        self.velocity = velocity        # RPM
+        self.torque = torque            # current in Amps
+        self.temperature = temperature  # Celsius
+        self.raw_data = raw_data
+        self.timestamp = timestamp      # time.monotonic_ns() when received
+    
+    def __repr__(self) -> str:
+        return (f"MotorFeedback(position={self.position!r}, velocity={self.velocity!r}, "
+                f"torque={self.torque!r}, temperature={self.temperature!r}, "
+                f"raw_data={self.raw_data!r}, timestamp={self.timestamp!r})")
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None  # Mutable, like the dataclass it replaces
 
 
 class DDSM115:
     """Core library for DDSM115 motor control"""
     
     def __init__(self, port: str = "/dev/ttyUSB0", baudrate: int = 115200, timeout: float = 0.2, 
-                 suppress_comm_errors: bool = True):
+                 suppress_comm_errors: bool = True, latency_timer_ms: Optional[int] = 1,
+                 verify_crc: bool = True):
         """
         Initialize DDSM115 motor controller
         
@@ -82,11 +247,18 @@ class DDSM115:
             baudrate: Communication baudrate (default 115200)
             timeout: Serial timeout in seconds
             suppress_comm_errors: If True, suppress non-critical communication errors
+            latency_timer_ms: USB-serial latency timer to request on connect (Linux only).
+                FTDI adapters default to 16ms, which delays every short reply.
+                None leaves the adapter setting unchanged.
+            verify_crc: If True, check the CRC of every reply. Replies are always
+                checked for length and motor ID first.
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.suppress_comm_errors = suppress_comm_errors
+        self.latency_timer_ms = latency_timer_ms
+        self.verify_crc = verify_crc
         self.serial_port: Optional[serial.Serial] = None
         self.is_connected = False
         
@@ -100,13 +272,20 @@ class DDSM115:
         
         # Memory management
         self._feedback_history_limit = 100  # Keep last 100 feedback entries per motor
-        self._feedback_history: Dict[int, deque] = {}
+        self._feedback_history: Dict[int, deque] = {}  # Used when numpy is unavailable
+        # motor_id -> [FEEDBACK_DTYPE rows, total entries written]
+        self._feedback_ring: Dict[int, list] = {}
         
         # Thread control
         self._monitoring_thread: Optional[threading.Thread] = None
         self._monitoring_active = False
         self._monitor_interval = 0.05  # 50ms default
-        self._monitored_motors: List[int] = []
+        self._monitored_motors: Tuple[int, ...] = ()
+        self._monitored_packets: Tuple[Tuple[int, bytes], ...] = ()  # (motor_id, feedback request)
+        
+        # Reusable transmit buffer for send_packet
+        self._tx_buf = bytearray(10)
+        self._tx_lock = threading.Lock()
         
         # Register for emergency shutdown
         _active_motors.add(self)
@@ -135,6 +314,8 @@ class DDSM115:
             self.serial_port.reset_input_buffer()
             self.serial_port.reset_output_buffer()
             
+            self._set_latency_timer()
+            
             self.is_connected = True
             return True
             
@@ -144,6 +325,29 @@ class DDSM115:
             self.is_connected = False
             return False
     
+    def _set_latency_timer(self) -> bool:
+        """
+        Lower the USB-serial adapter's latency timer via sysfs
+        
+        Without this, FTDI adapters hold short replies for up to 16ms before
+        passing them to the host. Writing the sysfs attribute may need extra
+        permissions; failure is harmless and leaves the default in place.
+        
+        Returns:
+            bool: True if the latency timer was set
+        """
+        if self.latency_timer_ms is None or not sys.platform.startswith("linux"):
+            return False
+        
+        device = os.path.basename(os.path.realpath(self.port))
+        timer_path = f"/sys/bus/usb-serial/devices/{device}/latency_timer"
+        try:
+            with open(timer_path, "w") as f:
+                f.write(str(int(self.latency_timer_ms)))
+            return True
+        except OSError:
+            return False
+    
     def disconnect(self):
         """Disconnect from the motor controller"""
         self._emergency_stop_all()
@@ -156,19 +360,16 @@ class DDSM115:
             
             # Try multiple methods to stop motors
             if self.is_connected and self.serial_port:
-                # Method 1: Stop all known motors
-                for motor_id in list(self.current_mode.keys()):
+                # Method 1: Stop all known motors first - these are the ones being driven
+                known_motors = list(self.current_mode.keys())
+                for motor_id in known_motors:
                     try:
                         self._safe_emergency_stop(motor_id)
                     except:
                         pass
                 
-                # Method 2: Broadcast stop to common motor IDs
-                for motor_id in range(1, 11):
-                    try:
-                        self._safe_emergency_stop(motor_id)
-                    except:
-                        pass
+                # Method 2: Broadcast stop to the remaining common motor IDs
+                self._safe_emergency_stop_all_ids(skip=known_motors)
                 
                 # Allow time for commands to process
                 time.sleep(0.1)
@@ -184,27 +385,32 @@ class DDSM115:
             self.is_connected = False
             self.serial_port = None
     
+    def _safe_emergency_stop_all_ids(self, skip=()):
+        """Send the prebuilt emergency stop sequence to IDs 1-10 not in skip
+        
+        Frames are separated by INTER_FRAME_GAP.
+        """
+        for motor_id in STATIC_PACKET_IDS:
+            if motor_id not in skip:
+                self._safe_emergency_stop(motor_id)
+    
     def _safe_emergency_stop(self, motor_id: int):
         """Send emergency stop with minimal error handling"""
         try:
-            # Send emergency stop
-            packet = [motor_id, CommandType.EMERGENCY_STOP] + [0]*7
-            crc = self.calculate_crc(packet)
-            packet.append(crc)
-            self.serial_port.write(bytes(packet))
-            
-            # Set to velocity mode with zero speed
-            time.sleep(0.01)
-            packet = [motor_id, CommandType.MODE_SWITCH, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02]
-            crc = self.calculate_crc(packet)
-            packet.append(crc)
-            self.serial_port.write(bytes(packet))
-            
-            time.sleep(0.01)
-            packet = [motor_id, CommandType.DRIVE_MOTOR, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-            crc = self.calculate_crc(packet)
-            packet.append(crc)
-            self.serial_port.write(bytes(packet))
+            packets = _EMERGENCY_STOP_PACKETS.get(motor_id)
+            if packets is None:
+                packets = (
+                    _build_packet(motor_id, CommandType.EMERGENCY_STOP),
+                    _build_packet(motor_id, CommandType.MODE_SWITCH, bytes(6) + bytes((MotorMode.VELOCITY,))),
+                    _build_packet(motor_id, CommandType.DRIVE_MOTOR),
+                )
+            # Emergency stop, then velocity mode with zero speed
+            estop_packet, mode_packet, zero_velocity_packet = packets
+            self.serial_port.write(estop_packet)
+            time.sleep(INTER_FRAME_GAP)
+            self.serial_port.write(mode_packet)
+            time.sleep(INTER_FRAME_GAP)
+            self.serial_port.write(zero_velocity_packet)
             
         except:
             pass
@@ -214,19 +420,14 @@ class DDSM115:
         CRC-8/MAXIM-DOW calculation (Dallas One-Wire)
         Polynomial: 0x8C (reverse of 0x31)
         """
-        crc = crc ^ data_byte
-        for _ in range(8):
-            if crc & 0x01:
-                crc = (crc >> 1) ^ 0x8C
-            else:
-                crc >>= 1
-        return crc
+        return _CRC8_MAXIM_TABLE[(crc ^ data_byte) & 0xFF]
     
     def calculate_crc(self, data: List[int]) -> int:
-        """Calculate CRC for data packet"""
+        """Calculate CRC for data packet (accepts a list of ints or bytes-like)"""
+        table = _CRC8_MAXIM_TABLE
         crc = 0x00
         for byte in data:
-            crc = self.crc8_update(crc, byte)
+            crc = table[crc ^ byte]
         return crc
     
     def send_packet(self, motor_id: int, command: int, data: List[int]) -> bool:
@@ -244,49 +445,65 @@ class DDSM115:
         if not self.is_connected or not self.serial_port:
             return False
         
-        # Build packet: [ID, CMD, DATA[7], CRC]
-        packet = [motor_id, command] + data[:7]
-        
-        # Pad with zeros if needed
-        while len(packet) < 9:
-            packet.append(0x00)
+        # Build packet in place: [ID, CMD, DATA[7], CRC]. The buffer is shared,
+        # so hold the lock until the write has copied it out.
+        with self._tx_lock:
+            packet = self._tx_buf
+            packet[0] = motor_id
+            packet[1] = command
+            
+            # Copy data and pad with zeros (slice lengths must match to keep size 10)
+            length = min(len(data), 7)
+            packet[2:2 + length] = data[:length]
+            packet[2 + length:9] = _ZERO_PAD[length]
+            
+            # Calculate and append CRC
+            packet[9] = self.calculate_crc(memoryview(packet)[:9])
+            
+            return self._write_packet(packet, command)
+    
+    def _send_static(self, motor_id: int, command: int) -> bool:
+        """Send a command that carries no data, using the precomputed packet when available"""
+        packet = _STATIC_PACKETS.get((motor_id, command))
+        if packet is None:
+            packet = _build_packet(motor_id, command)
+        return self._write_packet(packet, command)
+    
+    def _write_packet(self, packet: bytes, command: int) -> bool:
+        """
+        Write a complete packet to the serial port
         
-        # Calculate and append CRC
-        crc = self.calculate_crc(packet)
-        packet.append(crc)
+        Args:
+            packet: Complete 10-byte packet including CRC (bytes or bytearray)
+            command: Command byte (tracked for response parsing)
+            
+        Returns:
+            bool: True if sent successfully
+        """
+        if not self.is_connected or not self.serial_port:
+            return False
         
         # Track last command for response parsing
         self._last_command = command
         
         try:
-            self.serial_port.write(bytes(packet))
+            self.serial_port.write(packet)
             return True
         except Exception as e:
-            error_msg = str(e).lower()
-            # Skip logging for common non-critical errors (more comprehensive)
-            skip_patterns = [
-                "device reports readiness to read but returned no data",
-                "device disconnected",
-                "multiple access on port",
-                "returned no data",
-                "device reports readiness",
-                "access on port",
-                "timeout",
-                "resource busy"
-            ]
-            
-            # Only log if it's not a known non-critical error and error logging is enabled
-            if self.suppress_comm_errors:
-                # Suppress all communication errors when flag is set
-                if not any(pattern in error_msg for pattern in skip_patterns):
-                    if self.on_error:
-                        self.on_error(f"Send error: {str(e)}")
-            else:
-                # Log all errors when suppression is disabled
-                if self.on_error:
-                    self.on_error(f"Send error: {str(e)}")
+            self._report_comm_error("Send", e)
             return False
     
+    def _report_comm_error(self, action: str, error: Exception):
+        """Report a serial communication error through on_error
+        
+        When suppress_comm_errors is set, known non-critical errors are skipped.
+        """
+        if not self.on_error:
+            return
+        if self.suppress_comm_errors and _NON_CRITICAL_COMM_ERRORS.search(str(error)):
+            return
+        self.on_error(f"{action} error: {str(error)}")
+    
     def read_response(self, expected_id: int = None, timeout: float = None) -> Optional[bytes]:
         """
         Read response from motor
@@ -301,51 +518,27 @@ class DDSM115:
         if not self.is_connected or not self.serial_port:
             return None
         
-        if timeout:
-            old_timeout = self.serial_port.timeout
-            self.serial_port.timeout = timeout
-        
         try:
+            # Changing the timeout reconfigures the port, so only do it when needed
+            wanted_timeout = timeout or self.timeout
+            if self.serial_port.timeout != wanted_timeout:
+                self.serial_port.timeout = wanted_timeout
+            
             response = self.serial_port.read(10)
             
-            if len(response) == 10:
-                # Verify CRC
-                crc_calc = self.calculate_crc(list(response[:9]))
-                if crc_calc == response[9]:
-                    # Check motor ID if specified
-                    if expected_id is None or response[0] == expected_id:
-                        return response
-                    
-            return None
+            # Reject wrong length or motor ID before spending time on the CRC
+            if len(response) != 10:
+                return None
+            if expected_id is not None and response[0] != expected_id:
+                return None
+            if self.verify_crc and self.calculate_crc(response[:9]) != response[9]:
+                return None
+            
+            return response
             
         except Exception as e:
-            error_msg = str(e).lower()
-            # Skip logging for common non-critical errors (more comprehensive)
-            skip_patterns = [
-                "device reports readiness to read but returned no data",
-                "device disconnected", 
-                "multiple access on port",
-                "returned no data",
-                "device reports readiness",
-                "access on port",
-                "timeout",
-                "resource busy"
-            ]
-            
-            # Only log if it's not a known non-critical error and error logging is enabled
-            if self.suppress_comm_errors:
-                # Suppress all communication errors when flag is set
-                if not any(pattern in error_msg for pattern in skip_patterns):
-                    if self.on_error:
-                        self.on_error(f"Read error: {str(e)}")
-            else:
-                # Log all errors when suppression is disabled
-                if self.on_error:
-                    self.on_error(f"Read error: {str(e)}")
+            self._report_comm_error("Read", e)
             return None
-        finally:
-            if timeout:
-                self.serial_port.timeout = old_timeout
     
     def set_mode(self, motor_id: int, mode: MotorMode) -> bool:
         """
@@ -366,8 +559,9 @@ class DDSM115:
         
         # Use 10-byte format (no CRC) as per reference implementation
         # Format: ID A0 00 00 00 00 00 00 00 MODE_VALUE
-        import struct
-        packet_data = struct.pack(">BBBBBBBBBB", motor_id, CommandType.MODE_SWITCH, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, int(mode))
+        packet_data = _MODE_PACKETS.get((motor_id, mode))
+        if packet_data is None:
+            packet_data = _build_mode_packet(motor_id, mode)
         
         try:
             self.serial_port.write(packet_data)
@@ -389,21 +583,13 @@ class DDSM115:
         Returns:
             bool: True if successful
         """
-        # Ensure velocity mode
-        if motor_id not in self.current_mode or self.current_mode[motor_id] != MotorMode.VELOCITY:
-            if not self.set_mode(motor_id, MotorMode.VELOCITY):
-                return False
-            time.sleep(0.01)
-        
         # Clamp RPM
         rpm = max(-143, min(143, rpm))
         rpm_int = int(rpm)
         
         # Pack as signed 16-bit in bytes 2-3
-        data = list(struct.pack('>h', rpm_int))
-        data.extend([0x00, 0x00, 0x00, 0x00, 0x00])
-        
-        return self.send_packet(motor_id, CommandType.DRIVE_MOTOR, data)
+        packet = _finish_packet(_DRIVE_STRUCT.pack(motor_id, CommandType.DRIVE_MOTOR, rpm_int))
+        return self._send_drive(motor_id, MotorMode.VELOCITY, packet)
     
     def set_current(self, motor_id: int, current: float, auto_switch_mode: bool = True) -> bool:
         """
@@ -417,22 +603,17 @@ class DDSM115:
         Returns:
             bool: True if successful
         """
-        # Ensure current mode (only if auto_switch_mode is True)
-        if auto_switch_mode:
-            if motor_id not in self.current_mode or self.current_mode[motor_id] != MotorMode.CURRENT:
-                if not self.set_mode(motor_id, MotorMode.CURRENT):
-                    return False
-                time.sleep(0.01)
-        
         # Clamp current and convert to 0.01A units
         current = max(-8, min(8, current))
         current_int = int(current * 100)  # Convert to 0.01A units
         
         # Pack as signed 16-bit in bytes 2-3
-        data = list(struct.pack('>h', current_int))
-        data.extend([0x00, 0x00, 0x00, 0x00, 0x00])
+        packet = _finish_packet(_DRIVE_STRUCT.pack(motor_id, CommandType.DRIVE_MOTOR, current_int))
         
-        return self.send_packet(motor_id, CommandType.DRIVE_MOTOR, data)
+        # Ensure current mode (only if auto_switch_mode is True)
+        if auto_switch_mode:
+            return self._send_drive(motor_id, MotorMode.CURRENT, packet)
+        return self._write_packet(packet, CommandType.DRIVE_MOTOR)
     
     def set_position(self, motor_id: int, degrees: float) -> bool:
         """
@@ -445,54 +626,77 @@ class DDSM115:
         Returns:
             bool: True if successful
         """
-        # Ensure position mode
-        if motor_id not in self.current_mode or self.current_mode[motor_id] != MotorMode.POSITION:
-            if not self.set_mode(motor_id, MotorMode.POSITION):
-                return False
-            time.sleep(0.01)
-        
         # Clamp and scale (0-32767 for 0-360 degrees)
         degrees = max(0, min(360, degrees))
         position = int((degrees / 360.0) * 32767)
         
         # Pack as unsigned 16-bit in bytes 2-3
-        data = list(struct.pack('>H', position))
-        data.extend([0x00, 0x00, 0x00, 0x00, 0x00])
+        packet = _finish_packet(_POSITION_DRIVE_STRUCT.pack(motor_id, CommandType.DRIVE_MOTOR, position))
+        return self._send_drive(motor_id, MotorMode.POSITION, packet)
+    
+    def _send_drive(self, motor_id: int, mode: MotorMode, drive_packet: bytes) -> bool:
+        """
+        Send a complete drive packet, switching the motor to the given mode first if needed
+        
+        A needed mode switch is followed by INTER_FRAME_GAP before the drive packet.
+        """
+        # Fast path: the cached mode already matches
+        if self.current_mode.get(motor_id) == mode:
+            return self._write_packet(drive_packet, CommandType.DRIVE_MOTOR)
         
-        return self.send_packet(motor_id, CommandType.DRIVE_MOTOR, data)
+        mode_packet = _MODE_PACKETS.get((motor_id, mode))
+        if mode_packet is None:
+            mode_packet = _build_mode_packet(motor_id, mode)
+        
+        if not self._write_packet(mode_packet, CommandType.MODE_SWITCH):
+            return False
+        self.current_mode[motor_id] = mode
+        time.sleep(INTER_FRAME_GAP)
+        return self._write_packet(drive_packet, CommandType.DRIVE_MOTOR)
     
     def emergency_stop(self, motor_id: int) -> bool:
-        """Send emergency stop command"""
-        success = self.send_packet(motor_id, CommandType.EMERGENCY_STOP, [0]*7)
+        """Send emergency stop command, then switch to velocity mode with zero speed"""
+        estop_packet = _STATIC_PACKETS.get((motor_id, CommandType.EMERGENCY_STOP))
+        if estop_packet is None:
+            estop_packet = _build_packet(motor_id, CommandType.EMERGENCY_STOP)
+        mode_packet = _MODE_PACKETS.get((motor_id, MotorMode.VELOCITY))
+        if mode_packet is None:
+            mode_packet = _build_mode_packet(motor_id, MotorMode.VELOCITY)
+        zero_velocity_packet = _STATIC_PACKETS.get((motor_id, CommandType.DRIVE_MOTOR))
+        if zero_velocity_packet is None:
+            zero_velocity_packet = _build_packet(motor_id, CommandType.DRIVE_MOTOR)
+        
+        success = self._write_packet(estop_packet, CommandType.EMERGENCY_STOP)
         
-        # Switch to velocity mode with zero speed
+        # Switch to velocity mode with zero speed, one separated frame at a time
         if success:
-            time.sleep(0.01)
-            self.set_mode(motor_id, MotorMode.VELOCITY)
-            time.sleep(0.01)
-            self.set_velocity(motor_id, 0)
+            time.sleep(INTER_FRAME_GAP)
+            if self._write_packet(mode_packet, CommandType.MODE_SWITCH):
+                self.current_mode[motor_id] = MotorMode.VELOCITY
+            time.sleep(INTER_FRAME_GAP)
+            self._write_packet(zero_velocity_packet, CommandType.DRIVE_MOTOR)
             
         return success
     
     def brake(self, motor_id: int) -> bool:
         """Apply motor brake"""
-        return self.send_packet(motor_id, CommandType.BRAKE, [0]*7)
+        return self._send_static(motor_id, CommandType.BRAKE)
     
     def release_brake(self, motor_id: int) -> bool:
         """Release motor brake"""
-        return self.send_packet(motor_id, CommandType.RELEASE_BRAKE, [0]*7)
+        return self._send_static(motor_id, CommandType.RELEASE_BRAKE)
     
     def enable(self, motor_id: int) -> bool:
         """Enable motor"""
-        return self.send_packet(motor_id, CommandType.ENABLE, [0]*7)
+        return self._send_static(motor_id, CommandType.ENABLE)
     
     def disable(self, motor_id: int) -> bool:
         """Disable motor"""
-        return self.send_packet(motor_id, CommandType.DISABLE, [0]*7)
+        return self._send_static(motor_id, CommandType.DISABLE)
     
     def calibrate_position(self, motor_id: int) -> bool:
         """Calibrate motor position"""
-        return self.send_packet(motor_id, CommandType.POSITION_CALIBRATION, [0]*7)
+        return self._send_static(motor_id, CommandType.POSITION_CALIBRATION)
     
     def request_feedback(self, motor_id: int) -> Optional[MotorFeedback]:
         """
@@ -504,26 +708,73 @@ class DDSM115:
         Returns:
             MotorFeedback or None
         """
-        if self.send_packet(motor_id, CommandType.FEEDBACK_REQUEST, [0]*7):
-            response = self.read_response(motor_id, timeout=0.1)
+        return self._request_feedback_fast(motor_id)
+    
+    def _request_feedback_fast(self, motor_id: int, packet: bytes = None) -> Optional[MotorFeedback]:
+        """
+        Fused feedback request: write the prebuilt request and read the reply
+        with a single connection check and a single error handler
+        
+        Args:
+            motor_id: Motor ID
+            packet: Prebuilt feedback request for motor_id (looked up if None)
             
-            if response and len(response) == 10:
-                feedback = self.parse_feedback(response)
-                self.last_feedback[motor_id] = feedback
-                
-                # Store in bounded history for memory management
-                if motor_id not in self._feedback_history:
-                    self._feedback_history[motor_id] = deque(maxlen=self._feedback_history_limit)
-                self._feedback_history[motor_id].append(feedback)
-                
-                if self.on_feedback:
-                    self.on_feedback(motor_id, feedback)
-                    
-                return feedback
-                
-        return None
+        Returns:
+            MotorFeedback or None
+        """
+        serial_port = self.serial_port
+        if not self.is_connected or not serial_port:
+            return None
+        
+        if packet is None:
+            packet = _feedback_request_packet(motor_id)
+        
+        # Track last command for response parsing
+        self._last_command = CommandType.FEEDBACK_REQUEST
+        
+        try:
+            # Changing the timeout reconfigures the port, so only do it when needed
+            if serial_port.timeout != FEEDBACK_TIMEOUT:
+                serial_port.timeout = FEEDBACK_TIMEOUT
+            serial_port.write(packet)
+            response = serial_port.read(10)
+        except Exception as e:
+            self._report_comm_error("Feedback", e)
+            return None
+        
+        # Verify length, motor ID and CRC
+        if len(response) != 10 or response[0] != motor_id:
+            return None
+        if self.verify_crc and self.calculate_crc(response[:9]) != response[9]:
+            return None
+        
+        feedback = self.parse_feedback(response)
+        self._record_feedback(motor_id, feedback)
+        return feedback
+    
+    def _record_feedback(self, motor_id: int, feedback: MotorFeedback):
+        """Store feedback as the latest and in history, then notify on_feedback"""
+        self.last_feedback[motor_id] = feedback
+        
+        # Store in bounded history for memory management
+        if NUMPY_AVAILABLE:
+            ring = self._feedback_ring.get(motor_id)
+            if ring is None:
+                ring = self._feedback_ring[motor_id] = [
+                    np.zeros(self._feedback_history_limit, dtype=FEEDBACK_DTYPE), 0]
+            rows, count = ring
+            rows[count % len(rows)] = (feedback.position, feedback.velocity, feedback.torque,
+                                       feedback.temperature, feedback.timestamp)
+            ring[1] = count + 1
+        else:
+            if motor_id not in self._feedback_history:
+                self._feedback_history[motor_id] = deque(maxlen=self._feedback_history_limit)
+            self._feedback_history[motor_id].append(feedback)
+        
+        if self.on_feedback:
+            self.on_feedback(motor_id, feedback)
     
-    def parse_feedback(self, data: bytes) -> MotorFeedback:
+    def parse_feedback(self, data: bytes, include_raw: bool = True) -> MotorFeedback:
         """Parse feedback data from motor response
         
         Two different response formats:
@@ -545,38 +796,39 @@ class DDSM115:
            DATA[7]: U8 position value (0-255 = 0-360°)
            DATA[8]: Error code
            DATA[9]: CRC8
+        
+        Args:
+            data: Response frame
+            include_raw: Keep the frame in raw_data (MotorCommandQueue reads
+                the mode byte from it, so this defaults to True)
         """
-        feedback = MotorFeedback()
-        feedback.raw_data = data
-        feedback.timestamp = time.time()
-        
-        if len(data) >= 10:
-            mode = data[1]
-            
-            # Torque/Current: bytes 2-3 (signed, in 0.01A units)
-            torque_raw = struct.unpack('>h', data[2:4])[0]
-            feedback.torque = torque_raw / 100.0  # Convert to Amps
-            
-            # Velocity: bytes 4-5 (signed, direct RPM)
-            velocity_raw = struct.unpack('>h', data[4:6])[0]
-            feedback.velocity = velocity_raw
-            
-            # Check if this is a 0x74 response by looking at the command we sent
-            # In 0x74 response format:
-            if hasattr(self, '_last_command') and self._last_command == CommandType.FEEDBACK_REQUEST:
-                # Temperature: byte 6 (direct °C value)
-                feedback.temperature = data[6]
-                # Position: byte 7 (0-255 = 0-360°)
-                position_raw = data[7]
-                feedback.position = (position_raw / 255.0) * 360.0
-            else:
-                # Standard response format
-                # Position: bytes 6-7 (unsigned, 0-32767 = 0-360°)
-                position_raw = struct.unpack('>H', data[6:8])[0]
-                feedback.position = (position_raw / 32767.0) * 360.0
-                feedback.temperature = 0
-            
-        return feedback
+        timestamp = time.monotonic_ns()
+        raw_data = data if include_raw else b''
+        
+        if len(data) < 10:
+            return MotorFeedback(raw_data=raw_data, timestamp=timestamp)
+        
+        # ID, mode, torque (0.01A, signed), velocity (RPM, signed), bytes 6-7, error, CRC
+        _, _, torque_raw, velocity_raw, byte6, byte7, _, _ = _FEEDBACK_STRUCT.unpack_from(data)
+        
+        # Check if this is a 0x74 response by looking at the command we sent
+        if getattr(self, '_last_command', None) == CommandType.FEEDBACK_REQUEST:
+            # 0x74 format - temperature: byte 6 (°C), position: byte 7 (0-255 = 0-360°)
+            temperature = byte6
+            position = byte7 * _U8_POSITION_TO_DEGREES
+        else:
+            # Standard format - position: bytes 6-7 (unsigned, 0-32767 = 0-360°)
+            temperature = 0
+            position = ((byte6 << 8) | byte7) * _U15_POSITION_TO_DEGREES
+        
+        return MotorFeedback(
+            position=position,
+            velocity=velocity_raw,
+            torque=torque_raw / 100.0,  # Convert to Amps
+            temperature=temperature,
+            raw_data=raw_data,
+            timestamp=timestamp
+        )
     
     def scan_motors(self, start_id: int = 1, end_id: int = 10) -> List[int]:
         """
@@ -599,6 +851,79 @@ class DDSM115:
                 
         return found_motors
     
+    def scan_motors_fast(self, start_id: int = 1, end_id: int = 10,
+                         frame_gap: float = 0.002, timeout: float = FEEDBACK_TIMEOUT) -> List[int]:
+        """
+        Scan for motors by pipelining all feedback requests, then reading the replies
+        
+        Replies are matched to motors by their ID byte. If the reply stream
+        cannot be framed (e.g. a reply collided with a request on the bus),
+        this falls back to the sequential scan_motors().
+        
+        Args:
+            start_id: Starting motor ID
+            end_id: Ending motor ID
+            frame_gap: Pause between request frames in seconds
+            timeout: How long to wait for replies after the last request
+            
+        Returns:
+            List of found motor IDs
+        """
+        serial_port = self.serial_port
+        if not self.is_connected or not serial_port:
+            return []
+        
+        wanted = set(range(start_id, end_id + 1))
+        replies: Dict[int, bytes] = {}
+        framing_error = False
+        
+        # Track last command for response parsing
+        self._last_command = CommandType.FEEDBACK_REQUEST
+        
+        try:
+            serial_port.reset_input_buffer()
+            if serial_port.timeout != timeout:
+                serial_port.timeout = timeout
+            
+            for motor_id in sorted(wanted):
+                packet = _STATIC_PACKETS.get((motor_id, CommandType.FEEDBACK_REQUEST))
+                if packet is None:
+                    packet = _build_packet(motor_id, CommandType.FEEDBACK_REQUEST)
+                serial_port.write(packet)
+                time.sleep(frame_gap)
+            
+            buffer = bytearray()
+            deadline = time.monotonic() + timeout
+            while len(replies) < len(wanted) and time.monotonic() < deadline:
+                buffer += serial_port.read(max(1, serial_port.in_waiting))
+                while len(buffer) >= 10:
+                    frame = bytes(buffer[:10])
+                    del buffer[:10]
+                    if frame[0] not in wanted or self.calculate_crc(frame[:9]) != frame[9]:
+                        framing_error = True
+                        break
+                    replies[frame[0]] = frame
+                if framing_error:
+                    break
+        except Exception as e:
+            self._report_comm_error("Scan", e)
+            return []
+        
+        if framing_error:
+            # Let the remaining replies arrive and drop them, so the sequential
+            # scan does not read them in place of its own replies
+            try:
+                time.sleep(timeout)
+                serial_port.reset_input_buffer()
+            except Exception as e:
+                self._report_comm_error("Scan", e)
+                return []
+            return self.scan_motors(start_id, end_id)
+        
+        for motor_id in sorted(replies):
+            self._record_feedback(motor_id, self.parse_feedback(replies[motor_id]))
+        return sorted(replies)
+    
     def set_motor_id(self, old_id: int, new_id: int) -> bool:
         """
         Change motor ID (requires sending command 5 times)
@@ -646,7 +971,11 @@ class DDSM115:
         """
         self.stop_monitoring()
         
-        self._monitored_motors = motor_ids
+        # Frozen for the monitor loop, with each motor's request packet prebuilt
+        self._monitored_motors = tuple(motor_ids)
+        self._monitored_packets = tuple(
+            (motor_id, _feedback_request_packet(motor_id)) for motor_id in self._monitored_motors
+        )
         self._monitor_interval = interval
         self._monitoring_active = True
         
@@ -663,35 +992,76 @@ class DDSM115:
     
     def _monitor_loop(self):
         """Background monitoring loop"""
+        # Bind hot-path lookups once; the motor list and interval are fixed per run
+        request_feedback = self._request_feedback_fast
+        sleep = time.sleep
+        monotonic_ns = time.monotonic_ns
+        monitored_packets = self._monitored_packets
+        interval_ns = int(self._monitor_interval * 1_000_000_000)
+        
+        # Cycles start on a fixed deadline grid, so polling time doesn't add drift
+        deadline = monotonic_ns()
         while self._monitoring_active and self.is_connected:
-            for motor_id in self._monitored_motors:
+            for motor_id, packet in monitored_packets:
                 if not self._monitoring_active:
                     break
                     
-                self.request_feedback(motor_id)
-                time.sleep(0.01)  # Small delay between motors
+                # The read returns as soon as the reply frame is in, so the next
+                # motor can be polled straight away without a fixed delay
+                request_feedback(motor_id, packet)
                 
             # Wait for next cycle
-            remaining = self._monitor_interval - (0.01 * len(self._monitored_motors))
-            if remaining > 0:
-                time.sleep(remaining)
+            deadline += interval_ns
+            now = monotonic_ns()
+            if deadline > now:
+                sleep((deadline - now) / 1_000_000_000)
+            else:
+                deadline = now  # Overran the interval - don't burst to catch up
     
     def get_last_feedback(self, motor_id: int) -> Optional[MotorFeedback]:
         """Get last received feedback for a motor"""
         return self.last_feedback.get(motor_id)
     
     def get_feedback_history(self, motor_id: int) -> List[MotorFeedback]:
-        """Get feedback history for a motor (bounded list)"""
+        """Get feedback history for a motor (bounded list, oldest first)
+        
+        With numpy the entries are rebuilt from the history ring, so raw_data
+        is empty and values carry float32 precision.
+        """
+        if NUMPY_AVAILABLE:
+            rows = self.get_feedback_array(motor_id)
+            if rows is None:
+                return []
+            return [MotorFeedback(position, velocity, torque, temperature, b'', timestamp)
+                    for position, velocity, torque, temperature, timestamp in rows.tolist()]
         if motor_id in self._feedback_history:
             return list(self._feedback_history[motor_id])
         return []
     
+    def get_feedback_array(self, motor_id: int) -> Optional['np.ndarray']:
+        """Get feedback history as a FEEDBACK_DTYPE array, oldest first
+        
+        Returns a copy, or None if numpy is unavailable or no feedback was recorded.
+        """
+        ring = self._feedback_ring.get(motor_id)
+        if ring is None:
+            return None
+        rows, count = ring
+        size = len(rows)
+        if count <= size:
+            return rows[:count].copy()
+        start = count % size
+        return np.concatenate((rows[start:], rows[:start]))
+    
     def clear_feedback_history(self, motor_id: int = None):
         """Clear feedback history for specific motor or all motors"""
         if motor_id is None:
             self._feedback_history.clear()
-        elif motor_id in self._feedback_history:
-            self._feedback_history[motor_id].clear()
+            self._feedback_ring.clear()
+        else:
+            if motor_id in self._feedback_history:
+                self._feedback_history[motor_id].clear()
+            self._feedback_ring.pop(motor_id, None)
     
     def is_motor_connected(self, motor_id: int) -> bool:
         """Check if a specific motor is responding"""
@@ -13,18 +13,13 @@ import serial.tools.list_ports
 import threading
 import time
 import datetime
-import struct
 from collections import deque
 import signal
 import sys
 import math
-import re
-import html
 
 # Optional matplotlib imports with fallback
 try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
     from matplotlib.figure import Figure
     import numpy as np
@@ -37,6 +32,177 @@ from ddsm210 import DDSM210
 from motor_command_queue import MotorCommandQueue
 from about_tabs import create_about_tab
 
+
+# Minimum time between graph redraws; redraws are only scheduled on changes
+GRAPH_REDRAW_MS = 100
+
+# Connection log: lines kept in the widget, and how often queued lines are flushed
+LOG_MAX_LINES = 100
+LOG_FLUSH_MS = 100
+
+# Text graph fallback (no matplotlib): feedback lines kept in the widget
+TEXT_GRAPH_MAX_LINES = 200
+
+# Slider drags are throttled to one motor command per window (20 Hz)
+SLIDER_SEND_MS = 50
+
+# Window drags move the window at most once per frame (~60 Hz)
+DRAG_FLUSH_MS = 16
+
+# Set by the SIGINT handler; polled on the Tk thread, which runs the shutdown
+_sigint_flag = threading.Event()
+SIGINT_POLL_MS = 200
+
+# Custom title bar buttons: (canvas tag, glyph, fill, hover fill, glyph color)
+WINDOW_CONTROL_BUTTONS = (
+    ('min', "−", '#4a4a4a', '#5a5a5a', '#e0e0e0'),
+    ('max', "□", '#4a4a4a', '#5a5a5a', '#e0e0e0'),
+    ('close', "✕", '#cc4444', '#dd5555', '#ffffff'),
+)
+
+# Dark theme colors shared by the ttk styles
+PALETTE = {
+    'bg': '#2b2b2b',
+    'fg': '#e0e0e0',
+    'field': '#3c3c3c',
+    'button': '#4a4a4a',
+    'accent': '#4a9eff',
+    'border': '#5a5a5a',
+    'disabled': '#666666',
+}
+
+# Slider handle colors: white handle with hover, on a colored trough
+_SLIDER_HANDLE_MAP = {
+    'background': [('active', '#ffffff'), ('pressed', '#e0e0e0')],
+    'slidercolor': [('', '#ffffff'), ('active', '#f0f0f0')],
+}
+
+# (style name, configure options, map options or None), applied in order
+TTK_STYLES = (
+    # Dark colors with subtle selection
+    ('.', dict(background=PALETTE['bg'], foreground=PALETTE['fg'],
+               fieldbackground=PALETTE['field'],
+               selectbackground='#4a4a4a',  # Slightly lighter gray instead of bright blue
+               selectforeground='#ffffff', borderwidth=0, relief='flat'), None),
+    
+    # Buttons
+    ('Touch.TButton', dict(padding=(20, 15), font=('Arial', 12),
+                           background=PALETTE['button'], foreground=PALETTE['fg'],
+                           focuscolor=PALETTE['accent'], borderwidth=1, relief='raised'),
+     dict(background=[('active', '#5a5a5a'), ('pressed', '#3a3a3a')])),
+    ('Action.TButton', dict(padding=(25, 20), font=('Arial', 14, 'bold'),
+                            background='#4a7c4a', foreground='#ffffff',
+                            borderwidth=2, relief='raised'),
+     dict(background=[('active', '#5a8c5a'), ('pressed', '#3a6c3a')])),
+    ('Control.TButton', dict(padding=(15, 10), font=('Arial', 11),
+                             background=PALETTE['button'], foreground=PALETTE['fg'],
+                             borderwidth=1, relief='raised'), None),
+    
+    # Checkbuttons
+    ('Touch.TCheckbutton', dict(font=('Arial', 12, 'bold'), background=PALETTE['bg'],
+                                foreground=PALETTE['fg'], focuscolor=PALETTE['accent'],
+                                indicatorsize=20, indicatorcolor=PALETTE['field'],
+                                indicatorrelief='flat'),
+     dict(background=[('active', PALETTE['field'])],
+          foreground=[('active', PALETTE['accent'])],
+          indicatorcolor=[('selected', PALETTE['accent']), ('active', '#5ab3ff')])),
+    
+    # Labels
+    ('Touch.TLabel', dict(font=('Arial', 13), background=PALETTE['bg'],
+                          foreground=PALETTE['fg']), None),
+    ('TouchBold.TLabel', dict(font=('Arial', 13, 'bold'), background=PALETTE['bg'],
+                              foreground=PALETTE['fg']), None),
+    
+    # Combobox and spinbox
+    ('Touch.TCombobox', dict(arrowsize=25, fieldbackground=PALETTE['field'],
+                             background=PALETTE['button'], foreground=PALETTE['fg'],
+                             font=('Arial', 12), borderwidth=1, relief='solid'), None),
+    ('Touch.TSpinbox', dict(arrowsize=25, fieldbackground=PALETTE['field'],
+                            background=PALETTE['button'], foreground=PALETTE['fg'],
+                            font=('Arial', 12), borderwidth=1, relief='solid'), None),
+    
+    # Notebook
+    ('TNotebook.Tab', dict(padding=(25, 15), font=('Arial', 14, 'bold'),
+                           background=PALETTE['field'], foreground=PALETTE['fg'],
+                           borderwidth=1, relief='raised'),
+     dict(background=[('selected', PALETTE['accent'])])),
+    ('TNotebook', dict(background=PALETTE['bg'], borderwidth=0, relief='flat'), None),
+    
+    # Frames
+    ('TFrame', dict(background=PALETTE['bg'], borderwidth=0, relief='flat'), None),
+    ('TLabelFrame', dict(background=PALETTE['bg'], foreground=PALETTE['fg'],
+                         borderwidth=0, relief='flat'), None),
+    ('TLabelFrame.Label', dict(background=PALETTE['bg'], foreground=PALETTE['accent']), None),
+    ('Disabled.TLabelframe', dict(background=PALETTE['bg'], foreground=PALETTE['disabled'],
+                                  borderwidth=0, relief='flat'), None),
+    ('Disabled.TLabelframe.Label', dict(background=PALETTE['bg'],
+                                        foreground=PALETTE['disabled']), None),
+    ('TopBar.TFrame', dict(background='#1a1a1a'), None),
+    
+    # Entry fields
+    ('TEntry', dict(fieldbackground=PALETTE['field'], foreground=PALETTE['fg'],
+                    borderwidth=0, relief='flat'), None),
+    
+    # Touch-friendly scale (slider)
+    ('Touch.Horizontal.TScale', dict(sliderthickness=56, background=PALETTE['bg'],
+                                     troughcolor=PALETTE['field'], borderwidth=0,
+                                     lightcolor=PALETTE['border'],
+                                     darkcolor=PALETTE['border']), None),
+    
+    # Mode sliders: colored trough (track) + contrasting handle
+    ('VelocitySlider.Horizontal.TScale', dict(sliderthickness=28, background=PALETTE['bg'],
+                                              troughcolor='#3a5f9f',  # Blue
+                                              borderwidth=1, relief='solid',
+                                              bordercolor='#4a6fb0'), _SLIDER_HANDLE_MAP),
+    ('PositionSlider.Horizontal.TScale', dict(sliderthickness=28, background=PALETTE['bg'],
+                                              troughcolor='#9f3a3a',  # Red
+                                              borderwidth=1, relief='solid',
+                                              bordercolor='#b04a4a'), _SLIDER_HANDLE_MAP),
+    ('CurrentSlider.Horizontal.TScale', dict(sliderthickness=28, background=PALETTE['bg'],
+                                             troughcolor='#3a9f6b',  # Green
+                                             borderwidth=1, relief='solid',
+                                             bordercolor='#4ab07c'), _SLIDER_HANDLE_MAP),
+)
+
+
+class PlotBuffer:
+    """Fixed-size ring buffer of graph samples (requires numpy)
+    
+    Time, velocity, torque and position are rows of one float32 array, so a
+    sample is a single column store and redraws get contiguous arrays.
+    """
+    
+    def __init__(self, size):
+        self.size = size
+        self._buf = np.empty((4, size), dtype=np.float32)
+        self._head = 0
+        self._len = 0
+    
+    def __len__(self):
+        return self._len
+    
+    def push(self, t, velocity, torque, position):
+        """Store one sample, overwriting the oldest once full"""
+        head = self._head
+        self._buf[:, head] = (t, velocity, torque, position)
+        self._head = (head + 1) % self.size
+        if self._len < self.size:
+            self._len += 1
+    
+    def clear(self):
+        """Drop all samples"""
+        self._head = 0
+        self._len = 0
+    
+    def arrays(self):
+        """Return a (4, n) copy ordered oldest first: time, velocity, torque, position"""
+        buf = self._buf
+        if self._len < self.size:
+            return buf[:, :self._len].copy()
+        head = self._head
+        return np.concatenate((buf[:, head:], buf[:, :head]), axis=1)
+
+
 class SimpleDDSM115GUI:
     def __init__(self, root):
         self.root = root
@@ -59,21 +225,31 @@ class SimpleDDSM115GUI:
         self.monitoring = False
         
         # Metrics tracking
-        self.last_rx_time = 0
-        self.last_tx_time = 0
+        self.last_rx_time_ns = 0  # time.monotonic_ns() of the last RX/TX, 0 = never
+        self.last_tx_time_ns = 0
         self.rx_count = 0
         self.tx_count = 0
         self.rx_rate = 0
         self.tx_rate = 0
-        self.last_rate_calc = time.time()
+        self.last_rate_calc_ns = time.monotonic_ns()
         self.status_update_active = True
         
+        # Latest feedback waiting for the GUI; one main-thread update is queued at a time
+        self._pending_feedback = None
+        self._feedback_update_scheduled = False
+        
+        # Set while a graph redraw is queued, so repeated requests share one redraw
+        self._graph_redraw_scheduled = False
+        # Set once setup_matplotlib_graph has created the figure, axes and lines
+        self._graph_ready = False
+        
+        # Log lines waiting to be inserted into the connection log in one batch
+        self._log_queue = deque()
+        self._log_flush_scheduled = False
+        
         # Graph data
         self.max_plot_points = 200
-        self.plot_time = deque(maxlen=self.max_plot_points)
-        self.plot_velocity = deque(maxlen=self.max_plot_points)
-        self.plot_torque = deque(maxlen=self.max_plot_points)
-        self.plot_position = deque(maxlen=self.max_plot_points)
+        self.plot_data = PlotBuffer(self.max_plot_points) if MATPLOTLIB_AVAILABLE else None
         
         # Initialize variables
         self.initialize_variables()
@@ -84,11 +260,11 @@ class SimpleDDSM115GUI:
         # Track all scheduled callbacks for proper cleanup
         self._scheduled_callbacks = set()
         
-        # Track when sliders are being dragged vs released
-        self._slider_dragging = {
-            'velocity': False,
-            'position': False,
-            'current': False
+        # Pending throttled slider sends, one after id per control
+        self._pending_send = {
+            'velocity': None,
+            'position': None,
+            'current': None
         }
         
         # Create widgets
@@ -97,8 +273,10 @@ class SimpleDDSM115GUI:
         # Setup cleanup
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # Setup signal handler for Ctrl+C
+        # Setup signal handler for Ctrl+C; the poll also gives Python a chance
+        # to run the handler while Tk's mainloop is blocked in C
         signal.signal(signal.SIGINT, self._handle_sigint)
+        self.schedule_callback(SIGINT_POLL_MS, self._poll_sigint)
         
         # Auto-populate serial ports
         self.refresh_ports()
@@ -108,10 +286,17 @@ class SimpleDDSM115GUI:
         if self._shutdown_in_progress:
             return None
         
+        scheduled = self._scheduled_callbacks
+        
+        def run():
+            # Fired callbacks stop being tracked, so the set only holds pending ids
+            scheduled.discard(callback_id)
+            callback()
+        
         try:
             # Schedule the callback first to get the ID
-            callback_id = self.root.after(delay_ms, callback)
-            self._scheduled_callbacks.add(callback_id)
+            callback_id = self.root.after(delay_ms, run)
+            scheduled.add(callback_id)
             return callback_id
         except Exception:
             return None
@@ -129,12 +314,14 @@ class SimpleDDSM115GUI:
     
     def cancel_all_callbacks(self):
         """Cancel all tracked callbacks"""
-        for callback_id in list(self._scheduled_callbacks):
+        # Pop instead of iterating a copy; safe if callbacks are added meanwhile
+        scheduled = self._scheduled_callbacks
+        while scheduled:
+            callback_id = scheduled.pop()
             try:
                 self.root.after_cancel(callback_id)
             except Exception:
                 pass
-        self._scheduled_callbacks.clear()
 
     def setup_touch_styles(self):
         """Configure touch-friendly styles for all widgets"""
@@ -143,186 +330,13 @@ class SimpleDDSM115GUI:
         # Set dark theme
         style.theme_use('clam')  # Better theme for desktop
         
-        # Configure dark colors with subtle selection
-        style.configure('.', 
-                       background='#2b2b2b',
-                       foreground='#e0e0e0',
-                       fieldbackground='#3c3c3c',
-                       selectbackground='#4a4a4a',  # Slightly lighter gray instead of bright blue
-                       selectforeground='#ffffff',
-                       borderwidth=0,
-                       relief='flat')
-        
-        # Configure larger buttons with dark theme
-        style.configure('Touch.TButton', 
-                       padding=(20, 15),  # Increased padding
-                       font=('Arial', 12),  # Larger font
-                       background='#4a4a4a',
-                       foreground='#e0e0e0',
-                       focuscolor='#4a9eff',
-                       borderwidth=1,
-                       relief='raised')
-        style.map('Touch.TButton',
-                 background=[('active', '#5a5a5a'), ('pressed', '#3a3a3a')])
-        
-        style.configure('Action.TButton', 
-                       padding=(25, 20),  # Larger padding
-                       font=('Arial', 14, 'bold'),  # Larger font
-                       background='#4a7c4a',
-                       foreground='#ffffff',
-                       borderwidth=2,
-                       relief='raised')
-        style.map('Action.TButton',
-                 background=[('active', '#5a8c5a'), ('pressed', '#3a6c3a')])
-        
-        # Configure control buttons
-        style.configure('Control.TButton', 
-                       padding=(15, 10),  # Increased padding
-                       font=('Arial', 11),  # Larger font
-                       background='#4a4a4a',
-                       foreground='#e0e0e0',
-                       borderwidth=1,
-                       relief='raised')
-        
-        # Configure larger checkbuttons with dark theme
-        style.configure('Touch.TCheckbutton', 
-                       font=('Arial', 12, 'bold'),
-                       background='#2b2b2b',
-                       foreground='#e0e0e0',
-                       focuscolor='#4a9eff',
-                       indicatorsize=20,
-                       indicatorcolor='#3c3c3c',
-                       indicatorrelief='flat')
-        style.map('Touch.TCheckbutton',
-                 background=[('active', '#3c3c3c')],
-                 foreground=[('active', '#4a9eff')],
-                 indicatorcolor=[('selected', '#4a9eff'), ('active', '#5ab3ff')])
-        
-        # Configure larger labels with dark theme
-        style.configure('Touch.TLabel', 
-                       font=('Arial', 13),  # Larger font
-                       background='#2b2b2b',
-                       foreground='#e0e0e0')
-        style.configure('TouchBold.TLabel', 
-                       font=('Arial', 13, 'bold'),  # Larger font
-                       background='#2b2b2b',
-                       foreground='#e0e0e0')
-        
-        # Configure larger combobox with dark theme
-        style.configure('Touch.TCombobox', 
-                       arrowsize=25,  # Larger arrow
-                       fieldbackground='#3c3c3c',
-                       background='#4a4a4a',
-                       foreground='#e0e0e0',
-                       font=('Arial', 12),  # Larger font
-                       borderwidth=1,
-                       relief='solid')
-        
-        # Configure larger spinbox with dark theme
-        style.configure('Touch.TSpinbox', 
-                       arrowsize=25,  # Larger arrow
-                       fieldbackground='#3c3c3c',
-                       background='#4a4a4a',
-                       foreground='#e0e0e0',
-                       font=('Arial', 12),  # Larger font
-                       borderwidth=1,
-                       relief='solid')
-        
-        # Configure notebook tabs with dark theme
-        style.configure('TNotebook.Tab', 
-                       padding=(25, 15),  # Larger padding
-                       font=('Arial', 14, 'bold'),  # Larger font
-                       background='#3c3c3c',
-                       foreground='#e0e0e0',
-                       borderwidth=1,
-                       relief='raised')
-        style.map('TNotebook.Tab',
-                 background=[('selected', '#4a9eff')])
-        
-        # Configure notebook background
-        style.configure('TNotebook', 
-                       background='#2b2b2b',
-                       borderwidth=0,
-                       relief='flat')
-        
-        # Configure frames with dark theme
-        style.configure('TFrame', 
-                       background='#2b2b2b',
-                       borderwidth=0,
-                       relief='flat')
-        style.configure('TLabelFrame', 
-                       background='#2b2b2b',
-                       foreground='#e0e0e0',
-                       borderwidth=0,
-                       relief='flat')
-        style.configure('TLabelFrame.Label',
-                       background='#2b2b2b',
-                       foreground='#4a9eff')
-        
-        # Disabled labelframe style
-        style.configure('Disabled.TLabelframe', 
-                       background='#2b2b2b',
-                       foreground='#666666',
-                       borderwidth=0,
-                       relief='flat')
-        style.configure('Disabled.TLabelframe.Label',
-                       background='#2b2b2b',
-                       foreground='#666666')
-        
-        # Configure entry fields with dark theme
-        style.configure('TEntry',
-                       fieldbackground='#3c3c3c',
-                       foreground='#e0e0e0',
-                       borderwidth=0,
-                       relief='flat')
-        
-        # Configure touch-friendly scale (slider) with consistent dark theme
-        style.configure('Touch.Horizontal.TScale', 
-                       sliderthickness=56,  # Double height for better visibility
-                       background='#2b2b2b',
-                       troughcolor='#3c3c3c',
-                       borderwidth=0,
-                       lightcolor='#5a5a5a',
-                       darkcolor='#5a5a5a')
-        
-        # Slider styles with high contrast handles
-        # The key is: colored trough (track) + contrasting handle
-        
-        # Velocity slider: Blue trough with bright white handle
-        style.configure('VelocitySlider.Horizontal.TScale', 
-                       sliderthickness=28,
-                       background='#2b2b2b',  # Match parent background
-                       troughcolor='#3a5f9f',  # Blue trough/track
-                       borderwidth=1,
-                       relief='solid',
-                       bordercolor='#4a6fb0')
-        style.map('VelocitySlider.Horizontal.TScale',
-                 background=[('active', '#ffffff'), ('pressed', '#e0e0e0')],  # White handle with hover
-                 slidercolor=[('', '#ffffff'), ('active', '#f0f0f0')])  
-        
-        # Position slider: Red trough with bright white handle
-        style.configure('PositionSlider.Horizontal.TScale', 
-                       sliderthickness=28,
-                       background='#2b2b2b',  # Match parent background
-                       troughcolor='#9f3a3a',  # Red trough/track
-                       borderwidth=1,
-                       relief='solid',
-                       bordercolor='#b04a4a')
-        style.map('PositionSlider.Horizontal.TScale',
-                 background=[('active', '#ffffff'), ('pressed', '#e0e0e0')],  # White handle with hover
-                 slidercolor=[('', '#ffffff'), ('active', '#f0f0f0')])  
-        
-        # Current slider: Green trough with bright white handle
-        style.configure('CurrentSlider.Horizontal.TScale', 
-                       sliderthickness=28,
-                       background='#2b2b2b',  # Match parent background
-                       troughcolor='#3a9f6b',  # Green trough/track
-                       borderwidth=1,
-                       relief='solid',
-                       bordercolor='#4ab07c')
-        style.map('CurrentSlider.Horizontal.TScale',
-                 background=[('active', '#ffffff'), ('pressed', '#e0e0e0')],  # White handle with hover
-                 slidercolor=[('', '#ffffff'), ('active', '#f0f0f0')])
+        # Apply the style table: one configure (and optional map) per style
+        configure = style.configure
+        style_map = style.map
+        for name, options, state_map in TTK_STYLES:
+            configure(name, **options)
+            if state_map:
+                style_map(name, **state_map)
         
         # Make the trough thicker for all slider types
         for slider_type in ['Velocity.Horizontal.TScale', 'Position.Horizontal.TScale', 'Current.Horizontal.TScale']:
@@ -349,6 +363,11 @@ class SimpleDDSM115GUI:
         # Flag to prevent position commands when updating from feedback
         self._updating_position_from_feedback = False
         
+        # Last text/colors applied to each status label, to skip no-op configures
+        self._last_status = {}
+        # Raw Tcl call for status label updates, skipping the configure() wrapper
+        self._tk_call = self.root.tk.call
+        
         # Register validation commands
         self.register_validation_commands()
         
@@ -477,6 +496,57 @@ class SimpleDDSM115GUI:
         ttk.Button(log_controls, text="Clear Log", command=self.clear_log,
                   style='Touch.TButton').pack(side="left", padx=5)
 
+    def _build_slider(self, parent, kind, title, label, color, low, high, variable, validator):
+        """Build a labelled slider with a colored background and a matching entry
+        
+        Returns:
+            tuple: (frame, scale, entry)
+        """
+        frame = ttk.LabelFrame(parent, text=title, padding=5)
+        frame.pack(fill="x", pady=3)
+        
+        ttk.Label(frame, text=label, style='Touch.TLabel').pack()
+        
+        # Slider and entry on same row with colored background
+        slider_row = ttk.Frame(frame)
+        slider_row.pack(fill="x", pady=5)
+        
+        background = tk.Frame(slider_row, bg=color, height=35)
+        background.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        
+        # Stream drag updates to the motor, throttled to SLIDER_SEND_MS. The
+        # command only fires for user moves, not for writes to the variable.
+        scale = ttk.Scale(background, from_=low, to=high, variable=variable,
+                          orient="horizontal", length=180,
+                          style=f'{kind.capitalize()}Slider.Horizontal.TScale',
+                          command=lambda _value: self._throttled_send(kind))
+        scale.pack(fill="x", padx=5, pady=5)
+        
+        # Typed values are sent once the edit is committed, never per keystroke.
+        # Leaving the entry only counts as a commit if its text was changed.
+        entry = ttk.Entry(slider_row, textvariable=variable, width=6,
+                          font=('Arial', 12), validate='key',
+                          validatecommand=validator)
+        entry.pack(side="right", padx=(5, 0))
+        entry.committed_text = entry.get()
+        
+        def commit(event):
+            entry.committed_text = entry.get()
+            self._send_slider_now(kind)
+        
+        def focus_in(event):
+            entry.committed_text = entry.get()
+        
+        def focus_out(event):
+            if entry.get() != entry.committed_text:
+                commit(event)
+        
+        entry.bind('<Return>', commit)
+        entry.bind('<FocusIn>', focus_in)
+        entry.bind('<FocusOut>', focus_out)
+        
+        return frame, scale, entry
+    
     def create_control_tab(self):
         """Create control tab with motor controls and live graph"""
         self.control_frame = ttk.Frame(self.notebook)
@@ -504,96 +574,21 @@ class SimpleDDSM115GUI:
                  style='Touch.TLabel', font=('Arial', 9), 
                  foreground='#888888').pack(side="left", padx=5)
         
-        # Velocity Control
-        vel_frame = ttk.LabelFrame(left_panel, text="Velocity Control", padding=5)
-        vel_frame.pack(fill="x", pady=3)
-        
-        ttk.Label(vel_frame, text="Speed (RPM):", style='Touch.TLabel').pack()
-        
-        # Slider and entry on same row with colored background
-        slider_row = ttk.Frame(vel_frame)
-        slider_row.pack(fill="x", pady=5)
-        
-        # Create colored background for velocity slider (blue)
-        vel_bg = tk.Frame(slider_row, bg="#3a5f9f", height=35)
-        vel_bg.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        
-        self.vel_scale = ttk.Scale(vel_bg, from_=-143, to=143, variable=self.velocity_var, 
-                            orient="horizontal", length=180,
-                            style='VelocitySlider.Horizontal.TScale')
-        # Velocity is integer - no decimal rounding needed
-        self.vel_scale.pack(fill="x", padx=5, pady=5)
-        
-        # Bind mouse events for drag start/end detection
-        self.vel_scale.bind('<Button-1>', lambda e: self._on_slider_press('velocity'))
-        self.vel_scale.bind('<ButtonRelease-1>', lambda e: self._on_velocity_release())
-        
-        vel_entry = ttk.Entry(slider_row, textvariable=self.velocity_var, width=6,
-                            font=('Arial', 12), validate='key',
-                            validatecommand=self.vcmd_int)
-        vel_entry.pack(side="right", padx=(5, 0))
-        
-        # No buttons needed - slider handles everything
-        
-        # Position Control
-        self.pos_frame = ttk.LabelFrame(left_panel, text="Position Control", padding=5)
-        self.pos_frame.pack(fill="x", pady=3)
-        
-        ttk.Label(self.pos_frame, text="Position (°):", style='Touch.TLabel').pack()
-        
-        # Slider and entry on same row with colored background
-        pos_slider_row = ttk.Frame(self.pos_frame)
-        pos_slider_row.pack(fill="x", pady=5)
-        
-        # Create colored background for position slider (red)
-        pos_bg = tk.Frame(pos_slider_row, bg="#9f3a3a", height=35)
-        pos_bg.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        
-        pos_scale = ttk.Scale(pos_bg, from_=0, to=360, variable=self.position_var, 
-                            orient="horizontal", length=180,
-                            style='PositionSlider.Horizontal.TScale')
-        pos_scale.pack(fill="x", padx=5, pady=5)
-        
-        # Bind mouse events for drag start/end detection
-        pos_scale.bind('<Button-1>', lambda e: self._on_slider_press('position'))
-        pos_scale.bind('<ButtonRelease-1>', lambda e: self._on_position_release())
-        
-        pos_entry = ttk.Entry(pos_slider_row, textvariable=self.position_var, width=6,
-                            font=('Arial', 12), validate='key',
-                            validatecommand=self.vcmd_decimal)
-        pos_entry.pack(side="right", padx=(5, 0))
-        
-        # No buttons needed - slider handles everything
-        
-        # Current Control
-        self.curr_frame = ttk.LabelFrame(left_panel, text="Current Control", padding=5)
-        self.curr_frame.pack(fill="x", pady=3)
-        
-        ttk.Label(self.curr_frame, text="Current (A):", style='Touch.TLabel').pack()
-        
-        # Slider and entry on same row with colored background
-        curr_slider_row = ttk.Frame(self.curr_frame)
-        curr_slider_row.pack(fill="x", pady=5)
-        
-        # Create colored background for current slider (green)
-        curr_bg = tk.Frame(curr_slider_row, bg="#3a9f6b", height=35)
-        curr_bg.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        
-        curr_scale = ttk.Scale(curr_bg, from_=-8, to=8, variable=self.current_var, 
-                             orient="horizontal", length=180,
-                             style='CurrentSlider.Horizontal.TScale')
-        curr_scale.pack(fill="x", padx=5, pady=5)
-        
-        # Bind mouse events for drag start/end detection
-        curr_scale.bind('<Button-1>', lambda e: self._on_slider_press('current'))
-        curr_scale.bind('<ButtonRelease-1>', lambda e: self._on_current_release())
-        
-        curr_entry = ttk.Entry(curr_slider_row, textvariable=self.current_var, width=6,
-                             font=('Arial', 12), validate='key',
-                             validatecommand=self.vcmd_decimal)
-        curr_entry.pack(side="right", padx=(5, 0))
-        
-        # No buttons needed - slider handles everything
+        # Velocity, Position and Current controls; the slider handles everything
+        sliders = {}
+        for kind, title, label, color, low, high, variable, validator in (
+                ('velocity', "Velocity Control", "Speed (RPM):", "#3a5f9f",
+                 -143, 143, self.velocity_var, self.vcmd_int),
+                ('position', "Position Control", "Position (°):", "#9f3a3a",
+                 0, 360, self.position_var, self.vcmd_decimal),
+                ('current', "Current Control", "Current (A):", "#3a9f6b",
+                 -8, 8, self.current_var, self.vcmd_decimal)):
+            sliders[kind] = self._build_slider(left_panel, kind, title, label, color,
+                                               low, high, variable, validator)
+        
+        self.vel_scale = sliders['velocity'][1]
+        self.pos_frame = sliders['position'][0]
+        self.curr_frame = sliders['current'][0]
         
         # Right panel - Graph
         right_panel = ttk.Frame(self.control_frame)
@@ -611,10 +606,13 @@ class SimpleDDSM115GUI:
         self.show_torque_var = tk.BooleanVar(value=True)
         
         ttk.Checkbutton(graph_controls, text="Velocity", variable=self.show_velocity_var,
+                       command=self.request_graph_redraw,
                        style='Touch.TCheckbutton').pack(side="left", padx=8)
         ttk.Checkbutton(graph_controls, text="Position", variable=self.show_position_var,
+                       command=self.request_graph_redraw,
                        style='Touch.TCheckbutton').pack(side="left", padx=8)
         ttk.Checkbutton(graph_controls, text="Torque", variable=self.show_torque_var,
+                       command=self.request_graph_redraw,
                        style='Touch.TCheckbutton').pack(side="left", padx=8)
         ttk.Button(graph_controls, text="Clear", command=self.clear_graph,
                   style='Touch.TButton').pack(side="left", padx=15)
@@ -629,713 +627,10 @@ class SimpleDDSM115GUI:
 
     def create_custom_window_controls(self):
         """Create custom touch-friendly window controls"""
-        # Create a frame at the top of the window for custom controls
-        
-        # Create scrollable text area for ASCII art with wide scrollbar
-        art_text = scrolledtext.ScrolledText(art_frame, font=("Courier", 8), 
-                                           bg='#1a1a1a', fg='#00ff00',
-                                           insertbackground='#00ff00',
-                                           selectbackground='#2a2a2a')
-        art_text.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Configure wide scrollbar for touch-friendly use
-        self.configure_wide_scrollbar(art_text)
-        
-        # DDSM115 Hub Motor ASCII Art
-        ascii_art = """
-╔══════════════════════════════════════════════════════════════════════════════════════════════════╗
-║                                      DDSM115 HUB MOTOR                                           ║
-║                                   Servo Motor Controller                                         ║
-╚══════════════════════════════════════════════════════════════════════════════════════════════════╝
-
-                                    ╭─────────────────────╮
-                                    │    RS485 Interface │
-                                    │   ┌─────────────┐   │
-                                    │   │  TX    RX   │   │
-                            ┌───────┤   │   A+  A-    │   ├───────┐
-                            │       │   │   B+  B-    │   │       │
-                    ┌───────┴───┐   │   └─────────────┘   │   ┌───┴───────┐
-                    │    CAN    │   ╰─────────────────────╯   │  ENCODER  │
-                    │  BUS I/O  │                             │   HALL    │
-                    └───────────┘        ╭───────────╮        │  SENSORS  │
-                                         │  CONTROL  │        └───────────┘
-                 ╔══════════════════════════════════════════════════════════════════════╗
-                 ║                      MOTOR HOUSING (HUB)                             ║
-                 ║   ╔════════════════════════════════════════════════════════════╗     ║
-                 ║   ║                    STATOR WINDINGS                         ║     ║
-                 ║   ║                                                            ║     ║
-                 ║   ║    Phase A  ┌─┬─┬─┬─┬─┬─┬─┬─┬─┬─┬─┬─┐  Phase A             ║     ║
-                 ║   ║             │ │ │ │ │ │ │ │ │ │ │ │ │                      ║     ║
-                 ║   ║    Phase B  ├─┼─┼─┼─┼─┼─┼─┼─┼─┼─┼─┼─┤  Phase B             ║     ║
-                 ║   ║             │ │ │ │ │ │ │ │ │ │ │ │ │                      ║     ║
-                 ║   ║    Phase C  └─┴─┴─┴─┴─┴─┴─┴─┴─┴─┴─┴─┘  Phase C             ║     ║
-                 ║   ║                                                            ║     ║
-                 ║   ║              ╔═══════════════════════╗                     ║     ║
-                 ║   ║              ║     ROTOR MAGNET      ║                     ║     ║
-                 ║   ║              ║                       ║                     ║     ║
-                 ║   ║              ║   N  S  N  S  N  S    ║                     ║     ║
-                 ║   ║              ║   │  │  │  │  │  │    ║                     ║     ║
-                 ║   ║              ║   └──┼──┼──┼──┼──┘    ║                     ║     ║
-                 ║   ║              ║      │  │  │  │       ║                     ║     ║
-                 ║   ║              ║   ┌──┼──┼──┼──┼──┐    ║                     ║     ║
-                 ║   ║              ║   │  │  │  │  │  │    ║                     ║     ║
-                 ║   ║              ║   S  N  S  N  S  N    ║                     ║     ║
-                 ║   ║              ║                       ║                     ║     ║
-                 ║   ║              ╚═══════════════════════╝                     ║     ║
-                 ║   ║                                                            ║     ║
-                 ║   ╚════════════════════════════════════════════════════════════╝     ║
-                 ╚══════════════════════════════════════════════════════════════════════╝
-                                                    ║                                       
-                                                    ║                                       
-                                                ┌────▼────┐                                 
-                                                │  WHEEL  │                               
-                                                │  MOUNT  │                              
-                                                └─────────┘                               
-
-┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
-│                                  TECHNICAL SPECIFICATIONS                                       │
-├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-│ • Voltage Range:      24-48V DC                                                                 │
-│ • Max Current:        8A continuous, 16A peak                                                   │
-│ • Speed Range:        0-143 RPM (configurable)                                                  │
-│ • Position Accuracy:  0.1° resolution                                                           │
-│ • Communication:      RS485 (Modbus RTU protocol)                                               │
-│ • Control Modes:      Velocity, Position, Current (Torque)                                      │
-│ • Encoder Type:       Hall sensor + magnetic encoder                                            │
-│ • Operating Temp:     -10°C to +50°C                                                            │
-│ • Protection:         IP54 (dust and splash resistant)                                          │
-│ • Motor Type:         Brushless DC (BLDC)                                                       │
-│ • Pole Pairs:         12 (24 poles)                                                             │
-│ • Wheel Diameter:     16" - 24" (application dependent)                                         │
-└─────────────────────────────────────────────────────────────────────────────────────────────────┘
-
-┌─────────────────────────────────────────────────────────────────────────────────────────────────┐
-│                                    CONTROL INTERFACE                                            │
-├─────────────────────────────────────────────────────────────────────────────────────────────────┤
-│                                                                                                 │
-│  ┌─ RS485 Communication ─┐     ┌─ This GUI Application ─┐     ┌─ Motor Response  ─┐             │
-│  │                       │────▶│                        │────▶│                   │             │
-│  │  • Command Packets    │     │  • Real-time Control   │     │  • Position       │             │ 
-│  │  • Mode Switching     │     │  • Live Monitoring     │     │  • Velocity       │             │
-│  │  • Parameter Setting  │     │  • Emergency Stop      │     │  • Current/Torque │             │
-│  │  • Status Requests    │     │  • Data Visualization  │     │  • Temperature    │             │
-│  │                       │◀────│                        │◀────│                   │             │
-│  └───────────────────────┘     └────────────────────────┘     └───────────────────┘             │
-│                                                                                                 │
-└─────────────────────────────────────────────────────────────────────────────────────────────────┘
-
-        Welcome to the DDSM115 Motor Control Interface!
-        
-        This application provides comprehensive control over DDSM115 hub motors,
-        featuring real-time monitoring, intuitive slider controls, and robust
-        communication protocols for industrial and robotic applications.
-        
-"""
-        
-        art_text.insert(tk.END, ascii_art)
-        art_text.config(state='disabled')  # Make read-only
-    
-    def create_info_tab(self):
-        """Create application info tab with rich markdown rendering"""
-        info_frame = ttk.Frame(self.about_notebook)
-        self.about_notebook.add(info_frame, text="📄 Info")
-        
-        # Create a frame with scrollbar for the markdown widget
-        scroll_frame = ttk.Frame(info_frame)
-        scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create wide scrollbar for touch-friendly use (using tk.Scrollbar for width support)
-        scrollbar = tk.Scrollbar(scroll_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Configure wide scrollbar
-        self.configure_wide_scrollbar_direct(scrollbar)
-        
-        # Create rich markdown text widget with content
-        info_content = """# DDSM115 Motor Control Interface
-
-## Version 1.0.0
-
-**Created by Matthew Valancy**
-
----
-
-## Overview
-
-A comprehensive interface for controlling DDSM115 servo motors with real-time monitoring and intuitive controls.
-
-### Key Features
-
-- **Real-time Motor Control**: Intuitive sliders for velocity, position, and current control
-- **Live Data Visualization**: Dynamic graphs showing motor performance metrics  
-- **Automatic Mode Switching**: Seamless transitions between control modes
-- **Emergency Safety**: Instant stop functionality for all connected motors
-- **Dark Theme Interface**: Optimized for extended use in various lighting conditions
-- **Robust Communication**: RS485 protocol with error handling and recovery
-- **Multi-motor Support**: Control multiple motors with automatic detection
-
-### Technical Capabilities
-
-- **Control Modes**:
-  - Velocity Control: -143 to +143 RPM
-  - Position Control: 0° to 360° with 0.1° precision
-  - Current Control: -8A to +8A for torque applications
-
-- **Real-time Monitoring**:
-  - Motor velocity, position, and torque
-  - Temperature monitoring with alerts
-  - Communication statistics (TX/RX rates)
-  - Connection status and diagnostics
-
-- **Safety Features**:
-  - Emergency stop for immediate motor shutdown
-  - Automatic velocity ramping for safe mode transitions
-  - Connection monitoring with auto-reconnect
-  - Error handling and graceful degradation
-
-### Communication Protocol
-
-The application uses RS485 communication with custom packet protocols:
-- 10-byte command packets for motor control
-- Real-time feedback monitoring at 20Hz
-- Automatic motor ID detection and configuration
-- Robust error handling and retry mechanisms
-
-### Use Cases
-
-- **Robotics**: Precise control for robotic joints and actuators
-- **Industrial Automation**: Conveyor systems and positioning applications
-- **Electric Vehicles**: Hub motor control for e-bikes and scooters
-- **Research & Development**: Motor characterization and testing
-- **Educational**: Learning motor control principles and RS485 communication
-
-### System Requirements
-
-- Python 3.8+ with tkinter, matplotlib, and pyserial
-- USB-to-RS485 converter for communication
-- DDSM115 motor with proper power supply (24-48V)
-- Operating system: Windows, Linux, or macOS
-
----
-
-This application represents a complete solution for DDSM115 motor control,
-combining ease of use with professional-grade functionality.
-"""
-        
-        info_text = self.create_markdown_text_widget(scroll_frame, info_content)
-        info_text.pack(side="left", fill="both", expand=True)
-        
-        # Connect scrollbar to text widget
-        scrollbar.config(command=info_text.yview)
-        info_text.config(yscrollcommand=scrollbar.set)
-    
-    def create_operation_guide_tab(self):
-        """Create comprehensive operation guide with rich markdown"""
-        guide_frame = ttk.Frame(self.about_notebook)
-        self.about_notebook.add(guide_frame, text="📖 Operation Guide")
-        
-        # Create a frame with scrollbar for the markdown widget
-        scroll_frame = ttk.Frame(guide_frame)
-        scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create wide scrollbar for touch-friendly use (using tk.Scrollbar for width support)
-        scrollbar = tk.Scrollbar(scroll_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Configure wide scrollbar
-        self.configure_wide_scrollbar_direct(scrollbar)
-        
-        guide_content = """# DDSM115 Motor Control - Complete Operation Guide
-
-## Table of Contents
-1. Getting Started
-2. Connection Setup
-3. Motor Control
-4. Live Monitoring
-5. Safety Features
-6. Advanced Features
-
----
-
-## Getting Started
-
-### Initial Setup
-1. **Hardware Connection**
-   - Connect DDSM115 motor to power supply (24-48V)
-   - Connect USB-to-RS485 converter to computer
-   - Wire RS485 A+/A- and B+/B- lines to motor
-   - Ensure proper grounding and shielding
-
-2. **Software Launch**
-   - Run the application using `python3 ddsm115_gui.py`
-   - The interface will open with the Connection tab active
-   - USB ports will be automatically scanned and populated
-
-### First Connection
-1. Select your USB-to-RS485 device from the dropdown
-2. Click "Connect" to establish communication
-3. Use "Auto Detect" to find your motor ID
-4. The status will show "CONNECTED" when successful
-
----
-
-## Connection Setup
-
-### Port Selection
-- **Automatic Detection**: The application scans for USB-to-RS485 devices
-- **Manual Selection**: Choose from available serial ports
-- **Auto-connect**: Single USB-to-RS485 devices connect automatically
-
-### Motor Detection
-- **Auto Detect**: Scans motor IDs 1-10 to find active motors
-- **Manual ID**: Set motor ID manually if known
-- **Multiple Motors**: Each motor requires a unique ID
-
-### Connection Status
-- **Green "CONNECTED"**: Communication established
-- **Red "DISCONNECTED"**: No communication
-- **Status Bar**: Shows TX/RX rates and connection health
-
----
-
-## Motor Control
-
-### Control Modes
-
-#### Velocity Control (Blue Slider)
-- **Range**: -143 to +143 RPM
-- **Use Case**: Continuous rotation applications
-- **Auto-switching**: Automatically activates when velocity slider is used
-- **Real-time**: Immediate response to slider changes
-
-#### Position Control (Red Slider)  
-- **Range**: 0° to 360°
-- **Precision**: 0.1° resolution
-- **Use Case**: Precise positioning applications
-- **Safety**: Automatically ramps down velocity before switching modes
-
-#### Current Control (Green Slider)
-- **Range**: -8A to +8A
-- **Use Case**: Torque control applications
-- **Safety**: Current limiting protects motor from damage
-
-### Slider Operation
-- **Touch-friendly**: Large, color-coded sliders for easy operation
-- **Release-based**: Commands sent when slider is released (not during drag)
-- **Visual Feedback**: Color-coded backgrounds match graph lines
-- **Text Entry**: Manual numeric input with validation
-
-### Mode Switching
-- **Automatic**: Modes switch automatically when using different sliders
-- **Intelligent**: System handles velocity ramping for safe transitions
-- **Visual**: Current mode displayed with matching colors
-- **Safety**: Emergency stop works in any mode
-
----
-
-## Live Monitoring
-
-### Real-time Graph
-- **Dual Y-axis**: Left axis for velocity/position, right axis for torque
-- **Live Updates**: 20Hz refresh rate for smooth visualization
-- **Color Coding**: 
-  - Blue: Velocity (RPM)
-  - Red: Position (degrees)
-  - Cyan: Torque (Amps)
-- **Auto-scaling**: Axes automatically adjust to data range
-
-### Status Display
-- **Velocity**: Current motor speed in RPM
-- **Position**: Current motor position in degrees
-- **Torque**: Current motor torque in Amps
-- **Temperature**: Motor temperature with color alerts
-- **Communication**: TX/RX rates and connection status
-
-### Data Logging
-- **Continuous**: All data is logged during operation
-- **Export**: Data can be exported for analysis
-- **History**: Complete session history maintained
-
----
-
-## Safety Features
-
-### Emergency Stop
-- **Big Red Button**: Immediately stops all motor motion
-- **All Motors**: Stops motors with IDs 1-10 regardless of current selection
-- **Bypass Queue**: Emergency stop bypasses normal command queue
-- **Always Active**: Works even during communication errors
-
-### Automatic Safety
-- **Velocity Ramping**: Automatic speed reduction before mode changes
-- **Temperature Monitoring**: Alerts when motor temperature is high
-- **Communication Watchdog**: Detects and recovers from communication errors
-- **Error Handling**: Graceful handling of unexpected conditions
-
-### Manual Safety
-- **Connection Status**: Always visible connection indicator
-- **Mode Display**: Clear indication of current control mode
-- **Status Monitoring**: Real-time system health information
-
----
-
-## Advanced Features
-
-### Diagnostics
-- **Motor Test**: Comprehensive motor functionality test
-- **Communication Test**: Verifies RS485 communication
-- **Movement Test**: Confirms motor responds to commands
-- **System Health**: Complete system diagnostic report
-
-### Multi-motor Support
-- **Motor Scanning**: Automatically detects all connected motors
-- **ID Management**: Easy switching between motor IDs
-- **Individual Control**: Each motor controlled independently
-- **Status Monitoring**: Monitor multiple motors simultaneously
-
-### Robust Operation
-- **Error Recovery**: Automatic recovery from communication errors
-- **Long-term Stability**: Designed for weeks of continuous operation
-- **Exception Handling**: Comprehensive error handling prevents crashes
-- **Graceful Shutdown**: Clean disconnection and resource cleanup
-
----
-
-## Tips for Best Operation
-
-### Performance Optimization
-- Use release-based slider control for smooth operation
-- Monitor temperature to prevent overheating
-- Ensure stable power supply for consistent performance
-- Keep RS485 cables short and properly shielded
-
-### Maintenance
-- Regularly check connection status
-- Monitor motor temperature during operation
-- Verify communication rates are stable
-- Test emergency stop functionality periodically
-
-### Troubleshooting Quick Start
-1. Check all cable connections
-2. Verify power supply voltage and capacity
-3. Confirm motor ID settings
-4. Test with different USB ports if needed
-5. Use diagnostic function to identify issues
-
-This interface is designed for both novice and expert users, providing
-simple operation with advanced capabilities when needed.
-"""
-        
-        # Create rich markdown text widget with content
-        guide_text = self.create_markdown_text_widget(scroll_frame, guide_content)
-        guide_text.pack(side="left", fill="both", expand=True)
-        
-        # Connect scrollbar to text widget
-        scrollbar.config(command=guide_text.yview)
-        guide_text.config(yscrollcommand=scrollbar.set)
-    
-    def create_api_reference_tab(self):
-        """Create API reference documentation with rich markdown"""
-        api_frame = ttk.Frame(self.about_notebook)
-        self.about_notebook.add(api_frame, text="🔧 API Reference")
-        
-        # Create a frame with scrollbar for the markdown widget
-        scroll_frame = ttk.Frame(api_frame)
-        scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create wide scrollbar for touch-friendly use (using tk.Scrollbar for width support)
-        scrollbar = tk.Scrollbar(scroll_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Configure wide scrollbar
-        self.configure_wide_scrollbar_direct(scrollbar)
-        
-        api_content = """# DDSM115 Motor Control API Reference
-
-## Core Classes
-
-### `MotorCommandQueue`
-Main interface for motor control with robust command queuing.
-
-```python
-class MotorCommandQueue:
-    def __init__(self, port: str = "/dev/ttyUSB0")
-    
-    # Connection Management
-    def connect(self) -> bool
-    def disconnect(self) -> None
-    def is_connected(self) -> bool
-    
-    # Motor Control
-    def set_velocity(self, motor_id: int, velocity: float, callback: Optional[Callable] = None)
-    def set_position(self, motor_id: int, position: float, callback: Optional[Callable] = None)  
-    def set_current(self, motor_id: int, current: float, callback: Optional[Callable] = None)
-    def set_mode(self, motor_id: int, mode: MotorMode, callback: Optional[Callable] = None)
-    
-    # Safety
-    def stop(self, motor_id: int, callback: Optional[Callable] = None)
-    def enable(self, motor_id: int, callback: Optional[Callable] = None)
-    def disable(self, motor_id: int, callback: Optional[Callable] = None)
-    
-    # Monitoring
-    def request_feedback(self, motor_id: int, callback: Optional[Callable] = None)
-    def get_last_feedback(self, motor_id: int) -> Optional[MotorFeedback]
-    def scan_motors(self, start_id: int = 1, end_id: int = 10) -> list
-    
-    # Statistics
-    def get_stats(self) -> dict
-```
-
-### Communication Protocol
-
-#### Command Packet Format
-All motor commands use 10-byte packets:
-
-```
-Byte 0:    Motor ID (1-10)
-Byte 1:    Command Type
-Bytes 2-8: Command Data (6 bytes)
-Byte 9:    Mode/Value
-```
-
-#### Command Types
-```python
-class CommandType(Enum):
-    MODE_SWITCH = 0xA0    # Switch control mode
-    SET_VELOCITY = 0xA1   # Set velocity command
-    SET_POSITION = 0xA2   # Set position command  
-    SET_CURRENT = 0xA3    # Set current command
-    REQUEST_STATUS = 0xA4 # Request feedback
-    ENABLE = 0xA5         # Enable motor
-    DISABLE = 0xA6        # Disable motor
-```
-
-## Usage Examples
-
-### Basic Motor Control
-```python
-from motor_command_queue import MotorCommandQueue
-
-# Initialize controller
-controller = MotorCommandQueue("/dev/ttyUSB0")
-
-# Connect and find motors
-if controller.connect():
-    motors = controller.scan_motors()
-    if motors:
-        motor_id = motors[0]
-        
-        # Set velocity
-        controller.set_velocity(motor_id, 50)  # 50 RPM
-        
-        # Set position  
-        controller.set_position(motor_id, 180)  # 180 degrees
-        
-        # Set current
-        controller.set_current(motor_id, 2.0)   # 2 Amps
-        
-        # Emergency stop
-        controller.stop(motor_id)
-        
-    controller.disconnect()
-```
-
-### Feedback Monitoring
-```python
-def on_feedback(motor_id, feedback):
-    print(f"Motor {motor_id}:")
-    print(f"  Velocity: {feedback.velocity} RPM")
-    print(f"  Position: {feedback.position}°")
-    print(f"  Torque: {feedback.torque} A")
-
-# Setup callback
-controller.on_feedback = on_feedback
-
-# Manual feedback request
-feedback = controller.request_feedback(motor_id)
-if feedback:
-    print(f"Current position: {feedback.position}°")
-```
-
-### Error Handling
-```python
-def on_error(error_msg):
-    print(f"Motor Error: {error_msg}")
-
-controller.on_error = on_error
-
-# Get statistics
-stats = controller.get_stats()
-print(f"Commands processed: {stats['commands_processed']}")
-print(f"Success rate: {stats['success_rate']:.1f}%")
-```
-
-This API provides both high-level convenience and low-level control
-for comprehensive DDSM115 motor management.
-"""
-        
-        # Create rich markdown text widget with content (VS Code dark theme)
-        api_text = self.create_markdown_text_widget(scroll_frame, api_content, '#1e1e1e', '#d4d4d4')
-        api_text.pack(side="left", fill="both", expand=True)
-        
-        # Connect scrollbar to text widget
-        scrollbar.config(command=api_text.yview)
-        api_text.config(yscrollcommand=scrollbar.set)
-    
-    def create_troubleshooting_tab(self):
-        """Create troubleshooting guide with rich markdown"""
-        trouble_frame = ttk.Frame(self.about_notebook)
-        self.about_notebook.add(trouble_frame, text="🔍 Troubleshooting")
-        
-        # Create a frame with scrollbar for the markdown widget
-        scroll_frame = ttk.Frame(trouble_frame)
-        scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create wide scrollbar for touch-friendly use (using tk.Scrollbar for width support)
-        scrollbar = tk.Scrollbar(scroll_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Configure wide scrollbar
-        self.configure_wide_scrollbar_direct(scrollbar)
-        
-        trouble_content = """# DDSM115 Troubleshooting Guide
-
-## Quick Diagnostic Checklist
-
-### ❌ Cannot Connect to Motor
-**Symptoms**: Connection status shows "DISCONNECTED", no response from motor
-
-**Solutions**:
-1. **Check Physical Connections**
-   - Verify USB-to-RS485 adapter is plugged in
-   - Confirm RS485 wiring: A+ to A+, A- to A-, B+ to B+, B- to B-
-   - Ensure motor power supply is connected and switched on
-   - Check for loose connections and proper grounding
-
-2. **Verify Port Selection**
-   - Try "Refresh Ports" to rescan available ports
-   - Select correct USB-to-RS485 device from dropdown
-   - Try different USB ports on computer
-   - Check if device appears in system device manager
-
-3. **Test Communication Settings**
-   - Verify motor is configured for correct baud rate (115200)
-   - Check motor ID settings (default usually 1)
-   - Try different motor IDs using "Auto Detect"
-
----
-
-### ⚠️ Motor Detected But Not Responding
-**Symptoms**: Motor found during scan but doesn't move when commanded
-
-**Solutions**:
-1. **Check Motor State**
-   - Use "Diagnose" function to test motor systematically
-   - Verify motor is enabled (not in fault state)
-   - Check temperature - motor may be in thermal protection
-
-2. **Power Supply Issues**
-   - Verify power supply can provide sufficient current (8A+ continuous)
-   - Check voltage is within motor specifications (24-48V)
-   - Ensure power supply connections are secure
-
-3. **Mechanical Issues**
-   - Check for mechanical binding or excessive load
-   - Verify motor shaft/wheel can rotate freely
-   - Ensure motor mounting is secure
-
----
-
-### 📊 Graph Not Updating or Freezing
-**Symptoms**: Live graph stops updating, shows flat lines
-
-**Solutions**:
-1. **Check Communication**
-   - Verify TX/RX rates in status bar are non-zero
-   - Look for communication error messages
-   - Try disconnecting and reconnecting
-
-2. **Software Issues**
-   - Close and restart the application
-   - Check available system memory
-   - Try reducing graph update rate
-
----
-
-### 🎛️ Sliders Not Working Properly
-**Symptoms**: Moving sliders doesn't control motor, or control is erratic
-
-**Solutions**:
-1. **Check Mode Switching**
-   - Verify current mode display matches expected control
-   - Allow time for mode transitions to complete
-   - Try manual mode switching before using sliders
-
-2. **Communication Timing**
-   - Use release-based control (don't drag continuously)
-   - Allow brief pauses between commands
-   - Check for command queue overload in status
-
----
-
-### 🌡️ Temperature Warnings
-**Symptoms**: High temperature readings, thermal protection activation
-
-**Solutions**:
-1. **Immediate Actions**
-   - Reduce motor load or duty cycle
-   - Allow motor to cool before continuing operation
-   - Check for adequate ventilation around motor
-
-2. **Long-term Solutions**
-   - Verify motor is not overloaded for application
-   - Check ambient temperature conditions
-   - Consider active cooling for high-duty applications
-
----
-
-### ⚡ Emergency Stop Not Working
-**Symptoms**: E-stop button doesn't immediately stop motor
-
-**Solutions**:
-1. **Immediate Safety**
-   - Remove power from motor immediately
-   - Check physical emergency stop switches if installed
-   - Verify motor brake engagement (if equipped)
-
-2. **Software Issues**
-   - Restart application to clear any software locks
-   - Check communication is working before relying on software E-stop
-   - Verify emergency stop bypasses normal command queue
-
----
-
-## When to Contact Support
-
-Contact technical support if:
-- Multiple troubleshooting steps don't resolve the issue
-- Hardware damage is suspected
-- Motor behavior is inconsistent with specifications
-- Safety-critical applications require verification
-
-Remember: When in doubt, prioritize safety. Use physical emergency stops
-and power disconnection for immediate safety in any uncertain situation.
-"""
-        
-        # Create rich markdown text widget with content
-        trouble_text = self.create_markdown_text_widget(scroll_frame, trouble_content)
-        trouble_text.pack(side="left", fill="both", expand=True)
-        
-        # Connect scrollbar to text widget
-        scrollbar.config(command=trouble_text.yview)
-        trouble_text.config(yscrollcommand=scrollbar.set)
-    
-    def create_custom_window_controls(self):
-        """Create custom touch-friendly window controls"""
-        # Create a frame at the top of the window for custom controls
-        controls_frame = tk.Frame(self.root, bg='#1a1a1a', height=50)
+        # Create a frame at the top of the window for custom controls; its 50px
+        # height comes from the 40px control canvas and its padding
+        controls_frame = ttk.Frame(self.root, style='TopBar.TFrame')
         controls_frame.pack(fill="x", side="top")
-        controls_frame.pack_propagate(False)
         
         # Title label on the left
         title_label = tk.Label(controls_frame, text="DDSM115 Motor Control", 
@@ -1343,42 +638,23 @@ and power disconnection for immediate safety in any uncertain situation.
                               font=('Arial', 12, 'bold'))
         title_label.pack(side="left", padx=10, pady=10)
         
-        # Window control buttons on the right (4x larger than normal)
-        button_frame = tk.Frame(controls_frame, bg='#1a1a1a')
-        button_frame.pack(side="right", padx=5, pady=5)
-        
-        # Minimize button
-        minimize_btn = tk.Button(button_frame, text="−", 
-                               command=self.minimize_window,
-                               bg='#4a4a4a', fg='#e0e0e0', 
-                               font=('Arial', 16, 'bold'),
-                               width=3, height=1,
-                               relief='flat', bd=0,
-                               activebackground='#5a5a5a',
-                               cursor='hand2')
-        minimize_btn.pack(side="left", padx=2)
-        
-        # Maximize/Restore button
-        self.maximize_btn = tk.Button(button_frame, text="□", 
-                                    command=self.toggle_maximize,
-                                    bg='#4a4a4a', fg='#e0e0e0', 
-                                    font=('Arial', 16, 'bold'),
-                                    width=3, height=1,
-                                    relief='flat', bd=0,
-                                    activebackground='#5a5a5a',
-                                    cursor='hand2')
-        self.maximize_btn.pack(side="left", padx=2)
-        
-        # Close button
-        close_btn = tk.Button(button_frame, text="✕", 
-                            command=self.on_closing,
-                            bg='#cc4444', fg='#ffffff', 
-                            font=('Arial', 16, 'bold'),
-                            width=3, height=1,
-                            relief='flat', bd=0,
-                            activebackground='#dd5555',
-                            cursor='hand2')
-        close_btn.pack(side="left", padx=2)
+        # Window control buttons on the right (4x larger than normal), drawn on
+        # one canvas instead of a frame holding three button windows
+        self.window_controls = tk.Canvas(controls_frame, bg='#1a1a1a', highlightthickness=0,
+                                         width=len(WINDOW_CONTROL_BUTTONS) * 56, height=40,
+                                         cursor='hand2')
+        self.window_controls.pack(side="right", padx=5, pady=5)
+        
+        commands = {'min': self.minimize_window, 'max': self.toggle_maximize, 'close': self.on_closing}
+        for index, (tag, glyph, fill, active_fill, text_color) in enumerate(WINDOW_CONTROL_BUTTONS):
+            x = index * 56 + 2
+            self.window_controls.create_rectangle(x, 0, x + 52, 40, fill=fill, activefill=active_fill,
+                                                  width=0, tags=(tag,))
+            # Disabled text ignores the pointer, so hover and clicks reach the rectangle
+            self.window_controls.create_text(x + 26, 20, text=glyph, fill=text_color,
+                                             font=('Arial', 16, 'bold'), state='disabled',
+                                             tags=(tag, f'{tag}_text'))
+            self.window_controls.tag_bind(tag, '<Button-1>', lambda e, command=commands[tag]: command())
         
         # Track window state
         self.is_maximized = False
@@ -1403,7 +679,7 @@ and power disconnection for immediate safety in any uncertain situation.
                 self.root.overrideredirect(True)  # Re-enable custom window controls
                 self.root.geometry(self.normal_geometry)
                 self.root.resizable(True, True)  # Make window resizable
-                self.maximize_btn.config(text="□")
+                self.window_controls.itemconfigure('max_text', text="□")
                 self.is_maximized = False
                 print(f"Restored to normal size: {self.normal_geometry}")
             else:
@@ -1419,7 +695,7 @@ and power disconnection for immediate safety in any uncertain situation.
                 self.root.geometry(f"{screen_width}x{screen_height}+0+0")
                 self.root.resizable(False, False)  # Disable resizing in fullscreen
                 
-                self.maximize_btn.config(text="❐")
+                self.window_controls.itemconfigure('max_text', text="❐")
                 self.is_maximized = True
                 print(f"Maximized to fullscreen: {screen_width}x{screen_height}")
                 
@@ -1432,228 +708,62 @@ and power disconnection for immediate safety in any uncertain situation.
                     screen_width = self.root.winfo_screenwidth()
                     screen_height = self.root.winfo_screenheight()
                     self.root.geometry(f"{screen_width}x{screen_height}+0+0")
-                    self.maximize_btn.config(text="❐")
+                    self.window_controls.itemconfigure('max_text', text="❐")
                     self.is_maximized = True
                 else:
                     self.root.geometry(self.normal_geometry)
                     self.root.resizable(True, True)
-                    self.maximize_btn.config(text="□")
+                    self.window_controls.itemconfigure('max_text', text="□")
                     self.is_maximized = False
             except Exception as e2:
                 print(f"Fallback maximize error: {e2}")
     
     def make_draggable(self, widget):
-        """Make a widget draggable for window movement"""
+        """Make a widget draggable for window movement
+        
+        Motion events only record the target position; the window is moved at
+        most once per DRAG_FLUSH_MS and once more when the button is released.
+        """
+        widget._pending_geom = None
+        widget._drag_after = None
+        
         def start_drag(event):
             widget.start_x = event.x
             widget.start_y = event.y
         
         def on_drag(event):
             try:
+                # The window has not moved since the last flush, so the offset
+                # from the press point is the whole distance still to travel
                 x = self.root.winfo_x() + (event.x - widget.start_x)
                 y = self.root.winfo_y() + (event.y - widget.start_y)
-                self.root.geometry(f"+{x}+{y}")
             except Exception:
-                pass  # Ignore drag errors
+                return  # Ignore drag errors
+            widget._pending_geom = (x, y)
+            if widget._drag_after is None:
+                widget._drag_after = self.schedule_callback(
+                    DRAG_FLUSH_MS, lambda: self._flush_drag(widget))
+        
+        def end_drag(event):
+            self.cancel_callback(widget._drag_after)
+            self._flush_drag(widget)
         
         widget.bind("<Button-1>", start_drag)
         widget.bind("<B1-Motion>", on_drag)
+        widget.bind("<ButtonRelease-1>", end_drag)
     
-    def configure_wide_scrollbar(self, text_widget):
-        """Configure wide, touch-friendly scrollbars for text widgets"""
-        try:
-            # Calculate scrollbar width as 5-10% of window width
-            window_width = self.root.winfo_width() if self.root.winfo_width() > 1 else 1071
-            scrollbar_width = max(50, int(window_width * 0.07))  # 7% of window width, minimum 50px
-            
-            # Get the scrollbar from the ScrolledText widget
-            vbar = text_widget.vbar
-            
-            # Configure the scrollbar to be wider and more touch-friendly
-            vbar.config(
-                width=scrollbar_width,
-                borderwidth=2,
-                relief='raised',
-                bg='#4a4a4a',
-                troughcolor='#2b2b2b',
-                activebackground='#6a6a6a',
-                highlightbackground='#4a4a4a',
-                highlightcolor='#6a6a6a'
-            )
-            
-            # Style the scrollbar arrows and thumb for better visibility
-            try:
-                # Try to configure scrollbar colors (may not work on all systems)
-                vbar.config(
-                    elementborderwidth=2,
-                    arrowcolor='#e0e0e0',
-                    activerelief='raised'
-                )
-            except Exception:
-                pass  # Ignore if these options aren't supported
-            
-        except Exception as e:
-            print(f"Warning: Could not configure wide scrollbar: {e}")
-            # Continue without wide scrollbars if configuration fails
-    
-    def configure_wide_scrollbar_direct(self, scrollbar):
-        """Configure a scrollbar directly to be wide and touch-friendly"""
+    def _flush_drag(self, widget):
+        """Move the window to the latest position recorded by a drag"""
+        widget._drag_after = None
+        geom = widget._pending_geom
+        if geom is None:
+            return
+        widget._pending_geom = None
         try:
-            # Calculate scrollbar width as 7% of window width
-            window_width = self.root.winfo_width() if self.root.winfo_width() > 1 else 1071
-            scrollbar_width = max(50, int(window_width * 0.07))  # 7% of window width, minimum 50px
-            
-            # Configure the scrollbar to be wider and more touch-friendly
-            scrollbar.config(
-                width=scrollbar_width,
-                borderwidth=2,
-                relief='raised',
-                bg='#4a4a4a',
-                troughcolor='#2b2b2b',
-                activebackground='#6a6a6a',
-                highlightbackground='#4a4a4a',
-                highlightcolor='#6a6a6a'
-            )
-            
-        except Exception as e:
-            print(f"Warning: Could not configure wide scrollbar directly: {e}")
-    
-    def create_markdown_text_widget(self, parent, content, bg_color='#2b2b2b', fg_color='#e0e0e0'):
-        """Create a rich text widget with markdown-style formatting"""
-        text_widget = tk.Text(parent, 
-                             font=("Arial", 10), 
-                             bg=bg_color, 
-                             fg=fg_color,
-                             insertbackground=fg_color,
-                             selectbackground='#4a9eff',
-                             wrap='word',
-                             state='disabled',
-                             padx=20,
-                             pady=15)
-        
-        # Configure text styles for markdown rendering
-        text_widget.tag_configure('h1', font=('Arial', 18, 'bold'), foreground='#ffffff', spacing1=10, spacing3=10)
-        text_widget.tag_configure('h2', font=('Arial', 16, 'bold'), foreground='#e0e0e0', spacing1=8, spacing3=8)
-        text_widget.tag_configure('h3', font=('Arial', 14, 'bold'), foreground='#d0d0d0', spacing1=6, spacing3=6)
-        text_widget.tag_configure('bold', font=('Arial', 10, 'bold'), foreground='#ffffff')
-        text_widget.tag_configure('italic', font=('Arial', 10, 'italic'), foreground='#c0c0c0')
-        text_widget.tag_configure('code', font=('Courier', 9), background='#1a1a1a', foreground='#00ff00', relief='solid', borderwidth=1)
-        text_widget.tag_configure('code_block', font=('Courier', 9), background='#1a1a1a', foreground='#d4d4d4', relief='solid', borderwidth=1, lmargin1=20, lmargin2=20, rmargin=20, spacing1=5, spacing3=5)
-        text_widget.tag_configure('bullet', font=('Arial', 10), lmargin1=40, lmargin2=60)
-        text_widget.tag_configure('numbered', font=('Arial', 10), lmargin1=40, lmargin2=60)
-        text_widget.tag_configure('blockquote', font=('Arial', 10, 'italic'), foreground='#a0a0a0', lmargin1=40, lmargin2=40, relief='solid', borderwidth=1, background='#3a3a3a')
-        text_widget.tag_configure('link', font=('Arial', 10, 'underline'), foreground='#4a9eff')
-        text_widget.tag_configure('separator', relief='solid', borderwidth=1, background='#555555')
-        
-        # Render markdown content
-        self.render_markdown(text_widget, content)
-        
-        return text_widget
-    
-    def render_markdown(self, text_widget, content):
-        """Render markdown content in a text widget with styling"""
-        text_widget.config(state='normal')
-        text_widget.delete(1.0, 'end')
-        
-        lines = content.split('\n')
-        in_code_block = False
-        code_block_content = []
-        list_level = 0
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            # Handle code blocks
-            if stripped.startswith('```'):
-                if in_code_block:
-                    # End code block
-                    code_text = '\n'.join(code_block_content)
-                    text_widget.insert('end', code_text + '\n', 'code_block')
-                    code_block_content = []
-                    in_code_block = False
-                else:
-                    # Start code block
-                    in_code_block = True
-                continue
-            
-            if in_code_block:
-                code_block_content.append(line)
-                continue
-            
-            # Handle headers
-            if stripped.startswith('# '):
-                text_widget.insert('end', stripped[2:] + '\n', 'h1')
-            elif stripped.startswith('## '):
-                text_widget.insert('end', stripped[3:] + '\n', 'h2')
-            elif stripped.startswith('### '):
-                text_widget.insert('end', stripped[4:] + '\n', 'h3')
-            
-            # Handle horizontal rules
-            elif stripped == '---':
-                text_widget.insert('end', '─' * 80 + '\n', 'separator')
-            
-            # Handle bullet lists
-            elif stripped.startswith('- ') or stripped.startswith('• '):
-                bullet_text = '• ' + stripped[2:]
-                text_widget.insert('end', bullet_text + '\n', 'bullet')
-            
-            # Handle numbered lists
-            elif re.match(r'^\d+\. ', stripped):
-                text_widget.insert('end', stripped + '\n', 'numbered')
-            
-            # Handle blockquotes
-            elif stripped.startswith('> '):
-                text_widget.insert('end', stripped[2:] + '\n', 'blockquote')
-            
-            # Handle regular paragraphs with inline formatting
-            elif stripped:
-                self.render_inline_formatting(text_widget, stripped + '\n')
-            
-            # Handle empty lines
-            else:
-                text_widget.insert('end', '\n')
-        
-        text_widget.config(state='disabled')
-    
-    def render_inline_formatting(self, text_widget, text):
-        """Render inline markdown formatting like bold, italic, code"""
-        pos = 0
-        
-        # Process text character by character to handle inline formatting
-        while pos < len(text):
-            # Bold text **text**
-            bold_match = re.search(r'\*\*(.*?)\*\*', text[pos:])
-            # Italic text *text*
-            italic_match = re.search(r'\*(.*?)\*', text[pos:])
-            # Inline code `code`
-            code_match = re.search(r'`(.*?)`', text[pos:])
-            
-            # Find the earliest match
-            matches = []
-            if bold_match:
-                matches.append((bold_match.start() + pos, bold_match.end() + pos, bold_match.group(1), 'bold'))
-            if italic_match and (not bold_match or italic_match.start() < bold_match.start()):
-                matches.append((italic_match.start() + pos, italic_match.end() + pos, italic_match.group(1), 'italic'))
-            if code_match and (not bold_match or code_match.start() < bold_match.start()) and (not italic_match or code_match.start() < italic_match.start()):
-                matches.append((code_match.start() + pos, code_match.end() + pos, code_match.group(1), 'code'))
-            
-            if matches:
-                # Sort by start position
-                matches.sort(key=lambda x: x[0])
-                start, end, content, style = matches[0]
-                
-                # Insert text before the match
-                if start > pos:
-                    text_widget.insert('end', text[pos:start])
-                
-                # Insert the formatted text
-                text_widget.insert('end', content, style)
-                
-                pos = end
-            else:
-                # No more matches, insert the rest
-                text_widget.insert('end', text[pos:])
-                break
+            # Same as root.geometry(), issued straight through the cached Tcl call
+            self._tk_call('wm', 'geometry', self.root._w, f"+{geom[0]}+{geom[1]}")
+        except Exception:
+            pass  # Ignore drag errors
     
     def create_emergency_stop_button(self):
         """Create emergency stop button and status bar at bottom of window"""
@@ -1736,7 +846,9 @@ and power disconnection for immediate safety in any uncertain situation.
 
     def setup_matplotlib_graph(self, parent):
         """Setup matplotlib graph with dark theme and dual Y-axes"""
-        self.fig, self.ax = plt.subplots(figsize=(6, 4))
+        # Plain Figure rather than pyplot: the canvas owns it, no global figure manager
+        self.fig = Figure(figsize=(6, 4))
+        self.ax = self.fig.add_subplot()
         
         # Configure dark theme for matplotlib
         self.fig.patch.set_facecolor('#2b2b2b')
@@ -1773,7 +885,19 @@ and power disconnection for immediate safety in any uncertain situation.
         self.ax.spines['top'].set_color('#5a5a5a')
         self.ax.spines['left'].set_color('#5a5a5a')
         self.ax2.spines['right'].set_color('#5a5a5a')
-        
+
+        # Autoscaled Y ranges keep 10% headroom around the visible data
+        self.ax.margins(y=0.1)
+        self.ax2.margins(y=0.1)
+
+        # Shown by update_graph while there are no samples
+        self._no_data_text = self.ax.text(0.5, 0.5, 'No data received',
+                                          transform=self.ax.transAxes,
+                                          fontsize=16, color='red',
+                                          ha='center', va='center',
+                                          weight='bold', visible=False)
+        self._last_line_config = None
+
         # Combine legends from both axes in fixed position
         lines1, labels1 = self.ax.get_legend_handles_labels()
         lines2, labels2 = self.ax2.get_legend_handles_labels()
@@ -1781,205 +905,111 @@ and power disconnection for immediate safety in any uncertain situation.
                       loc='upper left', facecolor='#3c3c3c', 
                       edgecolor='#5a5a5a', labelcolor='#e0e0e0')
         
+        self._graph_ready = True
+        
         # Use Tkinter timer instead of matplotlib animation for better integration
         self.graph_start_time = time.time()
         self._start_graph_updates()
         print("✅ Graph updates started with Tkinter timer")
     
     def _start_graph_updates(self):
-        """Start graph updates using Tkinter's after method"""
+        """Draw the initial graph; later redraws are requested as data arrives"""
         self._update_graph_timer()
     
+    def request_graph_redraw(self):
+        """Queue a graph redraw, coalescing requests to at most one per GRAPH_REDRAW_MS"""
+        if self._graph_redraw_scheduled or not MATPLOTLIB_AVAILABLE:
+            return
+        self._graph_redraw_scheduled = True
+        if self.schedule_callback(GRAPH_REDRAW_MS, self._update_graph_timer) is None:
+            self._graph_redraw_scheduled = False
+    
     def _update_graph_timer(self):
         """Timer-based graph update"""
+        # Clear first so changes made during the redraw queue another one
+        self._graph_redraw_scheduled = False
         try:
-            if hasattr(self, 'canvas') and self.canvas:
-                self.update_graph(None)  # Call update_graph with dummy frame parameter
-                self.canvas.draw()  # Force canvas redraw
+            if self._graph_ready:
+                self.update_graph(None)  # Schedules its own draw_idle
         except Exception as e:
             print(f"Graph update error: {e}")
         
-        # Schedule next update in 100ms - use try/except to handle timer cleanup
-        try:
-            if hasattr(self, 'root') and self.root:
-                self.root.after(100, self._update_graph_timer)
-        except tk.TclError:
-            # Widget destroyed, stop timer
-            pass
-        
     def setup_text_graph(self, parent):
         """Setup text-based graph fallback"""
         self.graph_display = scrolledtext.ScrolledText(parent, height=15, width=60, font=("Courier", 9))
         self.graph_display.pack(fill="both", expand=True)
+    
+    def _append_text_graph(self, feedback):
+        """Append one feedback line to the text graph and trim to TEXT_GRAPH_MAX_LINES"""
+        elapsed = (time.monotonic_ns() - self.start_time_ns) / 1_000_000_000
+        display = self.graph_display
+        display.insert(tk.END, f"{elapsed:8.2f}s  {feedback.velocity:8.1f} RPM  "
+                               f"{feedback.position:7.1f}°  {feedback.torque:6.2f} A\n")
+        # Every line ends in a newline, so the last line before 'end' is empty
+        display.delete('1.0', f'end-{TEXT_GRAPH_MAX_LINES + 1}l')
+        display.see(tk.END)
         
     def update_graph(self, frame):
-        """Update matplotlib graph with dual Y-axes - robust version"""
+        """Update matplotlib graph with dual Y-axes - robust version
+        
+        The lines, legend and axis styling made in setup_matplotlib_graph are
+        kept; each redraw only swaps line data and rescales the Y axes.
+        """
         try:
-            # Graph update function is being called by Tkinter timer
-            # Verify we have data and attributes
-            if not hasattr(self, 'plot_time') or not hasattr(self, 'ax') or not hasattr(self, 'ax2'):
+            if not self._graph_ready:
                 return []
             
-            # Thread-safe access to plot data length
-            try:
-                data_length = len(self.plot_time) if hasattr(self, 'plot_time') and self.plot_time else 0
-            except:
-                data_length = 0
-            
-            # Graph update working
+            # Snapshot the samples once; the feedback thread keeps writing the ring
+            times, velocities, torques, positions = self.plot_data.arrays()
                 
-            if data_length == 0:
+            if len(times) == 0:
                 # Clear all plot lines
                 self.velocity_line.set_data([], [])
                 self.position_line.set_data([], [])  
                 self.torque_line.set_data([], [])
                 
-                # Clear axes
-                self.ax.clear()
-                self.ax2.clear()
-                
                 # Display "No data received" message in red
-                self.ax.text(0.5, 0.5, 'No data received', 
-                           transform=self.ax.transAxes, 
-                           fontsize=16, color='red', 
-                           ha='center', va='center',
-                           weight='bold')
-                
-                # Restore axis styling for dark theme
-                self.ax.set_facecolor('#1e1e1e')
-                self.ax.tick_params(colors='#e0e0e0')
-                self.ax.spines['bottom'].set_color('#5a5a5a')
-                self.ax.spines['top'].set_color('#5a5a5a') 
-                self.ax.spines['left'].set_color('#5a5a5a')
-                self.ax.spines['right'].set_color('#5a5a5a')
+                self._no_data_text.set_visible(True)
                 
                 # Set minimal axis ranges to prevent auto-scaling issues
                 self.ax.set_xlim(0, 1)
-                self.ax.set_ylim(0, 1)
+                self.ax.set_ylim(0, 1, auto=None)
                 
+                self.canvas.draw_idle()
                 return []
             
             # We have data - proceed to plot it
-            # Plotting data
-            
-            # Clear axes first to remove "No data received" text, then re-setup
-            self.ax.clear()
-            self.ax2.clear()
-            
-            # Re-create plot lines after clearing
-            self.velocity_line, = self.ax.plot([], [], '#4a9eff', linewidth=2, label='Velocity (RPM)')
-            self.position_line, = self.ax.plot([], [], '#ff6b6b', linewidth=2, label='Position (°)')
-            self.torque_line, = self.ax2.plot([], [], '#4ecdc4', linewidth=2, label='Torque (A)')
-            
-            # Re-setup axes styling
-            self.ax.set_facecolor('#1e1e1e')
-            self.ax2.set_facecolor('#1a1a1a')
-            self.ax.tick_params(colors='#e0e0e0')
-            self.ax2.tick_params(colors='#e0e0e0')
-            self.ax.set_xlabel('Time (s)', color='#e0e0e0')
-            self.ax.set_ylabel('Velocity/Position', color='#e0e0e0')
-            self.ax2.set_ylabel('Torque (A)', color='#e0e0e0')
-            self.ax.grid(True, color='#4a4a4a', alpha=0.5)
-            
-            # Ensure all data arrays have the same length as plot_time
-            min_length = len(self.plot_time)
-            if self.plot_velocity:
-                min_length = min(min_length, len(self.plot_velocity))
-            if self.plot_position:
-                min_length = min(min_length, len(self.plot_position))
-            if self.plot_torque:
-                min_length = min(min_length, len(self.plot_torque))
-            
-            # If data is inconsistent, trim to smallest common length
-            if min_length < len(self.plot_time):
-                self.plot_time = deque(list(self.plot_time)[-min_length:], maxlen=self.max_plot_points)
-                self.plot_velocity = deque(list(self.plot_velocity)[-min_length:], maxlen=self.max_plot_points)
-                self.plot_position = deque(list(self.plot_position)[-min_length:], maxlen=self.max_plot_points)
-                self.plot_torque = deque(list(self.plot_torque)[-min_length:], maxlen=self.max_plot_points)
-            
-            times = list(self.plot_time)
-            if not times:
-                return []
-            
-            lines = []
-            # Left axis data (velocity and position)
-            left_has_data = False
-            
-            try:
-                if self.show_velocity_var.get() and len(self.plot_velocity) >= len(times):
-                    velocity_data = list(self.plot_velocity)[:len(times)]
-                    self.velocity_line.set_data(times, velocity_data)
-                    lines.append(self.velocity_line)
-                    left_has_data = True
-                    # Velocity line updated successfully
-            except Exception as e:
-                print(f"Warning: Error updating velocity line: {e}")
-                
-            try:
-                if self.show_position_var.get() and len(self.plot_position) >= len(times):
-                    position_data = list(self.plot_position)[:len(times)]
-                    self.position_line.set_data(times, position_data)
-                    lines.append(self.position_line)
-                    left_has_data = True
-            except Exception as e:
-                print(f"Warning: Error updating position line: {e}")
-            
-            # Right axis data (torque)
-            right_has_data = False
-            try:
-                if self.show_torque_var.get() and len(self.plot_torque) >= len(times):
-                    torque_data = list(self.plot_torque)[:len(times)]
-                    self.torque_line.set_data(times, torque_data)
-                    lines.append(self.torque_line)
-                    right_has_data = True
-            except Exception as e:
-                print(f"Warning: Error updating torque line: {e}")
+            self._no_data_text.set_visible(False)
+            
+            # Only touch line visibility when a series checkbox actually changed
+            line_config = (self.show_velocity_var.get(),
+                           self.show_position_var.get(),
+                           self.show_torque_var.get())
+            if line_config != self._last_line_config:
+                self._last_line_config = line_config
+                self.velocity_line.set_visible(line_config[0])
+                self.position_line.set_visible(line_config[1])
+                self.torque_line.set_visible(line_config[2])
+            
+            self.velocity_line.set_data(times, velocities)
+            self.position_line.set_data(times, positions)
+            self.torque_line.set_data(times, torques)
+            lines = [line for line in (self.velocity_line, self.position_line, self.torque_line)
+                     if line.get_visible()]
                 
             # Update X-axis limits
             try:
-                if times:
-                    self.ax.set_xlim(max(0, times[0]), times[-1] + 1)
+                self.ax.set_xlim(max(0.0, float(times[0])), float(times[-1]) + 1)
             except Exception as e:
                 print(f"Warning: Error setting x-axis limits: {e}")
                 
-            # Update left axis scaling for velocity/position
-            if left_has_data:
-                try:
-                    all_left_data = []
-                    if self.show_velocity_var.get() and self.plot_velocity:
-                        all_left_data.extend([v for v in self.plot_velocity if isinstance(v, (int, float)) and not math.isnan(v) and not math.isinf(v)])
-                    if self.show_position_var.get() and self.plot_position:
-                        all_left_data.extend([p for p in self.plot_position if isinstance(p, (int, float)) and not math.isnan(p) and not math.isinf(p)])
-                    
-                    if all_left_data:
-                        y_min = min(all_left_data)
-                        y_max = max(all_left_data)
-                        margin = (y_max - y_min) * 0.1 if y_max != y_min else 1
-                        self.ax.set_ylim(y_min - margin, y_max + margin)
-                except Exception as e:
-                    print(f"Warning: Error scaling left axis: {e}")
-                    # Set default limits if scaling fails
-                    try:
-                        self.ax.set_ylim(-200, 400)
-                    except:
-                        pass
-            
-            # Update right axis scaling for torque independently
-            if right_has_data and self.plot_torque:
-                try:
-                    valid_torque = [t for t in self.plot_torque if isinstance(t, (int, float)) and not math.isnan(t) and not math.isinf(t)]
-                    if valid_torque:
-                        torque_min = min(valid_torque)
-                        torque_max = max(valid_torque)
-                        margin = (torque_max - torque_min) * 0.1 if torque_max != torque_min else 0.5
-                        self.ax2.set_ylim(torque_min - margin, torque_max + margin)
-                except Exception as e:
-                    print(f"Warning: Error scaling right axis: {e}")
-                    # Set default limits if scaling fails
-                    try:
-                        self.ax2.set_ylim(-10, 10)
-                    except:
-                        pass
+            # Rescale each Y axis from its visible lines only
+            try:
+                for axis in (self.ax, self.ax2):
+                    axis.relim(visible_only=True)
+                    axis.autoscale_view(scalex=False, scaley=True)
+            except Exception as e:
+                print(f"Warning: Error scaling axes: {e}")
                 
             # Use draw_idle for better performance
             try:
@@ -2093,7 +1123,7 @@ and power disconnection for immediate safety in any uncertain situation.
                 self.connection_status.config(text="Connected", foreground="green")
                 self.log_message(f"✅ Connected to {port_device} ({motor_type} detected)")
                 self.estop_button.config(state="normal")  # Enable E-stop button
-                self.status_conn_label.config(text="⚡ CONNECTED", fg="#66ff66")
+                self._set_status(self.status_conn_label, "⚡ CONNECTED", fg="#66ff66")
                 self.status_motor_type.config(text=motor_type, foreground="#66ff66")
                 
                 # Update velocity range based on motor type
@@ -2121,11 +1151,10 @@ and power disconnection for immediate safety in any uncertain situation.
                 return
             
             # Update plot data (thread-safe)
-            current_time = time.time() - self.start_time if hasattr(self, 'start_time') else 0
-            
-            if not hasattr(self, 'start_time'):
-                self.start_time = time.time()
-                current_time = 0
+            now_ns = time.monotonic_ns()
+            if not hasattr(self, 'start_time_ns'):
+                self.start_time_ns = now_ns
+            current_time = (now_ns - self.start_time_ns) / 1_000_000_000
             
             # Validate data values before appending
             if isinstance(feedback.velocity, (int, float)) and not math.isnan(feedback.velocity) and not math.isinf(feedback.velocity):
@@ -2143,30 +1172,55 @@ and power disconnection for immediate safety in any uncertain situation.
             else:
                 torque = 0.0
             
-            # Append validated data
-            self.plot_time.append(current_time)
-            self.plot_velocity.append(velocity)
-            self.plot_torque.append(torque)
-            self.plot_position.append(position)
+            # Store validated data
+            if self.plot_data is not None:
+                self.plot_data.push(current_time, velocity, torque, position)
             
             # Data is being populated correctly
             
             # Update metrics (thread-safe)
-            self.last_rx_time = time.time()
+            self.last_rx_time_ns = now_ns
             self.rx_count += 1
             
-            # Schedule GUI updates on main thread
-            if hasattr(self, 'root'):
+            # Schedule GUI updates on main thread. Feedback arriving before the
+            # update runs just replaces the pending sample.
+            self._pending_feedback = feedback
+            if hasattr(self, 'root') and not self._feedback_update_scheduled:
                 try:
-                    self.schedule_callback(0, lambda: self._update_gui_from_feedback(feedback))
+                    self._feedback_update_scheduled = True
+                    if self.schedule_callback(0, self._flush_pending_feedback) is None:
+                        self._feedback_update_scheduled = False
                 except Exception as e:
                     # Ignore errors if root is being destroyed
-                    pass
+                    self._feedback_update_scheduled = False
                     
         except Exception as e:
             print(f"Error in _on_motor_feedback: {e}")
             # Continue operation even if this feedback fails
     
+    def _flush_pending_feedback(self):
+        """Show the most recent feedback - runs on main thread"""
+        # Clear the flag before taking the sample so newer feedback schedules again
+        self._feedback_update_scheduled = False
+        feedback = self._pending_feedback
+        if feedback is not None:
+            self._update_gui_from_feedback(feedback)
+            if MATPLOTLIB_AVAILABLE:
+                self.request_graph_redraw()
+            else:
+                self._append_text_graph(feedback)
+    
+    def _set_status(self, label, text, **colors):
+        """Configure a status label only if its text or colors changed"""
+        state = (text, colors)
+        if self._last_status.get(label) == state:
+            return
+        options = ['-text', text]
+        for option, value in colors.items():
+            options += ('-' + option, value)
+        self._tk_call(label._w, 'configure', *options)
+        self._last_status[label] = state
+    
     def _update_gui_from_feedback(self, feedback):
         """Update GUI elements from feedback - runs on main thread"""
         try:
@@ -2184,23 +1238,23 @@ and power disconnection for immediate safety in any uncertain situation.
             if hasattr(feedback, 'temperature') and feedback.temperature > 0:
                 temp_color = "#ff6666" if feedback.temperature > 70 else "#ff9966" if feedback.temperature > 50 else "#66ccff"
                 if hasattr(self, 'status_temperature'):
-                    self.status_temperature.config(text=f"{feedback.temperature}°C", foreground=temp_color)
+                    self._set_status(self.status_temperature, f"{feedback.temperature}°C", foreground=temp_color)
                 if hasattr(self, 'status_motor_temp'):
-                    self.status_motor_temp.config(text=f"🌡️ {feedback.temperature}°C", fg=temp_color)
+                    self._set_status(self.status_motor_temp, f"🌡️ {feedback.temperature}°C", fg=temp_color)
             else:
                 # No temperature data
                 if hasattr(self, 'status_temperature'):
-                    self.status_temperature.config(text="N/A", foreground="gray")
+                    self._set_status(self.status_temperature, "N/A", foreground="gray")
                 if hasattr(self, 'status_motor_temp'):
-                    self.status_motor_temp.config(text="🌡️ --°C", fg="#888888")
+                    self._set_status(self.status_motor_temp, "🌡️ --°C", fg="#888888")
             
             # Update connection screen status display
             if hasattr(self, 'status_velocity'):
-                self.status_velocity.config(text=f"{feedback.velocity:.1f} RPM")
+                self._set_status(self.status_velocity, f"{feedback.velocity:.1f} RPM")
             if hasattr(self, 'status_position'):
-                self.status_position.config(text=f"{feedback.position:.1f}°")
+                self._set_status(self.status_position, f"{feedback.position:.1f}°")
             if hasattr(self, 'status_torque'):
-                self.status_torque.config(text=f"{feedback.torque:.2f} A")
+                self._set_status(self.status_torque, f"{feedback.torque:.2f} A")
                 
         except Exception as e:
             # Ignore GUI update errors during shutdown
@@ -2220,7 +1274,7 @@ and power disconnection for immediate safety in any uncertain situation.
     def _on_command_sent(self):
         """Handle command sent notification from queue with robust exception handling"""
         try:
-            self.last_tx_time = time.time()
+            self.last_tx_time_ns = time.monotonic_ns()
         except Exception:
             pass  # Ignore time update errors
     
@@ -2239,7 +1293,7 @@ and power disconnection for immediate safety in any uncertain situation.
             self.motor_controller = None
         self.connection_status.config(text="Disconnected", foreground="red")
         self.estop_button.config(state="disabled")  # Disable E-stop button
-        self.status_conn_label.config(text="⚡ DISCONNECTED", fg="#ff6666")
+        self._set_status(self.status_conn_label, "⚡ DISCONNECTED", fg="#ff6666")
         self.status_motor_type.config(text="Not Connected", foreground="#ffcc66")
         self.log_message("🔌 Disconnected")
         
@@ -2359,30 +1413,21 @@ and power disconnection for immediate safety in any uncertain situation.
         self.vcmd_decimal = (self.root.register(self.validate_decimal), '%P')
     
     def validate_integer(self, value_if_allowed):
-        """Validate integer input"""
+        """Validate integer input (runs on every keystroke, so no exceptions)"""
         if value_if_allowed == '' or value_if_allowed == '-':
             return True
-        try:
-            int(value_if_allowed)
-            return True
-        except ValueError:
-            return False
+        digits = value_if_allowed[1:] if value_if_allowed[0] == '-' else value_if_allowed
+        return digits.isdecimal()
     
     def validate_decimal(self, value_if_allowed):
         """Validate decimal input with maximum 1 decimal place"""
         if value_if_allowed == '' or value_if_allowed == '-' or value_if_allowed == '.':
             return True
-        try:
-            # Check if it's a valid float
-            float(value_if_allowed)
-            # Check decimal places
-            if '.' in value_if_allowed:
-                decimal_part = value_if_allowed.split('.')[1]
-                if len(decimal_part) > 1:
-                    return False
-            return True
-        except ValueError:
+        number = value_if_allowed[1:] if value_if_allowed[0] == '-' else value_if_allowed
+        whole, _, decimal_part = number.partition('.')
+        if len(decimal_part) > 1:
             return False
+        return (whole + decimal_part).isdecimal()
     
     def _initialize_position_slider(self, motor_id):
         """Initialize position slider to current motor position without triggering commands"""
@@ -2561,8 +1606,20 @@ and power disconnection for immediate safety in any uncertain situation.
         except Exception as e:
             self.log_message(f"❌ Movement check failed: {e}")
 
+    def _reset_drive_controls(self):
+        """Drop pending slider sends and zero the velocity and current controls
+        
+        Keeps a later slider or entry commit from re-sending the pre-stop value.
+        """
+        for slider_type, callback_id in self._pending_send.items():
+            self.cancel_callback(callback_id)
+            self._pending_send[slider_type] = None
+        self.velocity_var.set(0)
+        self.current_var.set(0.0)
+    
     def emergency_stop(self):
         """Emergency stop motor"""
+        self._reset_drive_controls()
         if not self.motor_controller or not self.motor_controller.is_connected:
             return
             
@@ -2572,6 +1629,7 @@ and power disconnection for immediate safety in any uncertain situation.
     
     def emergency_stop_all(self):
         """Emergency stop ALL motors when E-stop button pressed"""
+        self._reset_drive_controls()
         if not self.motor_controller or not self.motor_controller.is_connected:
             return
         
@@ -2596,16 +1654,30 @@ and power disconnection for immediate safety in any uncertain situation.
         
         self.log_message("✅ Emergency stop command sent to all motors")
 
-    def _on_slider_press(self, slider_type):
-        """Handle when user starts dragging a slider"""
-        self._slider_dragging[slider_type] = True
+    def _throttled_send(self, slider_type):
+        """Coalesce slider writes into one command per SLIDER_SEND_MS window
+        
+        A pending send is left in place rather than pushed back, so a continuous
+        drag still streams; the sender reads the latest value when it fires.
+        """
+        # Feedback-driven updates move the slider without commanding the motor
+        if slider_type == 'position' and self._updating_position_from_feedback:
+            return
+        
+        if self._pending_send[slider_type] is not None:
+            return
+        sender = getattr(self, f'_send_slider_{slider_type}')
+        self._pending_send[slider_type] = self.schedule_callback(SLIDER_SEND_MS, sender)
     
-    def _on_velocity_release(self):
-        """Handle velocity slider release - send command via queue"""
-        try:
-            self._slider_dragging['velocity'] = False
-        except Exception:
-            pass  # Ignore slider state errors
+    def _send_slider_now(self, slider_type):
+        """Send a control's value immediately, replacing any pending throttled send"""
+        self.cancel_callback(self._pending_send[slider_type])
+        self._pending_send[slider_type] = None
+        getattr(self, f'_send_slider_{slider_type}')()
+    
+    def _send_slider_velocity(self):
+        """Send the velocity slider value - queue handles mode switching"""
+        self._pending_send['velocity'] = None
         
         try:
             if not self.motor_controller or not self.motor_controller.is_connected:
@@ -2621,9 +1693,11 @@ and power disconnection for immediate safety in any uncertain situation.
             if hasattr(self, 'mode_display'):
                 self.mode_display.config(foreground="#3a5f9f")  # Blue for velocity
                 
+        except tk.TclError:
+            pass  # Entry is mid-edit (empty or a lone '-'); wait for a number
         except Exception as e:
             # Log error but don't crash the GUI
-            print(f"Error in velocity slider release: {e}")
+            print(f"Error in velocity slider send: {e}")
             try:
                 self.log_message(f"⚠️ Velocity slider error: {e}")
             except Exception:
@@ -2649,12 +1723,9 @@ and power disconnection for immediate safety in any uncertain situation.
         self.motor_controller.set_velocity(motor_id, velocity)
         self.log_message(f"🏃 Set velocity: {velocity} RPM")
 
-    def _on_position_release(self):
-        """Handle position slider release - send command via queue"""
-        try:
-            self._slider_dragging['position'] = False
-        except Exception:
-            pass  # Ignore slider state errors
+    def _send_slider_position(self):
+        """Send the position slider value - queue handles ramping and mode switching"""
+        self._pending_send['position'] = None
         
         try:
             # Skip if we're updating from feedback
@@ -2667,8 +1738,9 @@ and power disconnection for immediate safety in any uncertain situation.
             motor_id = self.motor_id_var.get()
             position = round(self.position_var.get(), 1)
             
-            # Round the displayed value to 1 decimal place
-            self.position_var.set(position)
+            # Round the displayed value to 1 decimal place; only write on change
+            if position != self.position_var.get():
+                self.position_var.set(position)
             
             # Send command directly - queue handles velocity ramping and mode switching
             self.motor_controller.set_position(motor_id, position)
@@ -2677,9 +1749,11 @@ and power disconnection for immediate safety in any uncertain situation.
             if hasattr(self, 'mode_display'):
                 self.mode_display.config(foreground="#9f3a3a")  # Red for position
                 
+        except tk.TclError:
+            pass  # Entry is mid-edit (empty or a lone '-'); wait for a number
         except Exception as e:
             # Log error but don't crash the GUI
-            print(f"Error in position slider release: {e}")
+            print(f"Error in position slider send: {e}")
             try:
                 self.log_message(f"⚠️ Position slider error: {e}")
             except Exception:
@@ -2770,12 +1844,9 @@ and power disconnection for immediate safety in any uncertain situation.
         else:
             self.log_message("❌ Position command failed")
 
-    def _on_current_release(self):
-        """Handle current slider release - send command via queue"""
-        try:
-            self._slider_dragging['current'] = False
-        except Exception:
-            pass  # Ignore slider state errors
+    def _send_slider_current(self):
+        """Send the current slider value - queue handles mode switching"""
+        self._pending_send['current'] = None
         
         try:
             if not self.motor_controller or not self.motor_controller.is_connected:
@@ -2784,8 +1855,9 @@ and power disconnection for immediate safety in any uncertain situation.
             motor_id = self.motor_id_var.get()
             current = round(self.current_var.get(), 1)
             
-            # Round the displayed value to 1 decimal place
-            self.current_var.set(current)
+            # Round the displayed value to 1 decimal place; only write on change
+            if current != self.current_var.get():
+                self.current_var.set(current)
             
             # Send command directly - queue handles mode switching
             self.motor_controller.set_current(motor_id, current)
@@ -2794,9 +1866,11 @@ and power disconnection for immediate safety in any uncertain situation.
             if hasattr(self, 'mode_display'):
                 self.mode_display.config(foreground="#3a9f6b")  # Green for current
                 
+        except tk.TclError:
+            pass  # Entry is mid-edit (empty or a lone '-'); wait for a number
         except Exception as e:
             # Log error but don't crash the GUI
-            print(f"Error in current slider release: {e}")
+            print(f"Error in current slider send: {e}")
             try:
                 self.log_message(f"⚠️ Current slider error: {e}")
             except Exception:
@@ -2899,49 +1973,65 @@ and power disconnection for immediate safety in any uncertain situation.
 
     def update_status_display(self, feedback):
         """Update status display"""
-        self.status_velocity.config(text=f"{feedback.velocity:.1f} RPM")
-        self.status_position.config(text=f"{feedback.position:.1f}°")
-        self.status_torque.config(text=f"{feedback.torque:.2f} A")
+        self._set_status(self.status_velocity, f"{feedback.velocity:.1f} RPM")
+        self._set_status(self.status_position, f"{feedback.position:.1f}°")
+        self._set_status(self.status_torque, f"{feedback.torque:.2f} A")
         
         
         # Update temperature display
         if feedback.temperature > 0:
             temp_color = "red" if feedback.temperature > 70 else "orange" if feedback.temperature > 50 else "blue"
-            self.status_temperature.config(text=f"{feedback.temperature}°C", foreground=temp_color)
+            self._set_status(self.status_temperature, f"{feedback.temperature}°C", foreground=temp_color)
         else:
-            self.status_temperature.config(text="N/A", foreground="gray")
+            self._set_status(self.status_temperature, "N/A", foreground="gray")
 
     def clear_graph(self):
         """Clear graph data"""
-        self.plot_time.clear()
-        self.plot_velocity.clear()
-        self.plot_position.clear()
-        self.plot_torque.clear()
+        if self.plot_data is not None:
+            self.plot_data.clear()
+            self.request_graph_redraw()
         
         if not MATPLOTLIB_AVAILABLE and hasattr(self, 'graph_display'):
             self.graph_display.delete(1.0, tk.END)
 
     def clear_log(self):
         """Clear connection log"""
+        self._log_queue.clear()
         self.connection_log.delete(1.0, tk.END)
 
     def log_message(self, message):
-        """Log message with timestamp"""
+        """Log message with timestamp
+        
+        Lines are queued and written to the log widget in batches every LOG_FLUSH_MS.
+        """
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}\n"
-        self.connection_log.insert(tk.END, full_message)
-        self.connection_log.see(tk.END)
-        
-        # Auto-cleanup: Keep only last 100 lines
-        lines = self.connection_log.get(1.0, tk.END).split('\n')
-        if len(lines) > 100:
-            self.connection_log.delete(1.0, tk.END)
-            self.connection_log.insert(1.0, '\n'.join(lines[-100:]))
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+        
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            if self.schedule_callback(LOG_FLUSH_MS, self._flush_log) is None:
+                self._log_flush_scheduled = False
+    
+    def _flush_log(self):
+        """Insert all queued log lines with one insert and trim to LOG_MAX_LINES"""
+        self._log_flush_scheduled = False
+        queue = self._log_queue
+        lines = []
+        while queue:
+            lines.append(queue.popleft())
+        if not lines:
+            return
+        
+        log = self.connection_log
+        log.insert(tk.END, ''.join(lines))
+        # Every line ends in a newline, so the last line before 'end' is empty
+        log.delete('1.0', f'end-{LOG_MAX_LINES + 1}l')
+        log.see(tk.END)
 
     def _handle_sigint(self, signum, frame):
-        """Handle Ctrl+C for immediate shutdown with robust exception handling"""
+        """Handle Ctrl+C by flagging it for _poll_sigint; a second Ctrl+C forces exit"""
         try:
-            if getattr(self, '_shutdown_in_progress', False):
+            if _sigint_flag.is_set() or getattr(self, '_shutdown_in_progress', False):
                 # Force exit if already shutting down
                 try:
                     sys.exit(1)
@@ -2951,6 +2041,14 @@ and power disconnection for immediate safety in any uncertain situation.
         except Exception:
             pass
         
+        _sigint_flag.set()
+    
+    def _poll_sigint(self):
+        """Run the Ctrl+C shutdown on the Tk thread once the signal flag is set"""
+        if not _sigint_flag.is_set():
+            self.schedule_callback(SIGINT_POLL_MS, self._poll_sigint)
+            return
+        
         try:
             self._shutdown_in_progress = True
         except Exception:
@@ -2976,20 +2074,11 @@ and power disconnection for immediate safety in any uncertain situation.
         except Exception:
             pass
         
-        # Schedule GUI shutdown on main thread without tracking (emergency case)
-        try:
-            if hasattr(self, 'root'):
-                self.root.after(0, self._emergency_shutdown)
-        except Exception:
-            # If GUI is not responsive, force exit
-            try:
-                sys.exit(0)
-            except Exception:
-                import os
-                os._exit(0)
+        # Already on the Tk thread, so shut the GUI down directly
+        self._emergency_shutdown()
     
     def _emergency_shutdown(self):
-        """Emergency shutdown called from signal handler with robust exception handling"""
+        """Emergency shutdown after Ctrl+C with robust exception handling"""
         try:
             # Set shutdown flag first to prevent new callbacks
             self._shutdown_in_progress = True
@@ -3044,10 +2133,10 @@ and power disconnection for immediate safety in any uncertain situation.
         if not self.status_update_active or self._shutdown_in_progress:
             return
             
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
         
         # Calculate message rates every second
-        if current_time - self.last_rate_calc >= 1.0:
+        if now_ns - self.last_rate_calc_ns >= 1_000_000_000:
             # Get stats from command queue if available
             if self.motor_controller and hasattr(self.motor_controller, 'get_stats'):
                 stats = self.motor_controller.get_stats()
@@ -3069,26 +2158,26 @@ and power disconnection for immediate safety in any uncertain situation.
                 self.rx_count = 0
                 self.tx_count = 0
             
-            self.last_rate_calc = current_time
+            self.last_rate_calc_ns = now_ns
             
             # Update rate displays
-            self.status_rx_rate.config(text=f"↓ {self.rx_rate} msg/s")
-            self.status_tx_rate.config(text=f"↑ {self.tx_rate} msg/s")
+            self._set_status(self.status_rx_rate, f"↓ {self.rx_rate} msg/s")
+            self._set_status(self.status_tx_rate, f"↑ {self.tx_rate} msg/s")
         
         # Update last message times
-        if self.last_rx_time > 0:
-            rx_age = current_time - self.last_rx_time
+        if self.last_rx_time_ns > 0:
+            rx_age = (now_ns - self.last_rx_time_ns) / 1_000_000_000
             if rx_age < 1:
-                self.status_rx_label.config(text=f"RX: {rx_age*1000:.0f}ms", fg="#66ff66")
+                self._set_status(self.status_rx_label, f"RX: {rx_age*1000:.0f}ms", fg="#66ff66")
             else:
-                self.status_rx_label.config(text=f"RX: {rx_age:.1f}s", fg="#ffff66")
+                self._set_status(self.status_rx_label, f"RX: {rx_age:.1f}s", fg="#ffff66")
         
-        if self.last_tx_time > 0:
-            tx_age = current_time - self.last_tx_time
+        if self.last_tx_time_ns > 0:
+            tx_age = (now_ns - self.last_tx_time_ns) / 1_000_000_000
             if tx_age < 1:
-                self.status_tx_label.config(text=f"TX: {tx_age*1000:.0f}ms", fg="#6666ff")
+                self._set_status(self.status_tx_label, f"TX: {tx_age*1000:.0f}ms", fg="#6666ff")
             else:
-                self.status_tx_label.config(text=f"TX: {tx_age:.1f}s", fg="#9999ff")
+                self._set_status(self.status_tx_label, f"TX: {tx_age:.1f}s", fg="#9999ff")
         
         # Schedule next update
         self.schedule_status_update()
@@ -3105,12 +2194,12 @@ and power disconnection for immediate safety in any uncertain situation.
     def on_motor_feedback(self, motor_id, feedback):
         """Handle motor feedback for metrics"""
         self.rx_count += 1
-        self.last_rx_time = time.time()
+        self.last_rx_time_ns = time.monotonic_ns()
         
         # Update temperature in status bar
         if feedback.temperature > 0:
             temp_color = "#ff6666" if feedback.temperature > 70 else "#ff9966" if feedback.temperature > 50 else "#66ccff"
-            self.status_motor_temp.config(text=f"🌡️ {feedback.temperature}°C", fg=temp_color)
+            self._set_status(self.status_motor_temp, f"🌡️ {feedback.temperature}°C", fg=temp_color)
     
     def on_closing(self):
         """Handle window closing"""
@@ -8,6 +8,7 @@ but with the proven protocol implementation reverse-engineered from the hardware
 """
 
 import serial
+import struct
 import time
 import threading
 import signal
@@ -42,6 +43,13 @@ class DDSM210CommandType(IntEnum):
     EMERGENCY_BRAKE = 0xFF  # Emergency brake (special data[7] value)
 
 
+# Velocity frame without CRC: ID, 0x64, signed 0.1 RPM units (big-endian), five zero bytes
+_VELOCITY_STRUCT = struct.Struct('>BBh5x')
+
+# Signed 0.1 RPM velocity in bytes 2-3 of a 0x64 response
+_VELOCITY_FIELD = struct.Struct('>h')
+
+
 class DDSM210:
     """Core library for DDSM210 motor control - compatible with DDSM115 interface"""
     
@@ -258,19 +266,9 @@ class DDSM210:
             if self.motor_id not in self.current_mode:
                 self._initialize_motor()
             
-            # Convert RPM to velocity units (0.1 RPM resolution)
-            velocity_units = int(rpm * 10)
-            if velocity_units < 0:
-                velocity_units = velocity_units & 0xFFFF  # Two's complement
-            
-            # DDSM210 uses big-endian format for velocity
-            high_byte = (velocity_units >> 8) & 0xFF
-            low_byte = velocity_units & 0xFF
-            
-            # Build command
-            cmd = [0x01, 0x64, high_byte, low_byte, 0x00, 0x00, 0x00, 0x00, 0x00]
-            crc = self._calculate_crc(cmd)
-            cmd.append(crc)
+            # Convert RPM to velocity units (0.1 RPM resolution), big-endian signed
+            cmd = _VELOCITY_STRUCT.pack(0x01, DDSM210CommandType.DRIVE_MOTOR, int(rpm * 10))
+            cmd += bytes((self._calculate_crc(cmd),))
             
             # Send command
             response = self._send_raw_command(cmd)
@@ -279,7 +277,7 @@ class DDSM210:
             if response:
                 feedback = MotorFeedback()
                 feedback.raw_data = response
-                feedback.timestamp = time.time()
+                feedback.timestamp = time.monotonic_ns()
                 feedback.velocity = rpm  # Use commanded velocity as feedback
                 feedback.position = 0.0  # DDSM210 doesn't provide position
                 feedback.torque = 0.0    # DDSM210 doesn't provide torque
@@ -390,7 +388,7 @@ class DDSM210:
             
             # Return current motor state feedback
             feedback = MotorFeedback()
-            feedback.timestamp = time.time()
+            feedback.timestamp = time.monotonic_ns()
             feedback.velocity = self._current_velocity  # Use commanded velocity
             feedback.position = 0.0  # DDSM210 doesn't provide position
             feedback.torque = 0.0    # DDSM210 doesn't provide torque
@@ -408,7 +406,7 @@ class DDSM210:
         """Parse DDSM210 response into MotorFeedback structure"""
         feedback = MotorFeedback()
         feedback.raw_data = response
-        feedback.timestamp = time.time()
+        feedback.timestamp = time.monotonic_ns()
         
         # Initialize with default values
         feedback.velocity = 0.0
@@ -422,9 +420,7 @@ class DDSM210:
                 if response[1] == 0x64:  # Velocity command response
                     # For DDSM210, the response typically echoes back the command
                     # The actual velocity might be in the response, let's parse it
-                    velocity_raw = (response[2] << 8) | response[3]
-                    if velocity_raw > 32767:  # Handle negative values (two's complement)
-                        velocity_raw -= 65536
+                    velocity_raw, = _VELOCITY_FIELD.unpack_from(response, 2)
                     feedback.velocity = velocity_raw / 10.0  # Convert to RPM (0.1 RPM resolution)
                     
                     # DDSM210 response parsing (currently not used - we track commanded velocity instead)
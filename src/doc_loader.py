@@ -10,6 +10,18 @@ from pathlib import Path
 from typing import Dict, Optional
 
 
+# Markdown-to-plain-text rules, compiled once at import
+_HEADING_RE = re.compile(r'^(#{1,3}) (.*)', re.MULTILINE)
+_HEADING_MARKERS = {1: '█', 2: '◆', 3: '▪'}
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_CODE_BLOCK_RE = re.compile(r'```.*?\n(.*?)```', re.DOTALL)
+_INLINE_CODE_RE = re.compile(r'`(.*?)`')
+_LINK_RE = re.compile(r'\[(.*?)\]\((.*?)\)')
+_BULLET_RE = re.compile(r'^- (.*)', re.MULTILINE)
+_NUMBERED_RE = re.compile(r'^\d+\. (.*)', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
 class DocumentationLoader:
     """Loads and processes markdown documentation files"""
     
@@ -38,6 +50,19 @@ class DocumentationLoader:
             "troubleshooting": "troubleshooting.md"
         }
     
+    def path_for(self, doc_name: str) -> Optional[Path]:
+        """Get the source file path for a document
+        
+        Args:
+            doc_name: Name of document (key from doc_files)
+            
+        Returns:
+            Path to the markdown file, or None if the document is unknown
+        """
+        if doc_name not in self.doc_files:
+            return None
+        return self.docs_dir / self.doc_files[doc_name]
+    
     def load_document(self, doc_name: str, use_cache: bool = True) -> str:
         """Load a documentation file
         
@@ -60,8 +85,7 @@ class DocumentationLoader:
             if not file_path.exists():
                 return f"❌ Documentation file not found: {file_path}\n\nPlease ensure the docs directory contains the required markdown files."
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text(file_path)
             
             # Process markdown for tkinter display
             processed_content = self._process_markdown(content)
@@ -75,6 +99,30 @@ class DocumentationLoader:
         except Exception as e:
             return f"❌ Error loading documentation: {e}\n\nFile: {file_path}"
     
+    def _read_text(self, file_path: Path) -> str:
+        """Read a UTF-8 text file with a single pre-sized read
+        
+        Args:
+            file_path: File to read
+            
+        Returns:
+            File content with line endings normalized to LF
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size)
+            # Regular files normally return everything at once; keep reading if not
+            while len(data) < size:
+                chunk = os.read(fd, size - len(data))
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            os.close(fd)
+        
+        return data.decode('utf-8', 'replace').replace('\r\n', '\n').replace('\r', '\n')
+    
     def _process_markdown(self, content: str) -> str:
         """Process markdown content for tkinter text widget display
         
@@ -87,24 +135,23 @@ class DocumentationLoader:
         # Remove markdown syntax while preserving structure
         processed = content
         
-        # Convert headers (keep structure but remove markdown)
-        processed = re.sub(r'^### (.*)', r'▪ \1', processed, flags=re.MULTILINE)
-        processed = re.sub(r'^## (.*)', r'◆ \1', processed, flags=re.MULTILINE)
-        processed = re.sub(r'^# (.*)', r'█ \1', processed, flags=re.MULTILINE)
+        # Convert headers (keep structure but remove markdown), all levels in one pass
+        processed = _HEADING_RE.sub(
+            lambda m: f'{_HEADING_MARKERS[len(m.group(1))]} {m.group(2)}', processed)
         
         # Convert bold text
-        processed = re.sub(r'\*\*(.*?)\*\*', r'\1', processed)
+        processed = _BOLD_RE.sub(r'\1', processed)
         
         # Convert code blocks (preserve monospace appearance)
-        processed = re.sub(r'```.*?\n(.*?)```', r'\1', processed, flags=re.DOTALL)
-        processed = re.sub(r'`(.*?)`', r'[\1]', processed)
+        processed = _CODE_BLOCK_RE.sub(r'\1', processed)
+        processed = _INLINE_CODE_RE.sub(r'[\1]', processed)
         
         # Convert links (keep text, note URL)
-        processed = re.sub(r'\[(.*?)\]\((.*?)\)', r'\1 (→ \2)', processed)
+        processed = _LINK_RE.sub(r'\1 (→ \2)', processed)
         
         # Convert lists
-        processed = re.sub(r'^- (.*)', r'  • \1', processed, flags=re.MULTILINE)
-        processed = re.sub(r'^\d+\. (.*)', r'  \1', processed, flags=re.MULTILINE)
+        processed = _BULLET_RE.sub(r'  • \1', processed)
+        processed = _NUMBERED_RE.sub(r'  \1', processed)
         
         # Convert tables (enhanced formatting with proper borders)
         lines = processed.split('\n')
@@ -222,7 +269,7 @@ class DocumentationLoader:
         processed = '\n'.join(table_lines)
         
         # Clean up extra newlines
-        processed = re.sub(r'\n{3,}', r'\n\n', processed)
+        processed = _BLANK_LINES_RE.sub('\n\n', processed)
         
         return processed.strip()
     
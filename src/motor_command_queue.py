@@ -69,6 +69,7 @@ class MotorCommandQueue:
         # Latest command tracking (keep only the most recent command of each type)
         self.latest_commands: Dict[tuple, MotorCommand] = {}  # Key: (motor_id, command_type)
         self.command_lock = threading.Lock()
+        self.command_ready = threading.Event()  # Set when a command is queued; wakes the worker
         
         # Stats
         self.commands_processed = 0
@@ -163,6 +164,7 @@ class MotorCommandQueue:
     def disconnect(self):
         """Disconnect and stop processing"""
         self.running = False
+        self.command_ready.set()  # Wake an idle command worker so it sees running=False
         
         # Stop motor first
         if hasattr(self, 'motor') and self.motor.is_connected:
@@ -402,6 +404,8 @@ class MotorCommandQueue:
             if cmd.priority >= 3:
                 priority = (-cmd.priority, cmd.timestamp)
                 self.command_queue.put((priority, cmd))
+        
+        self.command_ready.set()
     
     def _command_worker(self):
         """Main command processing worker with robust exception handling"""
@@ -444,7 +448,11 @@ class MotorCommandQueue:
                         continue
                 
                 if cmd is None:
-                    time.sleep(0.01)  # 100Hz when no commands
+                    # Sleep until a command is queued; the timeout only bounds shutdown checks.
+                    # Clearing after the wait is safe: anything queued since is still in
+                    # latest_commands and gets picked up on the next pass.
+                    self.command_ready.wait(0.1)
+                    self.command_ready.clear()
                     consecutive_errors = 0  # Reset error counter when idle
                     continue
                 
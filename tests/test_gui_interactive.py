@@ -56,20 +56,16 @@ class GUITester:
             print(f"   Setting {slider_name} from {initial_value} to {target_value}")
             slider_var.set(target_value)
             
-            # Simulate button press event
-            if hasattr(self.gui, '_on_slider_press'):
-                self.gui._on_slider_press(slider_name)
-            
             # Small delay to simulate user dragging time
             time.sleep(0.1)
             
-            # Simulate button release event (this should trigger the command)
-            release_method = getattr(self.gui, f'_on_{slider_name}_release', None)
-            if release_method:
-                print(f"   Triggering {slider_name} release handler...")
-                release_method()
+            # Fire the throttled send now (this should trigger the command)
+            send_method = getattr(self.gui, f'_send_slider_{slider_name}', None)
+            if send_method:
+                print(f"   Triggering {slider_name} send handler...")
+                send_method()
             else:
-                self.issues_found.append(f"❌ No release handler found for {slider_name}")
+                self.issues_found.append(f"❌ No send handler found for {slider_name}")
                 return False
             
             # Monitor response time and behavior
@@ -102,13 +98,13 @@ class GUITester:
         print(f"📊 Monitoring graph updates for {duration}s...")
         
         # Get initial plot data length
-        initial_data_count = len(self.gui.plot_time) if hasattr(self.gui, 'plot_time') else 0
+        initial_data_count = len(self.gui.plot_data) if getattr(self.gui, 'plot_data', None) is not None else 0
         initial_time = time.time()
         
         time.sleep(duration)
         
         # Check if data was added
-        final_data_count = len(self.gui.plot_time) if hasattr(self.gui, 'plot_time') else 0
+        final_data_count = len(self.gui.plot_data) if getattr(self.gui, 'plot_data', None) is not None else 0
         
         if final_data_count <= initial_data_count:
             self.issues_found.append("❌ Graph not updating - no new data points added")
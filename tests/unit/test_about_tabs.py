@@ -0,0 +1,104 @@
+"""
+Unit tests for About tab document caching
+Tests document loading and release without creating any Tk windows
+"""
+
+import os
+
+import pytest
+
+about_tabs = pytest.importorskip("about_tabs")
+
+from about_tabs import AboutTabs
+from doc_loader import DocumentationLoader
+
+
+@pytest.fixture
+def tabs(tmp_path, monkeypatch):
+    """AboutTabs with only its document cache state, backed by a temp docs dir"""
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "system_info.md").write_text("# Title\n\n- item\n", encoding="utf-8")
+    monkeypatch.setattr(about_tabs, "DOC_CACHE_DIR", tmp_path / "cache")
+
+    instance = AboutTabs.__new__(AboutTabs)
+    instance.doc_loader = DocumentationLoader(str(docs_dir))
+    instance._doc_cache = {}
+    instance._doc_mmaps = {}
+    instance._doc_locks = {}
+    yield instance
+    for _, doc_mmap in instance._doc_mmaps.values():
+        doc_mmap.close()
+
+
+class TestDocumentCache:
+    """Test documents are cached until a widget holds them"""
+
+    @pytest.mark.unit
+    def test_get_doc_caches_content(self, tabs):
+        """Test a loaded document is kept in the in-memory cache"""
+        content = tabs._get_doc("system_info")
+        assert content == "█ Title\n\n  • item"
+        assert tabs._doc_cache["system_info"][1] is content
+
+    @pytest.mark.unit
+    def test_release_doc_reloads_from_mapped_cache(self, tabs):
+        """Test a released document is dropped and can still be read again"""
+        content = tabs._get_doc("system_info")
+        tabs._release_doc("system_info")
+        assert "system_info" not in tabs._doc_cache
+        assert "system_info" in tabs._doc_mmaps
+
+        assert tabs._get_doc("system_info") == content
+
+
+class TestCacheKey:
+    """Test cache files are only reused for the exact source and loader they came from"""
+
+    @staticmethod
+    def make_tabs(docs_dir):
+        instance = AboutTabs.__new__(AboutTabs)
+        instance.doc_loader = DocumentationLoader(str(docs_dir))
+        instance._doc_cache = {}
+        instance._doc_mmaps = {}
+        instance._doc_locks = {}
+        return instance
+
+    @staticmethod
+    def close(instance):
+        for _, doc_mmap in instance._doc_mmaps.values():
+            doc_mmap.close()
+
+    @pytest.mark.unit
+    def test_other_checkout_with_older_source(self, tmp_path, monkeypatch):
+        """Test a second doc tree never reads the first tree's cached render"""
+        monkeypatch.setattr(about_tabs, "DOC_CACHE_DIR", tmp_path / "cache")
+        trees = {}
+        for name, mtime in (("a", 2_000_000_000), ("b", 1_000_000_000)):
+            docs_dir = tmp_path / name / "docs"
+            docs_dir.mkdir(parents=True)
+            source = docs_dir / "system_info.md"
+            source.write_text(f"Version {name.upper()}\n", encoding="utf-8")
+            os.utime(source, (mtime, mtime))
+            trees[name] = self.make_tabs(docs_dir)
+
+        try:
+            assert trees["a"]._get_doc("system_info") == "Version A"
+            assert trees["b"]._get_doc("system_info") == "Version B"
+        finally:
+            for instance in trees.values():
+                self.close(instance)
+
+    @pytest.mark.unit
+    def test_loader_change_invalidates(self, tabs, monkeypatch):
+        """Test a different loader digest re-renders instead of reusing the file"""
+        tabs._get_doc("system_info")
+        tabs._release_doc("system_info")
+        self.close(tabs)
+        tabs._doc_mmaps.clear()
+        monkeypatch.setattr(about_tabs, "_LOADER_DIGEST", "changed")
+        monkeypatch.setattr(tabs.doc_loader, "load_document",
+                            lambda doc_name, use_cache=True: "re-rendered")
+
+        assert tabs._get_doc("system_info") == "re-rendered"
+        assert len(list(about_tabs.DOC_CACHE_DIR.glob("system_info-*.txt"))) == 1
@@ -0,0 +1,452 @@
+"""
+Unit tests for DDSM115 protocol encoding
+Tests packet CRC and framing without requiring hardware
+"""
+
+import pytest
+
+from ddsm115 import DDSM115, CommandType, MotorFeedback, MotorMode, INTER_FRAME_GAP
+
+
+def reference_crc8(data):
+    """Bit-by-bit CRC-8/MAXIM-DOW used as the reference implementation"""
+    crc = 0x00
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x01:
+                crc = (crc >> 1) ^ 0x8C
+            else:
+                crc >>= 1
+    return crc
+
+
+def legacy_packet(motor_id, command, data=()):
+    """Build a packet the way send_packet always has: [ID, CMD, DATA[7], CRC]"""
+    packet = [motor_id, command] + list(data)[:7]
+    packet += [0x00] * (9 - len(packet))
+    return bytes(packet + [reference_crc8(packet)])
+
+
+class FakeSerial:
+    """Minimal serial port stand-in that records written bytes"""
+    
+    def __init__(self):
+        self.is_open = True
+        self.timeout = 0.2
+        self.writes = []
+        self.responses = []
+    
+    def write(self, data):
+        self.writes.append(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    @property
+    def in_waiting(self):
+        return len(self.responses[0]) if self.responses else 0
+    
+    def read(self, size):
+        return self.responses.pop(0) if self.responses else b''
+    
+    def reset_input_buffer(self):
+        pass
+    
+    def close(self):
+        self.is_open = False
+
+
+class BusSerial(FakeSerial):
+    """Serial stand-in where motors answer each feedback request as it is written
+    
+    Replies arrive one frame at a time and stay queued until read or reset.
+    Motors in corrupt_once send a bad CRC on their first reply.
+    """
+    
+    def __init__(self, replies, corrupt_once=()):
+        super().__init__()
+        self.replies = replies
+        self.corrupt_once = set(corrupt_once)
+        self.rx = bytearray()
+    
+    def write(self, data):
+        motor_id = data[0]
+        if data[1] == CommandType.FEEDBACK_REQUEST and motor_id in self.replies:
+            reply = bytearray(self.replies[motor_id])
+            if motor_id in self.corrupt_once:
+                self.corrupt_once.discard(motor_id)
+                reply[9] ^= 0xFF
+            self.rx += reply
+        return super().write(data)
+    
+    @property
+    def in_waiting(self):
+        return min(10, len(self.rx))
+    
+    def read(self, size):
+        data = bytes(self.rx[:size])
+        del self.rx[:size]
+        return data
+    
+    def reset_input_buffer(self):
+        self.rx.clear()
+
+
+@pytest.fixture
+def motor():
+    """Create an unconnected DDSM115 instance"""
+    return DDSM115("/dev/null")
+
+
+@pytest.fixture
+def gap_marked(connected_motor, monkeypatch):
+    """Record sleeps between writes as GAP markers in the port's write log"""
+    writes = connected_motor.serial_port.writes
+    monkeypatch.setattr("ddsm115.time.sleep", lambda seconds: writes.append(("gap", seconds)))
+    return connected_motor
+
+
+@pytest.fixture
+def connected_motor(motor):
+    """Create a DDSM115 instance wired to a FakeSerial port"""
+    motor.serial_port = FakeSerial()
+    motor.is_connected = True
+    yield motor
+    motor.is_connected = False
+    motor.serial_port = None
+
+
+class TestCRC:
+    """Test CRC-8/MAXIM-DOW calculation"""
+    
+    @pytest.mark.unit
+    def test_check_value(self, motor):
+        """Test the standard CRC-8/MAXIM check value"""
+        assert motor.calculate_crc(b"123456789") == 0xA1
+    
+    @pytest.mark.unit
+    def test_matches_bitwise_reference(self, motor):
+        """Test table-driven CRC against the bit-loop reference for all byte values"""
+        for value in range(256):
+            packet = [1, 0x64, value, 255 - value, 0, 0, 0, 0, value]
+            assert motor.calculate_crc(packet) == reference_crc8(packet)
+    
+    @pytest.mark.unit
+    def test_crc8_update_single_byte(self, motor):
+        """Test the single-byte update shim stays compatible"""
+        assert motor.crc8_update(0x00, 0x31) == reference_crc8([0x31])
+
+
+class TestPackets:
+    """Test that command packets match the protocol framing"""
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method,command", [
+        ("brake", CommandType.BRAKE),
+        ("release_brake", CommandType.RELEASE_BRAKE),
+        ("enable", CommandType.ENABLE),
+        ("disable", CommandType.DISABLE),
+        ("calibrate_position", CommandType.POSITION_CALIBRATION),
+    ])
+    @pytest.mark.parametrize("motor_id", [1, 10, 42])
+    def test_static_commands(self, connected_motor, method, command, motor_id):
+        """Test data-less commands for IDs inside and outside the precomputed table"""
+        assert getattr(connected_motor, method)(motor_id) is True
+        assert connected_motor.serial_port.writes == [legacy_packet(motor_id, command)]
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("motor_id", [1, 42])
+    def test_set_mode_packet(self, connected_motor, motor_id):
+        """Test mode switch uses the 10-byte format with the mode in the last byte"""
+        assert connected_motor.set_mode(motor_id, MotorMode.POSITION) is True
+        assert connected_motor.serial_port.writes == [
+            bytes([motor_id, 0xA0, 0, 0, 0, 0, 0, 0, 0, 0x03])
+        ]
+    
+    @pytest.mark.unit
+    def test_safe_emergency_stop_sequence(self, gap_marked):
+        """Test emergency stop sends stop, velocity mode and zero velocity as separated frames"""
+        gap_marked._safe_emergency_stop(3)
+        assert gap_marked.serial_port.writes == [
+            legacy_packet(3, CommandType.EMERGENCY_STOP),
+            ("gap", INTER_FRAME_GAP),
+            legacy_packet(3, CommandType.MODE_SWITCH, [0, 0, 0, 0, 0, 0, 0x02]),
+            ("gap", INTER_FRAME_GAP),
+            legacy_packet(3, CommandType.DRIVE_MOTOR),
+        ]
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method,value,mode,data", [
+        ("set_velocity", -20, MotorMode.VELOCITY, [0xFF, 0xEC]),
+        ("set_current", 1.5, MotorMode.CURRENT, [0x00, 0x96]),
+        ("set_position", 180, MotorMode.POSITION, [0x3F, 0xFF]),
+    ])
+    def test_drive_switches_mode_once(self, gap_marked, method, value, mode, data):
+        """Test a needed mode switch is sent, separated from the drive packet, only once"""
+        drive = legacy_packet(5, CommandType.DRIVE_MOTOR, data)
+        mode_switch = bytes([5, 0xA0, 0, 0, 0, 0, 0, 0, 0, mode])
+        
+        assert getattr(gap_marked, method)(5, value) is True
+        assert getattr(gap_marked, method)(5, value) is True
+        assert gap_marked.serial_port.writes == [mode_switch, ("gap", INTER_FRAME_GAP), drive, drive]
+        assert gap_marked.current_mode[5] == mode
+    
+    @pytest.mark.unit
+    def test_set_current_without_mode_switch(self, connected_motor):
+        """Test auto_switch_mode=False sends only the drive packet and keeps the cached mode"""
+        assert connected_motor.set_current(5, -8.5, auto_switch_mode=False) is True
+        assert connected_motor.serial_port.writes == [
+            legacy_packet(5, CommandType.DRIVE_MOTOR, [0xFC, 0xE0])
+        ]
+        assert 5 not in connected_motor.current_mode
+    
+    @pytest.mark.unit
+    def test_emergency_stop_separated_frames(self, gap_marked):
+        """Test emergency stop sends stop, velocity mode and zero velocity with gaps between"""
+        assert gap_marked.emergency_stop(3) is True
+        assert gap_marked.serial_port.writes == [
+            legacy_packet(3, CommandType.EMERGENCY_STOP),
+            ("gap", INTER_FRAME_GAP),
+            bytes([3, 0xA0, 0, 0, 0, 0, 0, 0, 0, 0x02]),
+            ("gap", INTER_FRAME_GAP),
+            legacy_packet(3, CommandType.DRIVE_MOTOR),
+        ]
+        assert gap_marked.current_mode[3] == MotorMode.VELOCITY
+    
+    @pytest.mark.unit
+    def test_emergency_stop_all_broadcast(self, gap_marked):
+        """Test shutdown stops known motors first, then the rest of IDs 1-10, frames separated"""
+        port = gap_marked.serial_port
+        gap_marked.current_mode = {10: MotorMode.VELOCITY, 42: MotorMode.POSITION}
+        
+        gap_marked._emergency_stop_all()
+        
+        def sequence(motor_id):
+            return [
+                legacy_packet(motor_id, CommandType.EMERGENCY_STOP),
+                ("gap", INTER_FRAME_GAP),
+                legacy_packet(motor_id, CommandType.MODE_SWITCH, [0, 0, 0, 0, 0, 0, 0x02]),
+                ("gap", INTER_FRAME_GAP),
+                legacy_packet(motor_id, CommandType.DRIVE_MOTOR),
+            ]
+        
+        stop_order = (10, 42, *range(1, 10))
+        expected = [frame for motor_id in stop_order for frame in sequence(motor_id)]
+        assert port.writes[:-1] == expected
+        assert port.writes[-1] == ("gap", 0.1)
+        assert not port.is_open
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("data", [[], [0x12], [1, 2, 3, 4, 5, 6, 7], [1, 2, 3, 4, 5, 6, 7, 8, 9]])
+    def test_send_packet_framing(self, connected_motor, data):
+        """Test send_packet pads or truncates data to exactly 7 bytes"""
+        assert connected_motor.send_packet(2, CommandType.DRIVE_MOTOR, data) is True
+        assert connected_motor.serial_port.writes == [legacy_packet(2, CommandType.DRIVE_MOTOR, data)]
+        assert len(connected_motor._tx_buf) == 10
+
+
+class TestErrorReporting:
+    """Test filtering of non-critical communication errors"""
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("suppress,message,reported", [
+        (True, "device reports readiness to read but returned no data", False),
+        (True, "Write TIMEOUT", False),
+        (True, "Input/output error", True),
+        (False, "Write timeout", True),
+    ])
+    def test_report_comm_error(self, motor, suppress, message, reported):
+        """Test that only unknown errors are reported when suppression is on"""
+        errors = []
+        motor.on_error = errors.append
+        motor.suppress_comm_errors = suppress
+        motor._report_comm_error("Send", OSError(message))
+        assert errors == ([f"Send error: {message}"] if reported else [])
+
+
+class TestFeedback:
+    """Test the feedback request/response round trip"""
+    
+    @staticmethod
+    def reply(motor_id, torque=150, velocity=-20, temperature=31, position=128):
+        """Build a 0x74 feedback reply frame"""
+        body = [motor_id, 0x02, (torque >> 8) & 0xFF, torque & 0xFF,
+                (velocity >> 8) & 0xFF, velocity & 0xFF, temperature, position, 0x00]
+        return bytes(body + [reference_crc8(body)])
+    
+    @pytest.mark.unit
+    def test_request_feedback_parses_reply(self, connected_motor):
+        """Test a valid reply is parsed, stored and reported"""
+        received = []
+        connected_motor.on_feedback = lambda motor_id, fb: received.append((motor_id, fb))
+        connected_motor.serial_port.responses.append(self.reply(4))
+        
+        feedback = connected_motor.request_feedback(4)
+        
+        assert connected_motor.serial_port.writes == [legacy_packet(4, CommandType.FEEDBACK_REQUEST)]
+        assert feedback.torque == pytest.approx(1.5)
+        assert feedback.velocity == -20
+        assert feedback.temperature == 31
+        assert feedback.position == pytest.approx(128 / 255.0 * 360.0)
+        assert connected_motor.get_last_feedback(4) is feedback
+        assert received == [(4, feedback)]
+    
+    @pytest.mark.unit
+    def test_request_feedback_rejects_wrong_id(self, connected_motor):
+        """Test a reply from another motor is ignored"""
+        connected_motor.serial_port.responses.append(self.reply(5))
+        assert connected_motor.request_feedback(4) is None
+    
+    @pytest.mark.unit
+    def test_request_feedback_rejects_bad_crc(self, connected_motor):
+        """Test a corrupted reply is ignored"""
+        frame = bytearray(self.reply(4))
+        frame[9] ^= 0xFF
+        connected_motor.serial_port.responses.append(bytes(frame))
+        assert connected_motor.request_feedback(4) is None
+    
+    @pytest.mark.unit
+    def test_verify_crc_disabled(self, connected_motor):
+        """Test verify_crc=False accepts a bad CRC but still checks the motor ID"""
+        connected_motor.verify_crc = False
+        bad_crc = self.reply(4)[:9] + b"\x00"
+        connected_motor.serial_port.responses.extend([bad_crc, bad_crc])
+        
+        assert connected_motor.request_feedback(4) is not None
+        assert connected_motor.read_response(expected_id=5) is None
+    
+    @pytest.mark.unit
+    def test_read_response_checks(self, connected_motor):
+        """Test read_response rejects short frames, wrong IDs and bad CRCs"""
+        good = self.reply(4)
+        connected_motor.serial_port.responses.extend(
+            [good[:9], good, good[:9] + bytes([good[9] ^ 0xFF]), good])
+        
+        assert connected_motor.read_response(expected_id=4) is None
+        assert connected_motor.read_response(expected_id=5) is None
+        assert connected_motor.read_response(expected_id=4) is None
+        assert connected_motor.read_response() == good
+    
+    @pytest.mark.unit
+    def test_request_feedback_no_reply(self, connected_motor):
+        """Test a missing reply returns None"""
+        assert connected_motor.request_feedback(4) is None
+    
+    @pytest.mark.unit
+    def test_scan_motors_fast_pipelines_requests(self, connected_motor):
+        """Test all requests go out first and batched replies are matched by ID"""
+        connected_motor.serial_port.responses.append(self.reply(2) + self.reply(5))
+        
+        found = connected_motor.scan_motors_fast(1, 6, frame_gap=0, timeout=0.01)
+        
+        assert found == [2, 5]
+        assert connected_motor.serial_port.writes == [
+            legacy_packet(motor_id, CommandType.FEEDBACK_REQUEST) for motor_id in range(1, 7)
+        ]
+        assert connected_motor.get_last_feedback(5).velocity == -20
+    
+    @pytest.mark.unit
+    def test_scan_motors_fast_falls_back_on_framing_error(self, connected_motor, monkeypatch):
+        """Test a garbled reply stream falls back to the sequential scan"""
+        connected_motor.serial_port.responses.append(b"\x00" + self.reply(2))
+        monkeypatch.setattr(connected_motor, "scan_motors", lambda start, end: ["sequential"])
+        
+        assert connected_motor.scan_motors_fast(1, 3, frame_gap=0, timeout=0.01) == ["sequential"]
+    
+    @pytest.mark.unit
+    def test_scan_motors_fast_fallback_drops_stale_replies(self, connected_motor, monkeypatch):
+        """Test replies left over from a garbled fast scan don't shift the sequential scan"""
+        monkeypatch.setattr("ddsm115.time.sleep", lambda seconds: None)
+        connected_motor.serial_port = BusSerial({1: self.reply(1), 2: self.reply(2), 3: self.reply(3)},
+                                                corrupt_once={2})
+        
+        assert connected_motor.scan_motors_fast(1, 3, frame_gap=0, timeout=0.01) == [1, 2, 3]
+    
+    @pytest.mark.unit
+    def test_monitor_loop_polls_without_fixed_delay(self, connected_motor, monkeypatch):
+        """Test one monitor cycle polls every motor and only sleeps until the next cycle"""
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            connected_motor._monitoring_active = False
+        
+        class RunInline:
+            """Stand-in thread that runs the loop on start()"""
+            def __init__(self, target, daemon):
+                self.start = target
+        
+        monkeypatch.setattr("ddsm115.time.sleep", fake_sleep)
+        monkeypatch.setattr("ddsm115.threading.Thread", RunInline)
+        connected_motor.serial_port.responses.extend([self.reply(1), self.reply(2)])
+        
+        connected_motor.start_monitoring([1, 2], interval=0.05)
+        connected_motor._monitoring_thread = None
+        
+        assert connected_motor._monitored_motors == (1, 2)
+        assert connected_motor.serial_port.writes == [
+            legacy_packet(1, CommandType.FEEDBACK_REQUEST),
+            legacy_packet(2, CommandType.FEEDBACK_REQUEST),
+        ]
+        assert set(connected_motor.last_feedback) == {1, 2}
+        assert len(sleeps) == 1 and 0 < sleeps[0] <= 0.05
+    
+    @pytest.mark.unit
+    def test_feedback_history_ring_wraps(self, motor):
+        """Test the history keeps the newest entries, oldest first, once the ring wraps"""
+        pytest.importorskip("numpy")
+        motor._feedback_history_limit = 4
+        for i in range(6):
+            motor._record_feedback(1, MotorFeedback(position=float(i), velocity=-i,
+                                                    temperature=30 + i, timestamp=i))
+        
+        rows = motor.get_feedback_array(1)
+        assert rows["position"].tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert rows["timestamp"].tolist() == [2, 3, 4, 5]
+        
+        history = motor.get_feedback_history(1)
+        assert [fb.velocity for fb in history] == [-2, -3, -4, -5]
+        assert history[-1].temperature == 35
+        
+        motor.clear_feedback_history(1)
+        assert motor.get_feedback_history(1) == []
+        assert motor.get_feedback_array(1) is None
+    
+    @pytest.mark.unit
+    def test_parse_standard_response(self, motor):
+        """Test the standard layout reads a 15-bit position from bytes 6-7"""
+        motor._last_command = CommandType.DRIVE_MOTOR
+        body = [1, 0x03, 0xFF, 0x9C, 0x00, 0x0A, 0x40, 0x00, 0x00]
+        feedback = motor.parse_feedback(bytes(body + [reference_crc8(body)]))
+        assert feedback.torque == pytest.approx(-1.0)
+        assert feedback.velocity == 10
+        assert feedback.position == pytest.approx(0x4000 / 32767.0 * 360.0)
+        assert feedback.temperature == 0
+
+
+class TestMotorFeedback:
+    """Test the MotorFeedback record"""
+    
+    @pytest.mark.unit
+    def test_defaults_and_mutation(self):
+        """Test defaults match the protocol's idle values and fields stay writable"""
+        feedback = MotorFeedback()
+        assert (feedback.position, feedback.velocity, feedback.torque) == (0.0, 0.0, 0.0)
+        assert feedback.timestamp == 0
+        assert feedback.temperature == 0 and feedback.raw_data == b''
+        feedback.velocity = 12.5
+        assert feedback.velocity == 12.5
+    
+    @pytest.mark.unit
+    def test_no_instance_dict(self):
+        """Test that unknown attributes are rejected (slots, no __dict__)"""
+        with pytest.raises(AttributeError):
+            MotorFeedback().unknown = 1
+    
+    @pytest.mark.unit
+    def test_equality(self):
+        """Test value equality like the dataclass it replaced"""
+        assert MotorFeedback(position=1.0) == MotorFeedback(position=1.0)
+        assert MotorFeedback(position=1.0) != MotorFeedback(position=2.0)
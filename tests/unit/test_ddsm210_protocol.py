@@ -0,0 +1,58 @@
+"""
+Unit tests for DDSM210 protocol encoding
+Tests velocity framing and parsing without requiring hardware
+"""
+
+import pytest
+
+from ddsm210 import DDSM210
+
+
+def legacy_velocity_command(motor, rpm):
+    """Build a velocity command with the original shift-and-mask encoding"""
+    velocity_units = int(rpm * 10) & 0xFFFF
+    cmd = [0x01, 0x64, (velocity_units >> 8) & 0xFF, velocity_units & 0xFF, 0, 0, 0, 0, 0]
+    return bytes(cmd + [motor._calculate_crc(cmd)])
+
+
+class RecordingDDSM210(DDSM210):
+    """DDSM210 that records raw commands instead of touching a port"""
+
+    def __init__(self):
+        super().__init__()
+        self.is_connected = True
+        self._motor_initialized = True
+        self.current_mode[self.motor_id] = 0x02
+        self.sent = []
+
+    def _send_raw_command(self, command):
+        self.sent.append(bytes(command))
+        return None
+
+
+class TestVelocityFrame:
+    """Test DDSM210 velocity command and response framing"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("rpm", [-210, -12.5, -0.1, 0, 0.1, 99.9, 210])
+    def test_velocity_command_matches_legacy(self, rpm):
+        """Test struct packing produces the same bytes as the original encoding"""
+        motor = RecordingDDSM210()
+        try:
+            assert motor.set_velocity(motor.motor_id, rpm) is True
+            assert motor.sent == [legacy_velocity_command(motor, rpm)]
+        finally:
+            motor.is_connected = False
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("raw,rpm", [
+        (b'\x00\x00', 0.0), (b'\x04\x1a', 105.0), (b'\xfb\xe6', -105.0), (b'\xff\xff', -0.1),
+    ])
+    def test_parse_velocity_response(self, raw, rpm):
+        """Test the signed 0.1 RPM field is decoded from bytes 2-3"""
+        motor = RecordingDDSM210()
+        try:
+            response = b'\x01\x64' + raw + bytes(6)
+            assert motor._parse_feedback(response).velocity == pytest.approx(rpm)
+        finally:
+            motor.is_connected = False
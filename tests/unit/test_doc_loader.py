@@ -0,0 +1,56 @@
+"""
+Unit tests for the documentation loader
+Tests document lookup and loading without requiring a display
+"""
+
+import pytest
+
+from doc_loader import DocumentationLoader
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    """Create a temporary docs directory with a single markdown file"""
+    (tmp_path / "system_info.md").write_text("# Title\n\n- item\n", encoding="utf-8")
+    return tmp_path
+
+
+class TestDocumentationLoader:
+    """Test document path resolution and loading"""
+    
+    @pytest.mark.unit
+    def test_path_for_known_document(self, docs_dir):
+        """Test that known documents resolve to a path in the docs directory"""
+        loader = DocumentationLoader(str(docs_dir))
+        assert loader.path_for("system_info") == docs_dir / "system_info.md"
+    
+    @pytest.mark.unit
+    def test_path_for_unknown_document(self, docs_dir):
+        """Test that unknown documents resolve to None"""
+        loader = DocumentationLoader(str(docs_dir))
+        assert loader.path_for("does_not_exist") is None
+    
+    @pytest.mark.unit
+    def test_load_document_processes_markdown(self, docs_dir):
+        """Test that loaded markdown is converted for Text widget display"""
+        loader = DocumentationLoader(str(docs_dir))
+        content = loader.load_document("system_info")
+        assert content.startswith("█ Title")
+        assert "  • item" in content
+    
+    @pytest.mark.unit
+    def test_load_document_normalizes_newlines(self, tmp_path):
+        """Test that CRLF line endings are read the same as LF"""
+        (tmp_path / "system_info.md").write_bytes(b"# Title\r\n\r\n- item\r\n")
+        loader = DocumentationLoader(str(tmp_path))
+        content = loader.load_document("system_info")
+        assert "\r" not in content
+        assert content == "█ Title\n\n  • item"
+    
+    @pytest.mark.unit
+    def test_heading_levels(self, tmp_path):
+        """Test each supported heading level gets its marker and deeper levels are left alone"""
+        (tmp_path / "system_info.md").write_text("# One\n## Two\n### Three\n#### Four\n", encoding="utf-8")
+        loader = DocumentationLoader(str(tmp_path))
+        content = loader.load_document("system_info")
+        assert content.split("\n") == ["█ One", "◆ Two", "▪ Three", "#### Four"]
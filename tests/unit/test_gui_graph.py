@@ -0,0 +1,111 @@
+"""
+Unit tests for GUI graph redraws
+Tests line updates on a plain Figure without creating any Tk windows
+"""
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+if not ddsm115_gui.MATPLOTLIB_AVAILABLE:
+    pytest.skip("matplotlib/numpy not available", allow_module_level=True)
+
+from matplotlib.figure import Figure
+
+from ddsm115_gui import PlotBuffer, SimpleDDSM115GUI
+
+
+class FakeVar:
+    """BooleanVar stand-in"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class FakeCanvas:
+    """Counts draw requests"""
+
+    def __init__(self):
+        self.draws = 0
+
+    def draw_idle(self):
+        self.draws += 1
+
+
+class FakeGUI:
+    """Graph state as left by setup_matplotlib_graph, minus the Tk canvas"""
+
+    def __init__(self):
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot()
+        self.ax2 = self.ax.twinx()
+        self.velocity_line, = self.ax.plot([], [])
+        self.position_line, = self.ax.plot([], [])
+        self.torque_line, = self.ax2.plot([], [])
+        self.ax.margins(y=0.1)
+        self.ax2.margins(y=0.1)
+        self._no_data_text = self.ax.text(0.5, 0.5, 'No data received', visible=False)
+        self._last_line_config = None
+        self.canvas = FakeCanvas()
+        self._graph_ready = True
+        self.plot_data = PlotBuffer(10)
+        self.show_velocity_var = FakeVar(True)
+        self.show_position_var = FakeVar(True)
+        self.show_torque_var = FakeVar(True)
+
+
+class TestUpdateGraph:
+    """Test update_graph reuses the artists made at setup"""
+
+    @pytest.mark.unit
+    def test_no_data_shows_message(self):
+        """Test an empty buffer shows the no-data text and keeps the lines"""
+        gui = FakeGUI()
+        assert SimpleDDSM115GUI.update_graph(gui, None) == []
+        assert gui._no_data_text.get_visible()
+        assert list(gui.ax.lines) == [gui.velocity_line, gui.position_line]
+
+    @pytest.mark.unit
+    def test_data_updates_existing_lines(self):
+        """Test samples are set on the original lines and the Y axes rescale"""
+        gui = FakeGUI()
+        SimpleDDSM115GUI.update_graph(gui, None)
+        gui.plot_data.push(0.0, 10.0, 1.0, 90.0)
+        gui.plot_data.push(1.0, 20.0, 2.0, 180.0)
+
+        lines = SimpleDDSM115GUI.update_graph(gui, None)
+
+        assert lines == [gui.velocity_line, gui.position_line, gui.torque_line]
+        assert list(gui.ax.lines) == [gui.velocity_line, gui.position_line]
+        assert not gui._no_data_text.get_visible()
+        assert gui.velocity_line.get_ydata().tolist() == [10.0, 20.0]
+        low, high = gui.ax.get_ylim()
+        assert low < 10.0 and high > 180.0
+        assert gui.canvas.draws == 2
+
+    @pytest.mark.unit
+    def test_toggle_hides_line_and_rescales(self):
+        """Test a hidden series is excluded from its axis limits"""
+        gui = FakeGUI()
+        gui.plot_data.push(0.0, 10.0, 1.0, 90.0)
+        gui.plot_data.push(1.0, 20.0, 2.0, 180.0)
+        gui.show_position_var.value = False
+
+        lines = SimpleDDSM115GUI.update_graph(gui, None)
+
+        assert gui.position_line not in lines
+        assert not gui.position_line.get_visible()
+        assert gui.ax.get_ylim()[1] < 90.0
+
+    @pytest.mark.unit
+    def test_not_ready_skips_update(self):
+        """Test nothing is drawn before setup_matplotlib_graph has finished"""
+        gui = FakeGUI()
+        gui._graph_ready = False
+        gui.plot_data.push(0.0, 10.0, 1.0, 90.0)
+
+        assert SimpleDDSM115GUI.update_graph(gui, None) == []
+        assert gui.canvas.draws == 0
@@ -0,0 +1,52 @@
+"""
+Unit tests for the GUI graph sample buffer
+Tests ring ordering without creating any Tk windows
+"""
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+if not ddsm115_gui.MATPLOTLIB_AVAILABLE:
+    pytest.skip("matplotlib/numpy not available", allow_module_level=True)
+
+from ddsm115_gui import PlotBuffer
+
+
+class TestPlotBuffer:
+    """Test the fixed-size graph ring buffer"""
+
+    @pytest.mark.unit
+    def test_partial_fill(self):
+        """Test samples come back in order before the ring is full"""
+        buffer = PlotBuffer(4)
+        buffer.push(0.0, 10.0, 0.5, 90.0)
+        buffer.push(0.1, 20.0, 0.6, 91.0)
+
+        times, velocities, torques, positions = buffer.arrays()
+        assert len(buffer) == 2
+        assert times.tolist() == pytest.approx([0.0, 0.1])
+        assert velocities.tolist() == [10.0, 20.0]
+        assert torques.tolist() == pytest.approx([0.5, 0.6])
+        assert positions.tolist() == [90.0, 91.0]
+
+    @pytest.mark.unit
+    def test_wraps_oldest_first(self):
+        """Test the oldest samples are overwritten and output stays chronological"""
+        buffer = PlotBuffer(3)
+        for i in range(5):
+            buffer.push(i, i * 2, i * 3, i * 4)
+
+        times, velocities, _, _ = buffer.arrays()
+        assert len(buffer) == 3
+        assert times.tolist() == [2.0, 3.0, 4.0]
+        assert velocities.tolist() == [4.0, 6.0, 8.0]
+
+    @pytest.mark.unit
+    def test_clear(self):
+        """Test clear empties the buffer"""
+        buffer = PlotBuffer(3)
+        buffer.push(1, 2, 3, 4)
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.arrays().shape == (4, 0)
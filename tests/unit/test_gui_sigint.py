@@ -0,0 +1,69 @@
+"""
+Unit tests for GUI Ctrl+C handling
+Tests the signal flag and Tk-side poll without creating any Tk windows
+"""
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+from ddsm115_gui import SimpleDDSM115GUI, SIGINT_POLL_MS
+
+
+class FakeGUI:
+    """Stand-in recording what the SIGINT poll schedules and shuts down"""
+
+    def __init__(self):
+        self._shutdown_in_progress = False
+        self.motor_controller = None
+        self.scheduled = []
+        self.shutdowns = 0
+
+    def schedule_callback(self, delay_ms, callback):
+        self.scheduled.append((delay_ms, callback))
+
+    def _poll_sigint(self):
+        SimpleDDSM115GUI._poll_sigint(self)
+
+    def _emergency_shutdown(self):
+        self.shutdowns += 1
+
+
+@pytest.fixture(autouse=True)
+def clear_sigint_flag():
+    ddsm115_gui._sigint_flag.clear()
+    yield
+    ddsm115_gui._sigint_flag.clear()
+
+
+class TestSigintPoll:
+    """Test Ctrl+C is deferred from the signal handler to the Tk thread"""
+
+    @pytest.mark.unit
+    def test_poll_rearms_until_signalled(self):
+        """Test the poll reschedules itself and does nothing without a signal"""
+        gui = FakeGUI()
+        SimpleDDSM115GUI._poll_sigint(gui)
+
+        assert [delay for delay, _ in gui.scheduled] == [SIGINT_POLL_MS]
+        assert gui.shutdowns == 0
+
+    @pytest.mark.unit
+    def test_handler_only_sets_flag(self):
+        """Test the signal handler defers shutdown to the next poll"""
+        gui = FakeGUI()
+        SimpleDDSM115GUI._handle_sigint(gui, 2, None)
+        assert gui.shutdowns == 0
+
+        SimpleDDSM115GUI._poll_sigint(gui)
+        assert gui.shutdowns == 1
+        assert gui._shutdown_in_progress is True
+        assert gui.scheduled == []
+
+    @pytest.mark.unit
+    def test_second_sigint_forces_exit(self):
+        """Test Ctrl+C while a shutdown is pending exits immediately"""
+        gui = FakeGUI()
+        SimpleDDSM115GUI._handle_sigint(gui, 2, None)
+        with pytest.raises(SystemExit):
+            SimpleDDSM115GUI._handle_sigint(gui, 2, None)
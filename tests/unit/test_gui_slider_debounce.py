@@ -0,0 +1,228 @@
+"""
+Unit tests for throttled slider sends
+Tests the after-id throttling without creating any Tk windows
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+from ddsm115_gui import SimpleDDSM115GUI, SLIDER_SEND_MS
+
+
+class FakeScheduler:
+    """Stand-in for the GUI's callback bookkeeping"""
+
+    def __init__(self):
+        self._pending_send = {'velocity': None, 'position': None, 'current': None}
+        self._updating_position_from_feedback = False
+        self.scheduled = []
+        self.cancelled = []
+        self._send_slider_velocity = lambda: None
+        self._send_slider_position = lambda: None
+
+    def schedule_callback(self, delay_ms, callback):
+        self.scheduled.append((delay_ms, callback))
+        return f"after#{len(self.scheduled)}"
+
+    def cancel_callback(self, callback_id):
+        self.cancelled.append(callback_id)
+
+
+class TestSliderDebounce:
+    """Test slider writes are throttled to one send per window"""
+
+    @pytest.mark.unit
+    def test_one_send_per_window(self):
+        """Test continuous writes keep the pending send, then schedule the next window"""
+        gui = FakeScheduler()
+        for _ in range(5):
+            SimpleDDSM115GUI._throttled_send(gui, 'velocity')
+
+        assert [delay for delay, _ in gui.scheduled] == [SLIDER_SEND_MS]
+        assert gui.scheduled[0][1] is gui._send_slider_velocity
+        assert gui.cancelled == []
+
+        gui._pending_send['velocity'] = None  # the sender ran
+        for _ in range(5):
+            SimpleDDSM115GUI._throttled_send(gui, 'velocity')
+
+        assert len(gui.scheduled) == 2
+        assert gui._pending_send['velocity'] == "after#2"
+
+    @pytest.mark.unit
+    def test_feedback_position_update_not_sent(self):
+        """Test position writes from feedback never schedule a command"""
+        gui = FakeScheduler()
+        gui._updating_position_from_feedback = True
+        SimpleDDSM115GUI._throttled_send(gui, 'position')
+
+        assert gui.scheduled == []
+        assert gui._pending_send['position'] is None
+
+    @pytest.mark.unit
+    def test_send_now_replaces_pending_send(self):
+        """Test an immediate send cancels the pending throttled one"""
+        gui = FakeScheduler()
+        sent = []
+        gui._send_slider_velocity = lambda: sent.append('velocity')
+        SimpleDDSM115GUI._throttled_send(gui, 'velocity')
+        SimpleDDSM115GUI._send_slider_now(gui, 'velocity')
+
+        assert gui.cancelled == ["after#1"]
+        assert gui._pending_send['velocity'] is None
+        assert sent == ['velocity']
+
+
+class FakeWidget:
+    """Generic widget stand-in recording its options and bindings"""
+
+    def __init__(self, *args, **kwargs):
+        self.options = kwargs
+        self.bindings = {}
+
+    def pack(self, **kwargs):
+        pass
+
+    def bind(self, sequence, handler):
+        self.bindings[sequence] = handler
+
+    def get(self):
+        return str(self.options['textvariable'].get())
+
+
+class FakeVar:
+    """Tk variable stand-in; writes run any write traces like Tk does"""
+
+    def __init__(self, value):
+        self.value = value
+        self.traces = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in self.traces:
+            callback()
+
+    def trace_add(self, mode, callback):
+        self.traces.append(callback)
+
+
+class FakeControlGUI:
+    """Records which controls were scheduled or sent immediately"""
+
+    def __init__(self):
+        self.throttled = []
+        self.sent_now = []
+
+    def _throttled_send(self, kind):
+        self.throttled.append(kind)
+
+    def _send_slider_now(self, kind):
+        self.sent_now.append(kind)
+
+
+@pytest.fixture
+def slider(monkeypatch):
+    """Build one slider against recording widget stand-ins"""
+    for name in ("LabelFrame", "Label", "Frame", "Scale", "Entry"):
+        monkeypatch.setattr(ddsm115_gui.ttk, name, FakeWidget)
+    monkeypatch.setattr(ddsm115_gui.tk, "Frame", FakeWidget)
+    gui = FakeControlGUI()
+    variable = FakeVar(0.0)
+    _, scale, entry = SimpleDDSM115GUI._build_slider(
+        gui, None, 'position', "Position", "°", '#9f3a3a', 0, 360, variable, None)
+    return gui, variable, scale, entry
+
+
+class TestSliderEntry:
+    """Test only slider moves stream; typed values wait for the edit to be committed"""
+
+    @pytest.mark.unit
+    def test_entry_keystrokes_do_not_send(self, slider):
+        """Test typing 2, 27, 270 into the entry commands nothing"""
+        gui, variable, _, _ = slider
+        for value in (2, 27, 270):
+            variable.set(value)
+
+        assert gui.throttled == [] and gui.sent_now == []
+
+    @pytest.mark.unit
+    def test_scale_move_is_throttled(self, slider):
+        """Test the scale command schedules a throttled send"""
+        gui, _, scale, _ = slider
+        scale.options['command']("90.0")
+
+        assert gui.throttled == ['position']
+
+    @pytest.mark.unit
+    def test_return_sends(self, slider):
+        """Test Return sends the typed value once, and leaving afterwards does not resend"""
+        gui, variable, _, entry = slider
+        entry.bindings["<FocusIn>"](None)
+        variable.value = 270
+        entry.bindings["<Return>"](None)
+        entry.bindings["<FocusOut>"](None)
+
+        assert gui.sent_now == ['position']
+
+    @pytest.mark.unit
+    def test_focus_out_after_edit_sends(self, slider):
+        """Test leaving the entry after changing its text sends the value"""
+        gui, variable, _, entry = slider
+        entry.bindings["<FocusIn>"](None)
+        variable.value = 270
+        entry.bindings["<FocusOut>"](None)
+
+        assert gui.sent_now == ['position']
+
+    @pytest.mark.unit
+    def test_focus_out_without_edit_sends_nothing(self, slider):
+        """Test clicking into the entry and away again commands nothing"""
+        gui, variable, _, entry = slider
+        variable.value = 100  # e.g. the value left over from before an E-STOP
+        entry.bindings["<FocusIn>"](None)
+        entry.bindings["<FocusOut>"](None)
+
+        assert gui.sent_now == []
+
+
+class FakeStopGUI(FakeScheduler):
+    """E-stop state: pending sends, drive variables and a recording controller"""
+
+    def __init__(self):
+        super().__init__()
+        self.velocity_var = FakeVar(100)
+        self.current_var = FakeVar(2.5)
+        self.motor_id_var = FakeVar(1)
+        self.motor_controller = SimpleNamespace(
+            is_connected=True, stopped=[],
+            stop=lambda motor_id: self.motor_controller.stopped.append(motor_id))
+        self.logged = []
+
+    def _reset_drive_controls(self):
+        SimpleDDSM115GUI._reset_drive_controls(self)
+
+    def log_message(self, message):
+        self.logged.append(message)
+
+
+class TestEmergencyStopControls:
+    """Test an E-STOP leaves nothing that could restart the motor"""
+
+    @pytest.mark.unit
+    def test_emergency_stop_zeroes_controls(self):
+        """Test pending sends are cancelled and velocity/current reset to zero"""
+        gui = FakeStopGUI()
+        gui._pending_send['velocity'] = "after#1"
+
+        SimpleDDSM115GUI.emergency_stop(gui)
+
+        assert gui.cancelled.count("after#1") == 1
+        assert all(callback_id is None for callback_id in gui._pending_send.values())
+        assert gui.velocity_var.get() == 0 and gui.current_var.get() == 0.0
+        assert gui.motor_controller.stopped == [1]
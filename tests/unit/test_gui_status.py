@@ -0,0 +1,89 @@
+"""
+Unit tests for GUI status label updates
+Tests the cached raw Tcl configure path without creating any Tk windows
+"""
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+from ddsm115_gui import SimpleDDSM115GUI
+
+
+class FakeLabel:
+    """Widget stand-in exposing only its Tcl path name"""
+
+    def __init__(self, path):
+        self._w = path
+
+
+class FakeGUI:
+    """Records the Tcl commands issued for status updates"""
+
+    def __init__(self):
+        self._last_status = {}
+        self.calls = []
+        self._tk_call = lambda *args: self.calls.append(args)
+
+
+class TestSetStatus:
+    """Test status labels are configured through one Tcl call"""
+
+    @pytest.mark.unit
+    def test_configure_text_and_colors(self):
+        """Test text and color options are passed as Tcl options"""
+        gui = FakeGUI()
+        label = FakeLabel('.status.temp')
+        SimpleDDSM115GUI._set_status(gui, label, "42°C", foreground="red")
+
+        assert gui.calls == [('.status.temp', 'configure', '-text', "42°C", '-foreground', "red")]
+
+    @pytest.mark.unit
+    def test_unchanged_status_skipped(self):
+        """Test repeating the same text and colors issues no Tcl call"""
+        gui = FakeGUI()
+        label = FakeLabel('.status.velocity')
+        SimpleDDSM115GUI._set_status(gui, label, "10.0 RPM")
+        SimpleDDSM115GUI._set_status(gui, label, "10.0 RPM")
+        SimpleDDSM115GUI._set_status(gui, label, "12.0 RPM")
+
+        assert [call[3] for call in gui.calls] == ["10.0 RPM", "12.0 RPM"]
+
+
+class FakeStatusBarGUI(FakeGUI):
+    """Status bar state with no controller and nothing sent or received yet"""
+
+    def __init__(self):
+        super().__init__()
+        self.status_update_active = True
+        self._shutdown_in_progress = False
+        self.motor_controller = None
+        self.last_rate_calc_ns = 0
+        self.last_rx_time_ns = 0
+        self.last_tx_time_ns = 0
+        self.rx_count = 0
+        self.tx_count = 0
+        self.status_rx_rate = FakeLabel('.status.rxrate')
+        self.status_tx_rate = FakeLabel('.status.txrate')
+        self.rescheduled = 0
+
+    def _set_status(self, label, text, **colors):
+        SimpleDDSM115GUI._set_status(self, label, text, **colors)
+
+    def schedule_status_update(self):
+        self.rescheduled += 1
+
+
+class TestStatusBar:
+    """Test the periodic status bar update only reconfigures changed labels"""
+
+    @pytest.mark.unit
+    def test_unchanged_rates_skipped(self):
+        """Test identical message rates are configured once"""
+        gui = FakeStatusBarGUI()
+        SimpleDDSM115GUI.update_status_bar(gui)
+        gui.last_rate_calc_ns = 0  # force the next rate window
+        SimpleDDSM115GUI.update_status_bar(gui)
+
+        assert [call[3] for call in gui.calls] == ["↓ 0 msg/s", "↑ 0 msg/s"]
+        assert gui.rescheduled == 2
@@ -0,0 +1,47 @@
+"""
+Unit tests for the text graph fallback
+Tests line appends and trimming without creating any Tk windows
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+from ddsm115_gui import SimpleDDSM115GUI, TEXT_GRAPH_MAX_LINES
+
+
+class FakeText:
+    """Records Text widget operations"""
+
+    def __init__(self):
+        self.calls = []
+
+    def insert(self, index, text):
+        self.calls.append(('insert', index, text))
+
+    def delete(self, start, end):
+        self.calls.append(('delete', start, end))
+
+    def see(self, index):
+        self.calls.append(('see', index))
+
+
+class TestAppendTextGraph:
+    """Test feedback is appended and trimmed rather than rewritten"""
+
+    @pytest.mark.unit
+    def test_append_and_trim(self):
+        """Test one insert at the end followed by a trim of the oldest lines"""
+        gui = SimpleNamespace(graph_display=FakeText(), start_time_ns=time.monotonic_ns())
+        feedback = SimpleNamespace(velocity=12.5, position=90.0, torque=0.25)
+
+        SimpleDDSM115GUI._append_text_graph(gui, feedback)
+
+        (op, index, text), trim, see = gui.graph_display.calls
+        assert (op, index) == ('insert', 'end')
+        assert text.endswith("12.5 RPM     90.0°    0.25 A\n")
+        assert trim == ('delete', '1.0', f'end-{TEXT_GRAPH_MAX_LINES + 1}l')
+        assert see == ('see', 'end')
@@ -0,0 +1,34 @@
+"""
+Unit tests for GUI entry validation
+Tests the keystroke validators without creating any Tk windows
+"""
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+from ddsm115_gui import SimpleDDSM115GUI
+
+
+class TestEntryValidation:
+    """Test numeric entry validators"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("value,allowed", [
+        ("", True), ("-", True), ("0", True), ("143", True), ("-20", True),
+        ("--5", False), ("1.5", False), ("12a", False), ("5-", False), ("²", False),
+    ])
+    def test_validate_integer(self, value, allowed):
+        """Test integer entry accepts partial and complete signed integers only"""
+        assert SimpleDDSM115GUI.validate_integer(None, value) is allowed
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("value,allowed", [
+        ("", True), ("-", True), (".", True), ("5", True), ("5.", True),
+        (".5", True), ("-.5", True), ("-180.5", True),
+        ("1.25", False), ("1.2.3", False), ("1..", False), ("-.", False),
+        ("--1", False), ("1e5", False), ("nan", False),
+    ])
+    def test_validate_decimal(self, value, allowed):
+        """Test decimal entry allows at most one decimal place"""
+        assert SimpleDDSM115GUI.validate_decimal(None, value) is allowed
@@ -0,0 +1,107 @@
+"""
+Unit tests for custom title bar window dragging
+Tests motion coalescing without creating any Tk windows
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+ddsm115_gui = pytest.importorskip("ddsm115_gui")
+
+from ddsm115_gui import SimpleDDSM115GUI, DRAG_FLUSH_MS
+
+
+class FakeRoot:
+    """Root window stand-in at a fixed position recording geometry changes"""
+
+    _w = '.'
+
+    def __init__(self):
+        self.geometries = []
+
+    def winfo_x(self):
+        return 100
+
+    def winfo_y(self):
+        return 50
+
+
+class FakeWidget:
+    """Records event bindings"""
+
+    def __init__(self):
+        self.bindings = {}
+
+    def bind(self, sequence, handler):
+        self.bindings[sequence] = handler
+
+    def fire(self, sequence, x, y):
+        self.bindings[sequence](SimpleNamespace(x=x, y=y))
+
+
+class FakeGUI:
+    """Stand-in recording scheduled and cancelled callbacks"""
+
+    def __init__(self):
+        self.root = FakeRoot()
+        self.scheduled = {}
+        self.cancelled = []
+
+    def schedule_callback(self, delay_ms, callback):
+        callback_id = f"after#{len(self.scheduled)}"
+        self.scheduled[callback_id] = (delay_ms, callback)
+        return callback_id
+
+    def cancel_callback(self, callback_id):
+        self.cancelled.append(callback_id)
+
+    def _tk_call(self, *args):
+        assert args[:3] == ('wm', 'geometry', '.')
+        self.root.geometries.append(args[3])
+
+    def _flush_drag(self, widget):
+        SimpleDDSM115GUI._flush_drag(self, widget)
+
+
+@pytest.fixture
+def dragging():
+    gui = FakeGUI()
+    widget = FakeWidget()
+    SimpleDDSM115GUI.make_draggable(gui, widget)
+    widget.fire("<Button-1>", 10, 10)
+    return gui, widget
+
+
+class TestWindowDrag:
+    """Test drag motion is coalesced into one move per frame"""
+
+    @pytest.mark.unit
+    def test_motion_coalesced_to_latest(self, dragging):
+        """Test several motion events schedule one flush that applies the last one"""
+        gui, widget = dragging
+        for x in (12, 15, 30):
+            widget.fire("<B1-Motion>", x, 20)
+
+        assert gui.root.geometries == []
+        assert [delay for delay, _ in gui.scheduled.values()] == [DRAG_FLUSH_MS]
+
+        _, flush = gui.scheduled["after#0"]
+        flush()
+        assert gui.root.geometries == ["+120+60"]
+
+        widget.fire("<B1-Motion>", 31, 20)
+        assert len(gui.scheduled) == 2
+
+    @pytest.mark.unit
+    def test_release_flushes_immediately(self, dragging):
+        """Test releasing the button cancels the pending flush and moves now"""
+        gui, widget = dragging
+        widget.fire("<B1-Motion>", 40, 10)
+        widget.fire("<ButtonRelease-1>", 40, 10)
+
+        assert gui.cancelled == ["after#0"]
+        assert gui.root.geometries == ["+130+50"]
+
+        widget.fire("<ButtonRelease-1>", 40, 10)
+        assert gui.root.geometries == ["+130+50"]
@@ -0,0 +1,45 @@
+"""
+Unit tests for MotorCommandQueue command dispatch
+Tests the worker wake-up path with a mock motor
+"""
+
+import threading
+import time
+
+import pytest
+
+from motor_command_queue import CommandType
+
+
+class TestCommandWorker:
+    """Test the command worker sleeps on, and wakes from, command_ready"""
+
+    @pytest.mark.unit
+    def test_queue_command_signals_worker(self, mock_motor_command_queue):
+        """Test queuing a command sets command_ready and keeps latest-wins"""
+        queue = mock_motor_command_queue
+        queue.set_velocity(1, 10)
+        queue.set_velocity(1, 20)
+
+        assert queue.command_ready.is_set()
+        assert queue.latest_commands[(1, CommandType.SET_VELOCITY)].value == 20
+        assert queue.commands_dropped == 1
+
+    @pytest.mark.unit
+    def test_idle_worker_wakes_and_stops(self, mock_motor_command_queue):
+        """Test an idle worker runs a new command and exits when woken on shutdown"""
+        queue = mock_motor_command_queue
+        done = threading.Event()
+        queue.running = True
+        worker = threading.Thread(target=queue._command_worker, daemon=True)
+        worker.start()
+        try:
+            time.sleep(0.05)  # let the worker go idle
+            queue.set_velocity(1, 50, callback=lambda ok: done.set())
+            assert done.wait(1.0)
+            queue.motor.set_velocity.assert_called_with(1, 50)
+        finally:
+            queue.running = False
+            queue.command_ready.set()
+            worker.join(1.0)
+        assert not worker.is_alive()